@@ -0,0 +1,322 @@
+"""Benchmark of the interpolator over a matrix of algorithms, backends, data shapes and sizes
+
+the results are saved as JSON, and they can be compared to the results of an older run to find regressions:
+
+    python benchmark.py --output results.json
+    python benchmark.py --baseline results.json
+
+the points are loaded with add_many in each of the given orders, the Leja order keeps the c values (and their bit
+lengths, which are reported for the "fraction" backend) smaller:
+
+    python benchmark.py --orders insertion leja --shapes data --backends fraction
+
+the exact evaluation of many values using the subproduct tree is compared to the Newton form separately, for n
+points and n evenly spaced values of each size, or m values of each of the given counts (these are slow, so only
+run when they are given):
+
+    python benchmark.py --multipoint 500 1000 2000 --shapes random --sizes
+    python benchmark.py --multipoint 640 1000 --multipoint-values 128 256 512 --shapes random --sizes
+
+all the random data uses fixed seeds, so the runs are comparable.
+"""
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+from fractions import Fraction
+from glob import glob
+from math import cos, pi
+from random import Random
+from time import perf_counter
+
+from lib.interpolate import Interpolator
+from lib.reader import PointsReader
+
+SHAPES = ["random", "chebyshev", "data", ]
+SIZES = [25, 50, 100, 200, ]
+
+SEED = 2020
+# the number of values for the single and batch compute latencies
+COMPUTE_COUNT = 20
+BATCH_COUNT = 200
+
+# metric: True if higher is better
+METRICS = {
+    'add_throughput': True,
+    'compute_latency': False,
+    'batch_latency': False,
+    'str_time': False,
+    'peak_memory': False,
+}
+
+
+def random_points(n, rng):
+    """n random rational points with different x values"""
+    xs = set()
+    while len(xs) < n:
+        xs.add(Fraction(rng.randint(-200, 200), rng.randint(1, 20)))
+
+    xs = sorted(xs)
+    rng.shuffle(xs)
+    return xs, [Fraction(rng.randint(-2000, 2000), rng.randint(1, 20)) for _ in xs]
+
+
+def chebyshev_points(n):
+    """n Chebyshev nodes (as close small fractions) of the Runge function 1 / (1 + 25x^2)"""
+    xs = sorted({Fraction(cos((2 * k + 1) * pi / (2 * n))).limit_denominator(10 ** 6) for k in range(n)})
+    return xs, [1 / (1 + 25 * x * x) for x in xs]
+
+
+def file_points(filename):
+    """the points of a data file, without the duplicate x values"""
+    xs, ys, seen = [], [], set()
+    for x, y in PointsReader(filename):
+        if x not in seen:
+            seen.add(x)
+            xs.append(x)
+            ys.append(y)
+    return xs, ys
+
+
+def datasets(shapes, sizes):
+    """the data of the benchmark
+
+    :return: generator of (shape, name, xs, ys), the name is the size or the file name for the "data" shape
+    :rtype: Iterator[Tuple[str, str, list, list]]
+    """
+    for shape in shapes:
+        if shape == SHAPES[2]:
+            for filename in sorted(glob('data*.txt')):
+                xs, ys = file_points(filename)
+                yield shape, filename, xs, ys
+            continue
+
+        for n in sizes:
+            if shape == SHAPES[0]:
+                xs, ys = random_points(n, Random(SEED + n))
+            else:
+                xs, ys = chebyshev_points(n)
+            yield shape, str(n), xs, ys
+
+
+def best_time(function, repeat):
+    """the smallest time of running the function *repeat* times, which is the least affected by other processes
+
+    :rtype: float
+    """
+    res = None
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        elapsed = perf_counter() - start
+        res = elapsed if res is None else min(res, elapsed)
+    return res
+
+
+def build(algorithm, backend, xs, ys, order=Interpolator.ORDERS[0]):
+    interpolator = Interpolator(algorithm, backend)
+    interpolator.add_many(xs, ys, order)
+    return interpolator
+
+
+def run_case(algorithm, backend, order, xs, ys, queries, repeat):
+    """measure the metrics of one interpolator
+
+    :param queries: the x values for compute, the first *COMPUTE_COUNT* of them are used for the single latency
+    :type queries: List[Fraction]
+    :return: {metric: value}, and the largest bit lengths of the numerators and denominators of the c values for
+             the "fraction" backend
+    :rtype: dict
+    """
+    add_time = best_time(lambda: build(algorithm, backend, xs, ys, order), repeat)
+
+    # the memory is measured in a separate build, as tracing slows it down
+    tracemalloc.start()
+    interpolator = build(algorithm, backend, xs, ys, order)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    single = queries[:COMPUTE_COUNT]
+
+    def compute_single():
+        for x in single:
+            interpolator.compute(x)
+
+    res = {
+        'add_throughput': len(xs) / add_time,
+        'compute_latency': best_time(compute_single, repeat) / len(single),
+        'batch_latency': best_time(lambda: interpolator.compute_many(queries), repeat) / len(queries),
+        'str_time': best_time(lambda: str(interpolator), repeat),
+        'peak_memory': peak_memory,
+    }
+
+    stats = interpolator.stats()
+    if 'c_numerator_bits' in stats:
+        res['c_numerator_bits'] = stats['c_numerator_bits']
+        res['c_denominator_bits'] = stats['c_denominator_bits']
+
+    return res
+
+
+def run(algorithms, backends, orders, shapes, sizes, repeat):
+    """run the full matrix of the benchmark
+
+    :return: list of results, each has the case keys (shape, size, algorithm, backend, order) and the metrics
+    :rtype: List[dict]
+    """
+    rng = Random(SEED)
+    queries = [Fraction(rng.randint(-1000, 1000), rng.randint(1, 1000)) for _ in range(BATCH_COUNT)]
+
+    results = []
+    for shape, size, xs, ys in datasets(shapes, sizes):
+        for algorithm in algorithms:
+            for backend in backends:
+                for order in orders:
+                    print(f'{shape:>10} {size:>14} {algorithm:>12} {backend:>8} {order:>9} ... ', end='', flush=True,
+                          file=sys.stderr)
+                    metrics = run_case(algorithm, backend, order, xs, ys, queries, repeat)
+                    bits = ''
+                    if 'c_numerator_bits' in metrics:
+                        bits = f', c bits {metrics["c_numerator_bits"]}/{metrics["c_denominator_bits"]}'
+                    print(f'{metrics["add_throughput"]:.0f} points/s, {metrics["batch_latency"] * 1e6:.1f} us/value'
+                          f'{bits}', file=sys.stderr)
+
+                    results.append({'shape': shape, 'size': size, 'algorithm': algorithm, 'backend': backend,
+                                    'order': order, **metrics})
+
+    return results
+
+
+def with_multipoint_size(min_size, function):
+    """call the function with *Interpolator.MULTIPOINT_MIN_SIZE* changed, to choose how compute_many_exact works"""
+    old_min_size, old_min_batch = Interpolator.MULTIPOINT_MIN_SIZE, Interpolator.MULTIPOINT_MIN_BATCH
+    Interpolator.MULTIPOINT_MIN_SIZE, Interpolator.MULTIPOINT_MIN_BATCH = min_size, 0
+    try:
+        return function()
+    finally:
+        Interpolator.MULTIPOINT_MIN_SIZE, Interpolator.MULTIPOINT_MIN_BATCH = old_min_size, old_min_batch
+
+
+def run_multipoint(sizes, values_counts, repeat):
+    """compare *Interpolator.compute_many_exact* using the subproduct tree with the Newton form, which it uses
+    below its thresholds, for n points and m values
+
+    :param sizes: the numbers of points n
+    :type sizes: List[int]
+    :param values_counts: the numbers of values m for each n, or empty for m = n
+    :type values_counts: List[int]
+    :return: list of {'size', 'values', 'tree_time', 'newton_time'}
+    :rtype: List[dict]
+    """
+    results = []
+    for n in sizes:
+        rng = Random(SEED + n)
+        xs = [Fraction(x, 20) for x in rng.sample(range(-20 * n, 20 * n), n)]
+        ys = [Fraction(rng.randint(-100, 100), rng.randint(1, 9)) for _ in xs]
+
+        interpolator = build(Interpolator.MODES[0], Interpolator.BACKENDS[0], xs, ys)
+
+        for m in values_counts or [n]:
+            queries = [Fraction(-n) + Fraction(2 * n * i, max(m - 1, 1)) for i in range(m)]
+
+            print(f'multipoint {n:>8} points {m:>8} values ... ', end='', flush=True, file=sys.stderr)
+            tree_time = with_multipoint_size(
+                0, lambda: best_time(lambda: interpolator.compute_many_exact(queries), repeat))
+            newton_time = with_multipoint_size(
+                n + 1, lambda: best_time(lambda: interpolator.compute_many_exact(queries), repeat))
+            print(f'tree {tree_time:.3f}s, newton {newton_time:.3f}s', file=sys.stderr)
+
+            results.append({'size': n, 'values': m, 'tree_time': tree_time, 'newton_time': newton_time})
+
+    return results
+
+
+def case_key(result):
+    # the results before the orders were added are all in insertion order
+    return result['shape'], result['size'], result['algorithm'], result['backend'], \
+        result.get('order', Interpolator.ORDERS[0])
+
+
+def compare(results, baseline, threshold):
+    """find the metrics which are worse than the baseline by more than *threshold* (relative)
+
+    :return: list of (case key, metric, baseline value, new value)
+    :rtype: List[Tuple[tuple, str, float, float]]
+    """
+    old_results = {case_key(result): result for result in baseline['results']}
+
+    regressions = []
+    for result in results:
+        old_result = old_results.get(case_key(result))
+        if old_result is None:
+            continue
+
+        for metric, higher_is_better in METRICS.items():
+            old, new = old_result[metric], result[metric]
+            if higher_is_better:
+                old, new = new, old
+            # now lower is better for both
+            if new > old * (1 + threshold):
+                regressions.append((case_key(result), metric, old_result[metric], result[metric]))
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--algorithms', nargs='+', default=Interpolator.MODES, choices=Interpolator.MODES)
+    parser.add_argument('--backends', nargs='+', default=Interpolator.BACKENDS, choices=Interpolator.BACKENDS)
+    parser.add_argument('--orders', nargs='+', default=Interpolator.ORDERS[:1], choices=Interpolator.ORDERS,
+                        help='the orders of loading the points with add_many (default: insertion)')
+    parser.add_argument('--shapes', nargs='+', default=SHAPES, choices=SHAPES)
+    parser.add_argument('--sizes', nargs='*', type=int, default=SIZES)
+    parser.add_argument('--multipoint', nargs='+', type=int, default=[],
+                        help='the sizes to compare the exact evaluation of many values using the subproduct tree')
+    parser.add_argument('--multipoint-values', nargs='+', type=int, default=[],
+                        help='the numbers of values for each --multipoint size (default: the same as the size)')
+    parser.add_argument('--repeat', type=int, default=3, help='the number of runs of each measurement')
+    parser.add_argument('--output', help='the JSON file to save the results to')
+    parser.add_argument('--baseline', help='the JSON results of an older run to compare with')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='the relative change of a metric to be reported as a regression (default: 0.2)')
+    args = parser.parse_args()
+
+    # the exact results can be too long for the default limit of int to str conversion
+    if hasattr(sys, 'set_int_max_str_digits'):
+        sys.set_int_max_str_digits(0)
+
+    output = {
+        'config': {
+            'seed': SEED,
+            'repeat': args.repeat,
+            'compute_count': COMPUTE_COUNT,
+            'batch_count': BATCH_COUNT,
+            'python': platform.python_version(),
+        },
+        'results': run(args.algorithms, args.backends, args.orders, args.shapes, args.sizes, args.repeat),
+    }
+    if args.multipoint:
+        output['multipoint'] = run_multipoint(args.multipoint, args.multipoint_values, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(output, f, indent=2)
+    else:
+        print(json.dumps(output, indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(output['results'], json.load(f), args.threshold)
+
+        for key, metric, old, new in regressions:
+            print(f'[REGRESSION] {" ".join(key)} {metric}: {old:.6g} -> {new:.6g}', file=sys.stderr)
+        print(f'{len(regressions)} regressions found', file=sys.stderr)
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,12 +1,19 @@
+import argparse
+import json
+import sys
 from fractions import Fraction
 from decimal import getcontext, Decimal
-from math import ceil, floor
+from math import ceil, floor, isfinite
 from re import sub as re_sub
 from subprocess import call as call_system_cmd
 from time import process_time_ns as time
 
-from lib.colors import color_format, color_print, supports_color
+from lib.colors import ColorWriter, color_format, color_print, supports_color
+from lib.instrument import Instrumentation
 from lib.interpolate import Interpolator
+from lib.multiseries import MultiSeriesInterpolator
+from lib.reader import PointsReader
+from lib.snapshot import load_state, save_state
 
 try:
     import readline
@@ -18,9 +25,18 @@ except ImportError:
 
 decimal_context = getcontext()
 
+# the exact values (and the files of savefile and print nested) can be too long for the default limit of int to
+# str conversion
+if hasattr(sys, 'set_int_max_str_digits'):
+    sys.set_int_max_str_digits(0)
+
 
 def fraction_to_decimal(x):
-    assert isinstance(x, Fraction), "x argument must be of type Fraction"
+    assert isinstance(x, (Fraction, float, Decimal)), "x argument must be of type Fraction, float or Decimal"
+
+    # the "float64" and "decimal" backend results, the unary plus applies the context precision
+    if isinstance(x, (float, Decimal)):
+        return +Decimal(x)
 
     # there is no direct conversion from Fraction to Decimal
     return Decimal(x.numerator) / Decimal(x.denominator)
@@ -29,26 +45,65 @@ def fraction_to_decimal(x):
 class InterpolatorCommandHandler:
     # some constant value to know if the main should stop its loop
     BREAK = 129
+    # "time" records the calls and time of the handlers, "operations" also counts the Fraction operations (slower)
+    INSTRUMENTATION_LEVELS = ["off", "time", "operations", ]
+
+    # the image formats of the plot command
+    PLOT_FORMATS = ["png", "svg", ]
+
+    # the templates of the lines which are printed many times, see *lib/colors::ColorWriter*
+    POINT_TEMPLATE = '#LIGHTBLUE#(#GREEN#{}#LIGHTBLUE#, #GREEN#{}%#LIGHTBLUE#)%'
+
+    def __init__(self, quiet=False):
+        """
+        :param quiet: used for scripts, the colors are off and the points added by many add commands are printed
+                      as one summary (see *flush_added*)
+        :type quiet: bool
+        """
+        self.quiet = quiet
+        # the number of points added but not printed yet in quiet mode
+        self.pending_added = 0
+        # the number of errors reported by the commands, used for the exit status of scripts
+        self.errors = 0
 
-    def __init__(self):
         # command_name : (command_function, command_help_message)
         self.commands_map = {
             'help': (self.cmd_help, "Print this help message"),
             'add': (self.cmd_add, "(add [x0] [y0]...[xn] [yn]) Add multiple points"),
-            'addfile': (self.cmd_add_file, "(addfile <filename>) Add points stored in the file, a pair in each line"),
+            'addfile': (self.cmd_add_file,
+                        "(addfile <filename> [series]) Add points stored in the file, a pair in each line, or x and many y values for many series (see `series`) if `series` is given or the file has a header with many y columns"),
+            'remove': (self.cmd_remove, "(remove [x0]...[xn]) Remove the points with these x values"),
+            'set': (self.cmd_set, "(set <x> <y>) Change the y value of the point with this x value"),
             'savefile': (
                 self.cmd_save_file,
                 "(savefile <filename>) Save the current points stored in the interpolator to a file"),
+            'savestate': (
+                self.cmd_save_state,
+                "(savestate <filename>) Save the full state of the interpolator to a binary file, to be loaded fast"),
+            'loadstate': (
+                self.cmd_load_state,
+                "(loadstate <filename>) Replace the current interpolator with the one saved by savestate"),
             'points': (self.cmd_print_points, "Print the data points used in the current interpolation"),
-            'print': (self.cmd_print, "Print the interpolation function"),
+            'print': (self.cmd_print,
+                      "(print [expanded | nested [filename]]) Print the interpolation function, `expanded` prints it in the power basis, `nested` prints it in the nested form which is shorter for many points, or saves it to the file"),
             'compute': (self.cmd_compute, "Input value x into the interpolation function"),
+            'series': (self.cmd_series,
+                       "(series [x0]...[xn]) Compute all the series added from a file with many y columns at these x values"),
+            'plot': (self.cmd_plot,
+                     "(plot <filename> [first x] [last x]) Draw the points and the interpolation function to an image file (png or svg)"),
+            'tabulate': (self.cmd_tabulate,
+                         "(tabulate <first x> <last x> <count> [filename]) Compute count evenly spaced values of x, and print them or save them to a file"),
             'comploc': (self.cmd_compute_location,
                         "(compute_location) Get the value of x at a relative location to the other points and compute its value from the interpolation"),
             'ans': (self.cmd_print_ans, "Print the value of `ans` which is the last computed value"),
             'approx': (self.cmd_approx,
                        "Print the value of `ans` in decimal form (float) or compute a new value if specified as argument"),
+            'error': (self.cmd_error,
+                      "(error [x0]...[xn]) Estimate the rounding error of the backend at these x values (by default between the points), compared with the exact fraction backend"),
             'config': (self.cmd_set_config,
                        "Set the value of one of the configuration, (key=value), to see the current config type `config` without parameters"),
+            'stats': (self.cmd_stats,
+                      "(stats [json [filename]]) Print statistics about the current interpolation, like the compute cache hits and the instrumentation records"),
             'clear': (self.cmd_clear, "Clear the current interpolation"),
             'exit': (self.cmd_exit, "Exit from this program"),
         }
@@ -76,27 +131,148 @@ class InterpolatorCommandHandler:
         def __set_precision(x):
             try:
                 x = int(x)
+                # the "decimal" backend computes with this precision, the points are added again with it
+                if 'interpolator' in dir(self) and self.interpolator.backend == Interpolator.BACKENDS[2]:
+                    if not self.__rebuild_interpolator(precision=x):
+                        return self.config['precision'][1]
                 # apply the precision in the decimal context
                 decimal_context.prec = x
                 return x
             except ValueError:
-                self.__print("#RED#[ERROR]% the value of precision must be an integer.")
+                self.__print("#RED#[ERROR]% the value of precision must be a positive integer.")
                 # TODO: change this to not depend on 'precision', now this is for fallback if
                 # an error occurred.
                 return self.config['precision'][1]
 
+        def __set_guard_digits(x):
+            try:
+                x = int(x)
+                if self.interpolator.backend == Interpolator.BACKENDS[2]:
+                    if not self.__rebuild_interpolator(guard_digits=x):
+                        return self.config['guard-digits'][1]
+                elif x < 0:
+                    raise ValueError
+                return x
+            except ValueError:
+                self.__print("#RED#[ERROR]% the value of guard-digits must be a non negative integer.")
+                return self.config['guard-digits'][1]
+
+        def __set_backend(x):
+            if x not in Interpolator.BACKENDS:
+                self.__print(f"#RED#[ERROR]% the value of backend must be one of #GREEN#{Interpolator.BACKENDS}%")
+                return self.config['backend'][1]
+
+            if not self.__rebuild_interpolator(backend=x):
+                return self.config['backend'][1]
+            return x
+
+        def __set_algorithm(x):
+            if x not in Interpolator.MODES:
+                self.__print(f"#RED#[ERROR]% the value of algorithm must be one of #GREEN#{Interpolator.MODES}%")
+                return self.config['algorithm'][1]
+
+            if not self.__rebuild_interpolator(algorithm=x):
+                return self.config['algorithm'][1]
+            return x
+
+        def __set_piecewise_degree(x):
+            try:
+                x = int(x)
+                if not self.__rebuild_interpolator(piecewise_degree=x):
+                    return self.config['piecewise-degree'][1]
+                return x
+            except ValueError:
+                self.__print("#RED#[ERROR]% the value of piecewise-degree must be a positive integer.")
+                return self.config['piecewise-degree'][1]
+
+        def __set_spline_boundary(x):
+            try:
+                if not self.__rebuild_interpolator(spline_slopes=self.__parse_spline_boundary(x)):
+                    return self.config['spline-boundary'][1]
+                return x
+            except (ValueError, ZeroDivisionError):
+                self.__print("#RED#[ERROR]% the value of spline-boundary must be #GREEN#natural% or the two end "
+                             "slopes of a clamped spline, ex. #GREEN#0,1/2%.")
+                return self.config['spline-boundary'][1]
+
+        def __set_workers(x):
+            try:
+                x = int(x)
+                if x < 1:
+                    raise ValueError
+                return x
+            except ValueError:
+                self.__print("#RED#[ERROR]% the value of workers must be a positive integer.")
+                return self.config['workers'][1]
+
+        def __set_instrumentation(x):
+            if x not in InterpolatorCommandHandler.INSTRUMENTATION_LEVELS:
+                self.__print(f"#RED#[ERROR]% the value of instrumentation must be one of "
+                             f"#GREEN#{InterpolatorCommandHandler.INSTRUMENTATION_LEVELS}%")
+                return self.config['instrumentation'][1]
+
+            self.interpolator.set_instrumentation(self.__new_instrumentation(x))
+            return x
+
+        def __set_order(x):
+            if x not in Interpolator.ORDERS:
+                self.__print(f"#RED#[ERROR]% the value of order must be one of #GREEN#{Interpolator.ORDERS}%")
+                return self.config['order'][1]
+            return x
+
+        def __set_engine(x):
+            if x not in Interpolator.ENGINES:
+                self.__print(f"#RED#[ERROR]% the value of engine must be one of #GREEN#{Interpolator.ENGINES}%")
+                return self.config['engine'][1]
+            return x
+
+        def __set_cache_size(x):
+            try:
+                x = int(x)
+                self.interpolator.set_cache_size(x)
+                return x
+            except ValueError:
+                self.__print("#RED#[ERROR]% the value of cache-size must be a non negative integer.")
+                return self.config['cache-size'][1]
+
         # config_name: [config_setter_handler, config_current_data]
         self.config = {
             # not the best way to know if the value is false or not, but mah.
             'show-time': [__set_boolean_helper, False],
             # __set_show_colors is called from here to handle if the system does not support coloring
             # from the beginning
-            'show-colors': [__set_show_colors, __set_show_colors('True')],
+            'show-colors': [__set_show_colors, False if quiet else __set_show_colors('True')],
             'prompt': [__set_prompt, '>>>'],
             'precision': [__set_precision, __set_precision(6)],
+            # the extra digits of the "decimal" backend, which computes with precision + guard-digits digits
+            'guard-digits': [__set_guard_digits, 8],
+            'backend': [__set_backend, Interpolator.BACKENDS[0]],
+            'algorithm': [__set_algorithm, Interpolator.MODES[0]],
+            # the degree of the local polynomials of the "piecewise" algorithm
+            'piecewise-degree': [__set_piecewise_degree, 3],
+            # "natural" or the end slopes of a clamped "spline" algorithm
+            'spline-boundary': [__set_spline_boundary, 'natural'],
+            # the number of compute results to remember, 0 disables it
+            'cache-size': [__set_cache_size, 0],
+            # the order of adding the points of addfile and add with many points
+            'order': [__set_order, Interpolator.ORDERS[0]],
+            # the arithmetic of the exact c values of addfile and add with many points
+            'engine': [__set_engine, Interpolator.ENGINES[0]],
+            # the number of processes used by tabulate for the exact computation, and by the modular engine
+            'workers': [__set_workers, 1],
+            # record the time (and the Fraction operations) of the interpolator handlers, shown by stats
+            'instrumentation': [__set_instrumentation, 'off'],
         }
 
-        self.interpolator = Interpolator()
+        self.interpolator = self.__new_interpolator()
+        # {x in the interpolator: (x, y)} of the points as they were given, the "float64" and "decimal" backends
+        # round them, so the interpolator is rebuilt from these (see *__rebuild_interpolator*)
+        self.__exact_points = {}
+        # the x of the last approx when the float filter gave its digits without the exact result, which is only
+        # computed when ans is needed or before the points change (see *__resolve_ans*)
+        self.__pending_ans = None
+        # the series of the files with many y columns, see *__add_series*
+        self.series_interpolator = None
 
     def get_matched_commands(self, text):
         return [c for c in self.commands_map.keys() if c.startswith(text)]
@@ -125,18 +301,127 @@ class InterpolatorCommandHandler:
         # this format_string is to set an indentation for the commands and their help message,
         # which depend on __max_length_cmd
         format_string = '#MAGENTA#{:' + str(self.__max_length_cmd) + '}\t%#GREEN#{}%'
-        self.__print('\n'.join([format_string.format(k, v[1]) for k, v in self.commands_map.items()]))
+        with self.__writer() as writer:
+            for k, v in self.commands_map.items():
+                writer.write_line(format_string, k, v[1])
 
     def __add_point(self, *args):
         try:
             x, y = map(lambda x: Fraction(x.strip()), args[:2])
+        except (ValueError, ZeroDivisionError):
+            self.__print('#RED#[ERROR]% the input for #GREEN#add% is not correct')
+            return
+
+        self.__resolve_ans()
+        try:
             self.interpolator.add(x, y)
-            self.__print(f'$#LIGHTBLUE#[*]% added #GREEN#({x}, {y})%')
+            self.__exact_points[self.interpolator.number_type(x)] = (x, y)
+            if self.quiet:
+                self.pending_added += 1
+            else:
+                self.__print(f'$#LIGHTBLUE#[*]% added #GREEN#({x}, {y})%')
         except ArithmeticError:
             self.__print(f'#RED#[ERROR]% the value of #GREEN#x = {x}% already exists')
         except ValueError:
             self.__print('#RED#[ERROR]% the input for #GREEN#add% is not correct')
 
+    def __add_points(self, xs, ys, malformed=()):
+        """Add many points at once using *Interpolator.add_many* and print a summary of them
+
+        :param xs: points x
+        :type xs: List[Fraction]
+        :param ys: points y
+        :type ys: List[Fraction]
+        :param malformed: the inputs that could not be read as points
+        :type malformed: List[str]
+        """
+        self.__resolve_ans()
+        new_xs, new_ys = [], []
+        duplicates = []
+        seen = set(self.interpolator.x_data)
+
+        for x, y in zip(xs, ys):
+            if self.interpolator.number_type(x) in seen:
+                duplicates.append(str(x))
+                continue
+
+            seen.add(self.interpolator.number_type(x))
+            new_xs.append(x)
+            new_ys.append(y)
+
+        self.interpolator.add_many(new_xs, new_ys, self.config['order'][1], self.config['engine'][1],
+                                   self.config['workers'][1])
+        for x, y in zip(new_xs, new_ys):
+            self.__exact_points[self.interpolator.number_type(x)] = (x, y)
+
+        # the lists of the ignored points can be long, so they are written as values, without searching them for colors
+        with self.__writer() as writer:
+            writer.write_line('$#LIGHTBLUE#[*]% added #GREEN#{}% points', len(new_xs))
+            if duplicates:
+                self.errors += 1
+                writer.write_line(
+                    '#RED#[ERROR]% ignored #GREEN#{}% points as their #GREEN#x% values already exist: #GREEN#{}%',
+                    len(duplicates), ', '.join(duplicates))
+            if malformed:
+                self.errors += 1
+                writer.write_line('#RED#[ERROR]% ignored #GREEN#{}% malformed points: #GREEN#{}%',
+                                  len(malformed), ', '.join(malformed))
+
+    def __add_series(self, xs, ys_rows, malformed=()):
+        """Add many points with a y value for each series to the multi-series interpolator and print a summary
+
+        :param xs: points x
+        :type xs: List[Fraction]
+        :param ys_rows: the y values of the series for each point
+        :type ys_rows: List[List[Fraction]]
+        :param malformed: the inputs that could not be read as points
+        :type malformed: List[str]
+        """
+        series = len(ys_rows[0]) if ys_rows else 0
+        if not series:
+            self.__print('#RED#[ERROR]% there are no points to add')
+            return
+
+        if self.series_interpolator is None:
+            backend = self.config['backend'][1]
+            if backend not in MultiSeriesInterpolator.BACKENDS:
+                self.__print(f"#RED#[ERROR]% the series can only use one of the backends "
+                             f"#GREEN#{MultiSeriesInterpolator.BACKENDS}%")
+                return
+            self.series_interpolator = MultiSeriesInterpolator(series, backend)
+        elif self.series_interpolator.series != series:
+            self.__print(f"#RED#[ERROR]% the file has #GREEN#{series}% series, but there are "
+                         f"#GREEN#{self.series_interpolator.series}% series already, use #MAGENTA#clear% first")
+            return
+
+        new_xs, new_ys_rows = [], []
+        duplicates = []
+        seen = set(self.series_interpolator.x_data)
+        number_type = self.series_interpolator.number_type
+
+        for x, ys in zip(xs, ys_rows):
+            if number_type(x) in seen:
+                duplicates.append(str(x))
+                continue
+
+            seen.add(number_type(x))
+            new_xs.append(x)
+            new_ys_rows.append(ys)
+
+        self.series_interpolator.add_many(new_xs, new_ys_rows)
+
+        with self.__writer() as writer:
+            writer.write_line('$#LIGHTBLUE#[*]% added #GREEN#{}% points of #GREEN#{}% series', len(new_xs), series)
+            if duplicates:
+                self.errors += 1
+                writer.write_line(
+                    '#RED#[ERROR]% ignored #GREEN#{}% points as their #GREEN#x% values already exist: #GREEN#{}%',
+                    len(duplicates), ', '.join(duplicates))
+            if malformed:
+                self.errors += 1
+                writer.write_line('#RED#[ERROR]% ignored #GREEN#{}% malformed points: #GREEN#{}%',
+                                  len(malformed), ', '.join(malformed))
+
     def cmd_add(self, *args):
         args_len = len(args)
         # if its odd, then ignore the last number
@@ -144,33 +429,44 @@ class InterpolatorCommandHandler:
             args_len -= 1
             self.__print(f'#YELLOW#[WARN]% ignoring value #GREEN#x = {args[-1]}% as there is no #GREEN#y% value to it')
 
-        for i in range(args_len // 2):
-            self.__add_point(args[i * 2], args[(i * 2) + 1])
+        if args_len == 2:
+            self.__add_point(*args[:2])
+        elif args_len:
+            xs, ys, malformed = [], [], []
+            for i in range(args_len // 2):
+                try:
+                    x, y = map(lambda x: Fraction(x.strip()), args[i * 2:(i * 2) + 2])
+                    xs.append(x)
+                    ys.append(y)
+                except (ValueError, ZeroDivisionError):
+                    malformed.append(f'({args[i * 2]}, {args[(i * 2) + 1]})')
+
+            self.__add_points(xs, ys, malformed)
 
     def cmd_add_file(self, *args):
         if len(args) < 1:
             self.__print("#RED#[ERROR]% please provide #MAGENTA#file% to be read from.")
         else:
             filename = args[0]
+            if len(args) > 1 and args[1] != 'series':
+                self.__print(f"#RED#[ERROR]% unknown option #GREEN#{args[1]}%, only #GREEN#series% can be used")
+                return
+
             try:
-                with open(filename, 'r') as f:
-                    for line in f:
-                        stripped_line = line.strip()
-                        if stripped_line:
-                            line_splitted = stripped_line.split()
-                            if len(line_splitted) < 2:
-                                # FIXME: make the code better.
-                                # use commas if we can't use spaces
-                                line_splitted = stripped_line.split(',')
-
-                                if len(line_splitted) < 2:
-                                    self.__print(
-                                        f'#YELLOW#[WARN]% ignoring value #GREEN#x = {line_splitted[0]}% as there is no #GREEN#y% value to it')
-                                else:
-                                    self.__add_point(*line_splitted[:2])
-
-                            else:
-                                self.__add_point(*line_splitted[:2])
+                # the y columns are read as series only if they are asked for, or named in the header of the file,
+                # otherwise the first y value of each line is used
+                reader = PointsReader(filename, multi_column=True if len(args) > 1 else None)
+
+                xs, ys = [], []
+                for x, y in reader:
+                    xs.append(x)
+                    ys.append(y)
+
+                malformed = [f'(line {number}: {line})' for number, line in reader.malformed]
+                if reader.is_multi_column:
+                    self.__add_series(xs, ys, malformed)
+                else:
+                    self.__add_points(xs, ys, malformed)
             except PermissionError:
                 self.__print(
                     f"#RED#[ERROR]% The file #GREEN#{filename}% could not be read due to insufficient permissions that the current user have.")
@@ -182,6 +478,44 @@ class InterpolatorCommandHandler:
                 # TODO: remove this general exception and handle all file exceptions
                 self.__print(f"#RED#$[PANIC]% unknown error occurred in #MAGENTA#addfile% command, please fix.")
 
+    def cmd_remove(self, *args):
+        if len(args) < 1:
+            self.__print("#RED#[ERROR]% please provide the #GREEN#x% value of the point to be removed.")
+
+        for arg in args:
+            try:
+                x = Fraction(arg.strip())
+            except (ValueError, ZeroDivisionError):
+                self.__print('#RED#[ERROR]% the input for #GREEN#remove% is not correct')
+                continue
+
+            self.__resolve_ans()
+            try:
+                self.interpolator.remove(x)
+                self.__exact_points.pop(self.interpolator.number_type(x), None)
+                self.__print(f'$#LIGHTBLUE#[*]% removed #GREEN#x = {x}%')
+            except ValueError:
+                self.__print(f'#RED#[ERROR]% the value of #GREEN#x = {x}% does not exist')
+
+    def cmd_set(self, *args):
+        if len(args) < 2:
+            self.__print("#RED#[ERROR]% please provide #GREEN#x% and the new #GREEN#y% value of the point.")
+        else:
+            try:
+                x, y = map(lambda x: Fraction(x.strip()), args[:2])
+            except (ValueError, ZeroDivisionError):
+                self.__print('#RED#[ERROR]% the input for #GREEN#set% is not correct')
+                return
+
+            self.__resolve_ans()
+            try:
+                self.interpolator.update(x, y)
+                key = self.interpolator.number_type(x)
+                self.__exact_points[key] = (self.__exact_points.get(key, (x, y))[0], y)
+                self.__print(f'$#LIGHTBLUE#[*]% updated #GREEN#({x}, {y})%')
+            except ValueError:
+                self.__print(f'#RED#[ERROR]% the value of #GREEN#x = {x}% does not exist')
+
     def cmd_save_file(self, *args):
         if len(args) < 1:
             self.__print("#RED#[ERROR]% please provide #MAGENTA#file% to be saved to.")
@@ -205,10 +539,69 @@ class InterpolatorCommandHandler:
             else:
                 self.__print('#YELLOW#[WARN]% No data points, nothing to save...')
 
+    def cmd_save_state(self, *args):
+        if len(args) < 1:
+            self.__print("#RED#[ERROR]% please provide #MAGENTA#file% to be saved to.")
+        else:
+            filename = args[0]
+            try:
+                save_state(self.interpolator, filename)
+                self.__print(f'$#LIGHTBLUE#[*]% state saved to #MAGENTA#{filename}% successfully')
+            except PermissionError:
+                self.__print(
+                    f"#RED#[ERROR]% The file #GREEN#{filename}% could not be written to due to insufficient permissions that the current user have.")
+            except IsADirectoryError:
+                self.__print(f"#RED#[ERROR]% #GREEN#{filename}% is a folder/directory, please specify a file.")
+            except:
+                # TODO: remove this general exception and handle all file exceptions
+                self.__print(f"#RED#$[PANIC]% unknown error occurred in #MAGENTA#savestate% command, please fix.")
+
+    def cmd_load_state(self, *args):
+        if len(args) < 1:
+            self.__print("#RED#[ERROR]% please provide #MAGENTA#file% to be read from.")
+        else:
+            filename = args[0]
+            try:
+                interpolator = load_state(filename, self.config['cache-size'][1])
+                interpolator.set_instrumentation(self.__new_instrumentation(self.config['instrumentation'][1]))
+                self.interpolator = interpolator
+                # the snapshot only has the values of its backend
+                self.__exact_points = {}
+                self.config['backend'][1] = interpolator.backend
+                self.config['algorithm'][1] = interpolator.algorithm
+                if interpolator.backend == Interpolator.BACKENDS[2]:
+                    self.config['guard-digits'][1] = interpolator.guard_digits
+                    self.config['precision'][1] = interpolator.precision
+                    decimal_context.prec = interpolator.precision
+                if interpolator.algorithm == 'piecewise':
+                    self.config['piecewise-degree'][1] = interpolator.piecewise.degree
+                elif interpolator.algorithm == 'spline':
+                    slopes = interpolator.spline.slopes
+                    self.config['spline-boundary'][1] = 'natural' if slopes is None else f'{slopes[0]},{slopes[1]}'
+                # ans is from the old interpolator
+                self.__pending_ans = None
+                if 'ans' in dir(self):
+                    del self.ans
+                self.__print(
+                    f'$#LIGHTBLUE#[*]% loaded #GREEN#{interpolator.size()}% points from #MAGENTA#{filename}%')
+            except PermissionError:
+                self.__print(
+                    f"#RED#[ERROR]% The file #GREEN#{filename}% could not be read due to insufficient permissions that the current user have.")
+            except FileNotFoundError:
+                self.__print(f"#RED#[ERROR]% The file #GREEN#{filename}% does not exist.")
+            except IsADirectoryError:
+                self.__print(f"#RED#[ERROR]% #GREEN#{filename}% is a folder/directory, please specify a file.")
+            except ValueError as e:
+                self.__print(f"#RED#[ERROR]% #GREEN#{filename}% could not be loaded: {e}")
+            except:
+                # TODO: remove this general exception and handle all file exceptions
+                self.__print(f"#RED#$[PANIC]% unknown error occurred in #MAGENTA#loadstate% command, please fix.")
+
     def cmd_print_points(self, *args):
         if self.interpolator.size():
-            for point in zip(self.interpolator.x_data, self.interpolator.y_data):
-                self.__print(f'#LIGHTBLUE#(#GREEN#{point[0]}#LIGHTBLUE#, #GREEN#{point[1]}%#LIGHTBLUE#)%')
+            with self.__writer() as writer:
+                for point in zip(self.interpolator.x_data, self.interpolator.y_data):
+                    writer.write_line(InterpolatorCommandHandler.POINT_TEMPLATE, *point)
         else:
             self.__print('#YELLOW#[WARN]% No data points, nothing to print...')
 
@@ -216,32 +609,86 @@ class InterpolatorCommandHandler:
         size = self.interpolator.size()
 
         if size:
-            interpolation_string = re_sub(r'[0-9]+|[\-+/()x]',
+            if args and args[0] == 'nested':
+                self.__print_nested(*args[1:2])
+                return
+
+            if args and args[0] == 'expanded':
+                try:
+                    interpolation_string = self.interpolator.expanded_str()
+                except ValueError as e:
+                    # the "piecewise" and "spline" algorithms are not a single polynomial
+                    self.__print(f'#RED#[ERROR]% #GREEN#print expanded% is not available: {e}')
+                    return
+            else:
+                interpolation_string = str(self.interpolator)
+
+            interpolation_string = re_sub(r'[0-9]+|[\-+/()x^]',
                                           InterpolatorCommandHandler._color_interpolation_string_handler,
-                                          str(self.interpolator))
+                                          interpolation_string)
 
-            self.__print(f'#LIGHTBLUE#P#GREEN#{self.interpolator.size() - 1}#LIGHTBLUE#(x) =% {interpolation_string}')
+            self.__print(f'#LIGHTBLUE#P#GREEN#{self.interpolator.degree()}#LIGHTBLUE#(x) =% {interpolation_string}')
         else:
             self.__print('#YELLOW#[WARN]% No data points, nothing to print...')
 
-    def __inner_compute(self, x):
+    def __print_nested(self, filename=None):
+        """Write the nested form of the interpolation to the screen or to a file, as it is built"""
+        if filename is not None:
+            try:
+                with open(filename, 'w') as f:
+                    self.interpolator.write_nested(f)
+                    f.write('\n')
+                self.__print(f'$#LIGHTBLUE#[*]% interpolation saved to #MAGENTA#{filename}% successfully')
+            except PermissionError:
+                self.__print(
+                    f"#RED#[ERROR]% The file #GREEN#{filename}% could not be written to due to insufficient permissions that the current user have.")
+            except IsADirectoryError:
+                self.__print(f"#RED#[ERROR]% #GREEN#{filename}% is a folder/directory, please specify a file.")
+            return
+
+        is_color = self.config['show-colors'][1]
+        self.__print(f'#LIGHTBLUE#P#GREEN#{self.interpolator.degree()}#LIGHTBLUE#(x) =% ', end='')
+
+        for chunk in self.interpolator.render_nested():
+            # each part is colored alone, so the full string is never built
+            if is_color:
+                chunk = color_format(re_sub(r'[0-9]+|[\-+/()x^]',
+                                            InterpolatorCommandHandler._color_interpolation_string_handler, chunk))
+            sys.stdout.write(chunk)
+
+        sys.stdout.write('\n')
+
+    def __inner_compute(self, x, digits=None):
         """is a small function handler to remove redundency
 
         This piece of code is used in cmd_compute, cmd_compute_location, cmd_approx_ans
 
         :param x: the value of x to be computed (mostly it will be a string)
         :type x: Any
-        :return: the value of x as Fraction, and the result of the computation as a fraction as well
-        :rtype: Tuple[Fraction, Fraction]
+        :param digits: the significant digits of the printed result (see *Interpolator.approx*), or None for the
+                       exact result, ans is the exact result either way
+        :type digits: Optional[int]
+        :return: the value of x as Fraction, and the result of the computation as a fraction as well (or Decimal
+                 with *digits*)
+        :rtype: Tuple[Fraction, Union[Fraction, Decimal]]
         """
         size = self.interpolator.size()
         if size:
             try:
                 x = Fraction(x)
-                result = self.interpolator.compute(x)
-                self.ans = result
+                # ans is always the exact result, the digits are only for printing
+                if digits is None:
+                    result = self.ans = self.interpolator.compute(x)
+                    self.__pending_ans = None
+                else:
+                    result, exact = self.interpolator.approx(x, digits, with_exact=True)
+                    if exact is None:
+                        self.__pending_ans = x
+                    else:
+                        self.ans = exact
+                        self.__pending_ans = None
                 return x, result
-            except ValueError:
+            except (ValueError, ZeroDivisionError):
                 self.__print(f'#RED#[ERROR]% Error in evaluating value #GREEN#x = {x}%')
                 return None, None
         else:
@@ -253,40 +700,170 @@ class InterpolatorCommandHandler:
         if args:
             x, result = self.__inner_compute(args[0])
             if x is not None:
-                self.__print(f'#MAGENTA#ans =% #LIGHTBLUE#P{size - 1}(#GREEN#{x}%#LIGHTBLUE#) =% {result}')
+                self.__print(f'#MAGENTA#ans =% #LIGHTBLUE#P{self.interpolator.degree()}(#GREEN#{x}%#LIGHTBLUE#) =% {result}')
         else:
             self.__print('#RED#[ERROR]% no value #GREEN#x% specified')
 
+    def cmd_plot(self, *args):
+        if len(args) < 1:
+            self.__print("#RED#[ERROR]% please provide #MAGENTA#file% to draw to (png or svg).")
+            return
+
+        if not self.interpolator.size():
+            self.__print('#YELLOW#[WARN]% No data points, nothing to plot...')
+            return
+
+        filename = args[0]
+        if filename.rsplit('.', 1)[-1].lower() not in InterpolatorCommandHandler.PLOT_FORMATS:
+            self.__print(f"#RED#[ERROR]% the file must be one of #GREEN#{InterpolatorCommandHandler.PLOT_FORMATS}%")
+            return
+
+        x_data = [float(x) for x in self.interpolator.x_data]
+        y_data = [float(y) for y in self.interpolator.y_data]
+
+        try:
+            if len(args) >= 3:
+                first_x, last_x = float(Fraction(args[1])), float(Fraction(args[2]))
+            else:
+                # a small margin around the points
+                margin = (max(x_data) - min(x_data)) * 0.05 or 1
+                first_x, last_x = min(x_data) - margin, max(x_data) + margin
+            if first_x >= last_x:
+                raise ValueError
+        except (ValueError, ZeroDivisionError):
+            self.__print('#RED#[ERROR]% the range for #GREEN#plot% is not correct')
+            return
+
+        try:
+            # matplotlib is only needed by this command
+            from lib.graph import Plotter, adaptive_sample
+        except ImportError:
+            self.__print('#RED#[ERROR]% #MAGENTA#plot% needs #GREEN#matplotlib%, which is not installed')
+            return
+
+        xs, ys = adaptive_sample(self.interpolator.approx_many, first_x, last_x)
+
+        # the line can be far larger than the points (between close points, or where the float values overflow),
+        # so it is only shown up to one height of the points above and below them. the limits are set before the
+        # line is drawn, so it is not used to scale the axes
+        low, high = min(y_data), max(y_data)
+        height = high - low or 1
+        finite_ys = [y for y in ys.tolist() if isfinite(y)] or [low, high]
+        bottom = min(low, max(min(finite_ys), low - height))
+        top = max(high, min(max(finite_ys), high + height))
+        margin = (top - bottom) * 0.05 or 1
+
+        plotter = Plotter(headless=True)
+        plotter.set_y_limits(bottom - margin, top + margin)
+        plotter.add_line(xs, ys)
+        plotter.add_points(x_data, y_data)
+
+        try:
+            plotter.save(filename)
+            self.__print(f'$#LIGHTBLUE#[*]% plot saved to #MAGENTA#{filename}% successfully')
+        except PermissionError:
+            self.__print(
+                f"#RED#[ERROR]% The file #GREEN#{filename}% could not be written to due to insufficient permissions that the current user have.")
+        except IsADirectoryError:
+            self.__print(f"#RED#[ERROR]% #GREEN#{filename}% is a folder/directory, please specify a file.")
+        except (ValueError, OverflowError) as e:
+            self.__print(f"#RED#[ERROR]% the plot could not be drawn: {e}")
+
+    def cmd_tabulate(self, *args):
+        if len(args) < 3:
+            self.__print("#RED#[ERROR]% please provide #GREEN#first x%, #GREEN#last x% and #GREEN#count%.")
+            return
+
+        if not self.interpolator.size():
+            self.__print('#RED#[ERROR]% there is no data points to build the interpolation function')
+            return
+
+        try:
+            first_x, last_x = map(lambda x: Fraction(x.strip()), args[:2])
+            count = int(args[2])
+            if count < 1:
+                raise ValueError
+        except (ValueError, ZeroDivisionError):
+            self.__print('#RED#[ERROR]% the input for #GREEN#tabulate% is not correct')
+            return
+
+        step = (last_x - first_x) / (count - 1) if count > 1 else 0
+        xs = [first_x + step * i for i in range(count)]
+        ys = self.interpolator.compute_many(xs, workers=self.config['workers'][1])
+
+        if len(args) < 4:
+            with self.__writer() as writer:
+                for point in zip(xs, ys):
+                    writer.write_line(InterpolatorCommandHandler.POINT_TEMPLATE, *point)
+            return
+
+        filename = args[3]
+        try:
+            # the same format as savefile, so it can be read by addfile
+            with open(filename, 'w') as f:
+                for point in zip(xs, ys):
+                    print(f'{point[0]} {point[1]}', file=f)
+
+            self.__print(f'$#LIGHTBLUE#[*]% {count} values saved to #MAGENTA#{filename}% successfully')
+        except PermissionError:
+            self.__print(
+                f"#RED#[ERROR]% The file #GREEN#{filename}% could not be written to due to insufficient permissions that the current user have.")
+        except IsADirectoryError:
+            self.__print(f"#RED#[ERROR]% #GREEN#{filename}% is a folder/directory, please specify a file.")
+
+    def cmd_series(self, *args):
+        if self.series_interpolator is None or not self.series_interpolator.size():
+            self.__print('#RED#[ERROR]% there are no series, add them from a file with many y columns using '
+                         '#MAGENTA#addfile <filename> series%')
+            return
+        if not args:
+            self.__print('#RED#[ERROR]% no value #GREEN#x% specified')
+            return
+
+        try:
+            xs = [Fraction(x) for x in args]
+        except (ValueError, ZeroDivisionError):
+            self.__print(f'#RED#[ERROR]% Error in evaluating the values #GREEN#{" ".join(args)}%')
+            return
+
+        # all the series are computed in one pass over the points for each x
+        with self.__writer() as writer:
+            for x, values in zip(xs, self.series_interpolator.compute_many(xs)):
+                writer.write_line('#LIGHTBLUE#P(#GREEN#{}%#LIGHTBLUE#) =% {}', x, ', '.join(map(str, values)))
+
     def cmd_compute_location(self, *args):
         size = self.interpolator.size()
         if args:
             try:
                 inp = Fraction(args[0])
-                if size > inp >= 0:
-                    x_points = self.interpolator.x_data
+                if size - 1 >= inp >= 0:
+                    # the x values are floats or Decimals in the other backends, which can not be mixed with inp
+                    x_before = Fraction(self.interpolator.x_data[floor(inp)])
+                    x_after = Fraction(self.interpolator.x_data[ceil(inp)])
                     # get the difference between the index before this and after this if it is in the middle
                     # if its a whole number, ceil and floor would result to the same thing.
-                    difference = x_points[ceil(inp)] - x_points[floor(inp)]
+                    difference = x_after - x_before
 
                     # get the distance from the index before this and multiply it to the difference before, to know
                     # how much we should offset from it.
                     # (inp - floor(inp) is used to get the fraction part of the number only
                     offset = difference * (inp - floor(inp))
 
-                    x = x_points[floor(inp)] + offset
+                    x = x_before + offset
 
                     x, result = self.__inner_compute(x)
                     if x is not None:
-                        self.__print(f'#MAGENTA#ans =% #LIGHTBLUE#P{size - 1}(#GREEN#{x}%#LIGHTBLUE#) =% #LIGHTBLUE#P{size - 1}(#GREEN#{fraction_to_decimal(x)}%#LIGHTBLUE#) =% {result}')
+                        self.__print(f'#MAGENTA#ans =% #LIGHTBLUE#P{self.interpolator.degree()}(#GREEN#{x}%#LIGHTBLUE#) =% #LIGHTBLUE#P{self.interpolator.degree()}(#GREEN#{fraction_to_decimal(x)}%#LIGHTBLUE#) =% {result}')
                 else:
                     self.__print(
                         f'#RED#[ERROR]% the value location #GREEN#{inp}% you are trying to compute does not exist')
-            except ValueError:
+            except (ValueError, ZeroDivisionError):
                 self.__print(f'#RED#[ERROR]% Error in evaluating value #GREEN#x = {args[0]}%')
         else:
             self.__print('#RED#[ERROR]% no value #GREEN#x% specified')
 
     def cmd_print_ans(self, *args):
+        self.__resolve_ans()
         if 'ans' in dir(self):
             self.__print(f'#MAGENTA#ans =% {self.ans}')
         else:
@@ -296,12 +873,13 @@ class InterpolatorCommandHandler:
     def cmd_approx(self, *args):
         size = self.interpolator.size()
         if args:
-            x, result = self.__inner_compute(args[0])
+            x, result = self.__inner_compute(args[0], self.config['precision'][1])
 
             if x is not None:
                 decimal_result = fraction_to_decimal(result)
-                self.__print(f'#MAGENTA#ans =% #LIGHTBLUE#P{size - 1}(#GREEN#{x}%#LIGHTBLUE#) =% {decimal_result}')
+                self.__print(f'#MAGENTA#ans =% #LIGHTBLUE#P{self.interpolator.degree()}(#GREEN#{x}%#LIGHTBLUE#) =% {decimal_result}')
         else:
+            self.__resolve_ans()
             # if ans is defined in this class (meaning it has been computed)
             if 'ans' in dir(self):
                 decimal_ans = fraction_to_decimal(self.ans)
@@ -310,6 +888,21 @@ class InterpolatorCommandHandler:
                 self.__print(
                     '#RED#[ERROR]% There is no value for #MAGENTA#ans% yet, you can get a value for #MAGENTA#ans% by #GREEN#compute%')
 
+    def cmd_error(self, *args):
+        if not self.interpolator.size():
+            self.__print('#RED#[ERROR]% there is no data points to build the interpolation function')
+            return
+
+        try:
+            xs = [Fraction(x) for x in args] if args else None
+        except (ValueError, ZeroDivisionError):
+            self.__print(f'#RED#[ERROR]% Error in evaluating the values #GREEN#{" ".join(args)}%')
+            return
+
+        max_error, max_relative_error = self.interpolator.error_estimate(xs)
+        self.__print(f'#GREEN#max-error = #MAGENTA#{max_error:.6g}%\n'
+                     f'#GREEN#max-relative-error = #MAGENTA#{max_relative_error:.6g}%')
+
     def cmd_set_config(self, *args):
         if len(args):
             try:
@@ -334,23 +927,67 @@ class InterpolatorCommandHandler:
             # print all config
             self.__print('\n'.join([f'#GREEN#{k} = #MAGENTA#{repr(v[1])}%' for k, v in self.config.items()]))
 
+    def cmd_stats(self, *args):
+        stats = self.interpolator.stats()
+
+        if args and args[0] == 'json':
+            if len(args) < 2:
+                print(json.dumps(stats, indent=2))
+                return
+
+            filename = args[1]
+            try:
+                with open(filename, 'w') as f:
+                    json.dump(stats, f, indent=2)
+                self.__print(f'$#LIGHTBLUE#[*]% stats saved to #MAGENTA#{filename}% successfully')
+            except PermissionError:
+                self.__print(
+                    f"#RED#[ERROR]% The file #GREEN#{filename}% could not be written to due to insufficient permissions that the current user have.")
+            except IsADirectoryError:
+                self.__print(f"#RED#[ERROR]% #GREEN#{filename}% is a folder/directory, please specify a file.")
+            return
+
+        handlers = stats.pop('handlers', {})
+        lines = [f'#GREEN#{name.replace("_", "-")} = #MAGENTA#{value}%' for name, value in stats.items()]
+
+        for name, record in handlers.items():
+            line = f'#LIGHTBLUE#{name}%: #MAGENTA#{record["calls"]}% calls, #MAGENTA#{record["time"] * 1000:.3f}% ms'
+            if 'operations' in record:
+                line += f', #MAGENTA#{record["operations"]}% fraction operations'
+            lines.append(line)
+
+        self.__print('\n'.join(lines))
+
     def cmd_clear(self, *args):
         self.__print('$#LIGHTBLUE#[*] clearing...%')
-        # assign a new Interpolator and the old one will be gone
-        self.interpolator = Interpolator()
+        # remove the points, but keep the settings and statistics of the interpolator
+        self.interpolator.clear()
+        self.__exact_points = {}
+        self.series_interpolator = None
         # if ans is defined, remove it
+        self.__pending_ans = None
         if 'ans' in dir(self):
             del self.ans
 
     def cmd_exit(self, *args):
         return self.BREAK
 
+    def flush_added(self):
+        """Print the summary of the points added in quiet mode since the last summary"""
+        if self.pending_added:
+            self.__print(f'$#LIGHTBLUE#[*]% added #GREEN#{self.pending_added}% points')
+            self.pending_added = 0
+
     def run_command(self, commandline):
         command, *args = commandline.split()
         command = command.strip()
 
         possible_commands = self.get_matched_commands(command)
 
+        # the summary of the added points is printed before the output of any other command
+        if command != 'add':
+            self.flush_added()
+
         if len(possible_commands) == 1 or command in self.commands_map:
             command = possible_commands[0]
 
@@ -373,13 +1010,94 @@ class InterpolatorCommandHandler:
         else:
             possible_commands_string = '\n\t'.join(possible_commands)
             self.__print(f'#YELLOW#[WARN]% do you mean\n\n\t{possible_commands_string}')
+            # the command did not run
+            self.errors += 1
+
+    def __new_interpolator(self, **overrides):
+        """Create an empty Interpolator using the current session config, the arguments override the config"""
+        kwargs = {
+            'algorithm': self.config['algorithm'][1],
+            'backend': self.config['backend'][1],
+            'cache_size': self.config['cache-size'][1],
+            'piecewise_degree': self.config['piecewise-degree'][1],
+            'spline_slopes': self.__parse_spline_boundary(self.config['spline-boundary'][1]),
+            'precision': self.config['precision'][1],
+            'guard_digits': self.config['guard-digits'][1],
+        }
+        kwargs.update(overrides)
+        interpolator = Interpolator(**kwargs)
+        interpolator.set_instrumentation(self.__new_instrumentation(self.config['instrumentation'][1]))
+        return interpolator
+
+    @staticmethod
+    def __new_instrumentation(level):
+        """Create the Instrumentation of one of *INSTRUMENTATION_LEVELS*, None for the "off" level"""
+        if level == InterpolatorCommandHandler.INSTRUMENTATION_LEVELS[0]:
+            return None
+        return Instrumentation(count_operations=level == InterpolatorCommandHandler.INSTRUMENTATION_LEVELS[2])
+
+    @staticmethod
+    def __parse_spline_boundary(x):
+        """Convert the spline-boundary config to the end slopes of the spline, None for a natural spline
+
+        :raises ValueError: if the value is not "natural" or two numbers separated by a comma
+        """
+        if x == 'natural':
+            return None
+
+        slopes = tuple(Fraction(slope.strip()) for slope in x.split(','))
+        if len(slopes) != 2:
+            raise ValueError("two slopes are needed")
+        return slopes
+
+    def __resolve_ans(self):
+        """Compute the exact ans of the last approx, if it is not computed yet
+
+        it is called before the points change, so ans is still the result of the points of that approx
+        """
+        if self.__pending_ans is not None:
+            self.ans = self.interpolator.compute(self.__pending_ans)
+            self.__pending_ans = None
+
+    def __rebuild_interpolator(self, **overrides):
+        """Replace the interpolator with a new one using the new config, and add the current points to it
+
+        the points are added as they were given, not as the current backend rounded them, so lowering the
+        "decimal" precision and raising it again gives the same values. the new interpolator is only used when all
+        the points are added to it, otherwise the current one is kept and the error is printed (ex. two points are
+        the same value in the new backend).
+
+        :raises ValueError: if the new config is not valid, the current interpolator is kept
+        :return: whether the interpolator was replaced
+        :rtype: bool
+        """
+        self.__resolve_ans()
+        points = [self.__exact_points.get(x, (x, y))
+                  for x, y in zip(self.interpolator.x_data, self.interpolator.y_data)]
+
+        interpolator = self.__new_interpolator(**overrides)
+        try:
+            interpolator.add_many([x for x, _ in points], [y for _, y in points])
+        except ArithmeticError as e:
+            self.__print(f'#RED#[ERROR]% the points can not be kept with the new config, it is not changed ({e})')
+            return False
+
+        self.interpolator = interpolator
+        self.__exact_points = {interpolator.number_type(x): (x, y) for x, y in points}
+        return True
 
     def get_prompt(self):
         return f"{self.config['prompt'][1]} "
 
-    def __print(self, *args):
+    def __writer(self):
+        """Create a lib/colors::ColorWriter for many lines, which will only print colors if the config is set on"""
+        return ColorWriter(color=self.config['show-colors'][1])
+
+    def __print(self, *args, **kwargs):
         """Wrapper around lib/colors::color_print, which will only print colors if the config is set on"""
-        color_print(*args, color=self.config['show-colors'][1])
+        if args and args[0].startswith(('#RED#[ERROR]', '#RED#$[PANIC]')):
+            self.errors += 1
+        color_print(*args, color=self.config['show-colors'][1], **kwargs)
 
     @staticmethod
     def _color_interpolation_string_handler(s):
@@ -396,7 +1114,7 @@ class InterpolatorCommandHandler:
 
         if s == ')' or s == '(':
             color = 'LIGHTBLUE'
-        elif s == '/' or s == '+' or s == '-':
+        elif s == '/' or s == '+' or s == '-' or s == '^':
             color = 'MAGENTA'
         else:
             # will be numbers
@@ -421,7 +1139,58 @@ def print_welcome_message():
 """)
 
 
+def run_script(script):
+    """Run the commands of a script without the prompt, one command in each line
+
+    empty lines and lines starting with '#' are skipped, and '!' runs a shell command the same as the prompt.
+
+    :param script: the lines of the script
+    :type script: Iterable[str]
+    :return: the exit status, 1 if any of the commands reported an error and 0 otherwise
+    :rtype: int
+    """
+    cmd = InterpolatorCommandHandler(quiet=True)
+
+    for line in script:
+        command = line.strip()
+
+        if not command or command[0] == '#':
+            continue
+
+        if command[0] == '!':
+            cmd.flush_added()
+            if call_system_cmd(command[1:], shell=True):
+                cmd.errors += 1
+            continue
+
+        if cmd.run_command(command) == cmd.BREAK:
+            break
+
+    cmd.flush_added()
+
+    return 1 if cmd.errors else 0
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Interactive interpolation of points")
+    parser.add_argument('script', nargs='?',
+                        help="run the commands of this file without the prompt, '-' for stdin (default when stdin "
+                             "is not a terminal)")
+    args = parser.parse_args()
+
+    if args.script is None and not sys.stdin.isatty():
+        args.script = '-'
+
+    if args.script == '-':
+        exit(run_script(sys.stdin))
+    elif args.script is not None:
+        try:
+            with open(args.script) as f:
+                exit(run_script(f))
+        except OSError as e:
+            color_print(f"#RED#[ERROR]% could not read the script #GREEN#{args.script}%: {e.strerror}", color=False)
+            exit(2)
+
     cmd = InterpolatorCommandHandler()
     print_welcome_message()
 
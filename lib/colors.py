@@ -1,6 +1,7 @@
 import os
 import re
 import sys
+from functools import lru_cache
 
 # BLACK, BLUE, RED, GREEN, YELLOW, LIGHTBLUE, MAGENTA, WHITE = (0, 21, 9, 10, 11, 14, 13, 15)
 
@@ -43,22 +44,42 @@ def __replace_handler(c):
     return RESET
 
 
-def supports_color():
+# {stream: whether it supports color}, each stream is only checked once
+__color_support = {}
+
+
+def supports_color(stream=None):
     """
     Returns True if the running system's terminal supports color, and False
     otherwise.
+
+    The result is cached for each stream (sys.stdout by default).
     """
-    plat = sys.platform
-    supported_platform = plat != 'Pocket PC' and (plat != 'win32' or 'ANSICON' in os.environ)
+    if stream is None:
+        stream = sys.stdout
 
-    is_a_tty = hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
-    return supported_platform and is_a_tty
+    res = __color_support.get(stream)
+    if res is None:
+        plat = sys.platform
+        supported_platform = plat != 'Pocket PC' and (plat != 'win32' or 'ANSICON' in os.environ)
 
+        is_a_tty = hasattr(stream, 'isatty') and stream.isatty()
+        res = __color_support[stream] = supported_platform and is_a_tty
 
-def color_format(s, is_color=True):
-    handler = __replace_handler if is_color and supports_color() else ''
+    return res
 
-    return re.sub(r'((?<!\\)[@#][A-Z]+[@#])|\$|%', handler, s)
+
+@lru_cache(maxsize=1024)
+def compile_template(s, is_color=True):
+    """Convert the markup of a template to the ANSI codes, or remove it if is_color is False
+
+    The result is cached, so a template which is used many times (ex. with str.format) is only converted once.
+    """
+    return re.sub(r'((?<!\\)[@#][A-Z]+[@#])|\$|%', __replace_handler if is_color else '', s)
+
+
+def color_format(s, is_color=True, stream=None):
+    return compile_template(s, is_color and supports_color(stream))
 
 
 """
@@ -77,4 +98,49 @@ def color_print(*args, **kwargs):
     if 'color' in kwargs:
         del kwargs['color']
 
-    print(*[color_format(i, is_color) for i in args], **kwargs)
+    print(*[color_format(i, is_color, kwargs.get('file')) for i in args], **kwargs)
+
+
+class ColorWriter:
+    """Buffered writer of many colored lines, which are written to the stream in large writes
+
+    Each line is a template (see *compile_template*) with {} for the values, so the markup is converted once for
+    all the lines, and the values are not searched for markup.
+
+    example:
+        with ColorWriter(color=True) as writer:
+            for x, y in points:
+                writer.write_line('#LIGHTBLUE#(#GREEN#{}#LIGHTBLUE#, #GREEN#{}%#LIGHTBLUE#)%', x, y)
+    """
+
+    # the number of characters to collect before writing them
+    BUFFER_SIZE = 1 << 16
+
+    def __init__(self, stream=None, color=True, buffer_size=BUFFER_SIZE):
+        self.stream = sys.stdout if stream is None else stream
+        self.color = color and supports_color(self.stream)
+        self.buffer_size = buffer_size
+
+        self.__parts = []
+        self.__size = 0
+
+    def write_line(self, template, *values):
+        line = compile_template(template, self.color).format(*values) + '\n'
+
+        self.__parts.append(line)
+        self.__size += len(line)
+        if self.__size >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.__parts:
+            self.stream.write(''.join(self.__parts))
+            self.__parts = []
+            self.__size = 0
+        self.stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.flush()
@@ -1,28 +1,142 @@
 import matplotlib
-import matplotlib.pyplot as plt
+import numpy as np
 
 
 # TODO: make this standalone, or that a program can have more than one Plotter
 class Plotter:
-    def __init__(self, setup_callback=None):
+    def __init__(self, setup_callback=None, headless=False):
+        """
+        :param setup_callback: called with pyplot to setup the plot, or with the axes of the figure if headless
+        :type setup_callback: Optional[Callable]
+        :param headless: draw on a figure that is only saved to files (see *save*), which does not need a display
+        :type headless: bool
+        """
+        self.headless = headless
+
+        if headless:
+            # the figure is not managed by pyplot, so there is no GUI backend or global state
+            from matplotlib.figure import Figure
+
+            self.figure = Figure()
+            self.axes = self.figure.add_subplot()
+
+            if callable(setup_callback):
+                setup_callback(self.axes)
+            return
+
         matplotlib.use('GTK3Agg')
+        import matplotlib.pyplot as plt
+        self.plt = plt
+
         # start interactive mode
         # FIXME: allow interactivity with pause
         plt.cla()
+        self.figure = plt.gcf()
+        self.axes = plt.gca()
 
         if callable(setup_callback):
             setup_callback(plt)
 
     def clear(self):
-        plt.cla()
+        self.axes.cla()
 
     def show(self):
-        plt.show()
+        if not self.headless:
+            self.plt.show()
+
+    def save(self, filename):
+        """Save the figure to a file, the format is chosen from the extension (ex. png or svg)
+
+        :param filename: the file to save the figure to
+        :type filename: str
+        :rtype: None
+        """
+        self.figure.savefig(filename)
 
     def add_line(self, x_data, y_data):
-        plt.plot(x_data, y_data)
-        plt.pause(0.001)
+        self.axes.plot(x_data, y_data)
+        self.__update()
 
     def add_points(self, x_data, y_data):
-        plt.plot(x_data, y_data, 'o')
-        plt.pause(0.001)
+        self.axes.plot(x_data, y_data, 'o')
+        self.__update()
+
+    def set_y_limits(self, bottom, top):
+        self.axes.set_ylim(bottom, top)
+        self.__update()
+
+    def __update(self):
+        # only the interactive window needs to be drawn again
+        if not self.headless:
+            self.plt.pause(0.001)
+
+
+def adaptive_sample(function, first, last, initial_points=101, max_points=4001, tolerance=1e-3):
+    """Sample a function over [first, last] more densely where it bends
+
+    starting from evenly spaced samples, the intervals around every sample which is farther than *tolerance*
+    (relative to the range of the values) from the line between its neighbours are split in half, and all the new
+    samples of a round are computed in one call.
+
+    :param function: vectorized function, takes and returns arrays of float
+    :type function: Callable[[np.ndarray], np.ndarray]
+    :param first: the first x
+    :type first: float
+    :param last: the last x
+    :type last: float
+    :param initial_points: the number of evenly spaced samples to start from
+    :type initial_points: int
+    :param max_points: the maximum number of samples
+    :type max_points: int
+    :param tolerance: the distance from the line, relative to the range of the values, that needs more samples
+    :type tolerance: float
+    :return: the x and y values of the samples, sorted by x, the values that are not finite are nan (so a line
+             is broken there)
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+    xs = np.linspace(first, last, initial_points)
+    ys = _finite_or_nan(function(xs))
+
+    # the intervals are not split below this width
+    min_width = (last - first) * 1e-9
+
+    while len(xs) < max_points and len(xs) > 2:
+        finite = np.isfinite(ys)
+        with np.errstate(over='ignore'):
+            scale = np.ptp(ys[finite]) if finite.any() else 0
+        if not np.isfinite(scale) or not scale:
+            break
+
+        # the distance of each inner sample from the line between its neighbours
+        t = (xs[1:-1] - xs[:-2]) / (xs[2:] - xs[:-2])
+        with np.errstate(over='ignore', invalid='ignore'):
+            deviation = np.abs(ys[1:-1] - (ys[:-2] + t * (ys[2:] - ys[:-2]))) / scale
+        deviation = np.nan_to_num(deviation, nan=np.inf)
+
+        bent = np.flatnonzero(deviation > tolerance)
+        if not len(bent):
+            break
+
+        # the intervals on both sides of the bent samples, the most bent first if there is no room for all of them
+        bent = bent[np.argsort(-deviation[bent], kind='stable')]
+        intervals = np.stack((bent, bent + 1), axis=1).ravel()
+        _, first_indices = np.unique(intervals, return_index=True)
+        intervals = intervals[np.sort(first_indices)]
+        intervals = intervals[xs[intervals + 1] - xs[intervals] > min_width][:max_points - len(xs)]
+        if not len(intervals):
+            break
+
+        intervals.sort()
+        new_xs = (xs[intervals] + xs[intervals + 1]) / 2
+        new_ys = _finite_or_nan(function(new_xs))
+
+        xs = np.insert(xs, intervals + 1, new_xs)
+        ys = np.insert(ys, intervals + 1, new_ys)
+
+    return xs, ys
+
+
+def _finite_or_nan(values):
+    values = np.array(values, dtype=np.float64)
+    values[~np.isfinite(values)] = np.nan
+    return values
@@ -0,0 +1,93 @@
+import sys
+from fractions import Fraction
+from time import perf_counter
+
+# the code of the Fraction arithmetic, each call of one of them is a Fraction operation
+_FRACTION_OPERATIONS = {getattr(Fraction, name).__code__
+                        for name in ('_add', '_sub', '_mul', '_div', '__pow__', '__rpow__')
+                        if hasattr(getattr(Fraction, name, None), '__code__')}
+
+
+class Instrumentation:
+    """Class that records the calls, time and Fraction operations of the functions it wraps
+
+    The functions are wrapped only while the instrumentation is on (see *Interpolator.set_instrumentation*), so
+    there is nothing to check in the functions themselves and it costs nothing when it is off.
+
+    The time and operations of a function include the functions it calls, so the time of *add* includes the time
+    of the handler it uses.
+    """
+
+    def __init__(self, count_operations=False):
+        """
+        :param count_operations: whether to count the Fraction operations, which uses a profile hook while an
+                                 instrumented function runs, so the times are slower with it
+        :type count_operations: bool
+        """
+        self.count_operations = count_operations
+
+        # {name: value} of the wrapped functions
+        self.calls = {}
+        self.time = {}
+        self.operations = {}
+
+        # {attribute name: original function} of the wrapped functions, to be restored
+        self.originals = {}
+
+        # the number of Fraction operations since the start, and the number of running wrapped functions
+        self.__operations = 0
+        self.__depth = 0
+
+    def wrap(self, name, function):
+        """Get a function that records the calls of *function* under *name*
+
+        :param name: the name of the function in the records
+        :type name: str
+        :param function: the function to be wrapped
+        :type function: Callable
+        :rtype: Callable
+        """
+        calls, time, operations = self.calls, self.time, self.operations
+        calls.setdefault(name, 0)
+        time.setdefault(name, 0.0)
+        if self.count_operations:
+            operations.setdefault(name, 0)
+
+        def wrapper(*args, **kwargs):
+            start_operations = self.__operations
+            if self.count_operations:
+                if self.__depth == 0:
+                    sys.setprofile(self.__count_operation)
+                self.__depth += 1
+
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                time[name] += perf_counter() - start
+                calls[name] += 1
+
+                if self.count_operations:
+                    self.__depth -= 1
+                    if self.__depth == 0:
+                        sys.setprofile(None)
+                    operations[name] += self.__operations - start_operations
+
+        return wrapper
+
+    def __count_operation(self, frame, event, arg):
+        if event == 'call' and frame.f_code in _FRACTION_OPERATIONS:
+            self.__operations += 1
+
+    def to_dict(self):
+        """Get the records of each function
+
+        :return: {name: {'calls': int, 'time': seconds, 'operations': int (only when they are counted)}}
+        :rtype: dict
+        """
+        res = {}
+        for name in self.calls:
+            res[name] = {'calls': self.calls[name], 'time': self.time[name]}
+            if name in self.operations:
+                res[name]['operations'] = self.operations[name]
+        return res
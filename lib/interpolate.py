@@ -1,35 +1,264 @@
+from collections import OrderedDict
+from decimal import Context, Decimal, localcontext
 from fractions import Fraction
-from typing import Tuple
+from functools import wraps
+from math import frexp, gcd, inf, isfinite, lcm, ldexp, nextafter
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from lib.modular import modular_divided_differences
+from lib.multipoint import evaluate_many, newton_to_power_basis
+from lib.parallel import exact_newton_values, parallel_exact_newton_values
+from lib.piecewise import PiecewiseIndex
+from lib.spline import CubicSpline
+
+
+class CommonDenominatorArray:
+    """List of Fractions stored as integer numerators over one shared denominator
+
+    This is used to do the exact arithmetic over integers, without the gcd that Fraction does on every operation.
+    The denominator is only grown (to the lcm) when a new value needs it, and it is not reduced when values are
+    removed, as it is still a common denominator for the rest.
+    """
+
+    def __init__(self):
+        self.numerators = []
+        self.denominator = 1
+
+    def append(self, value):
+        """Append a value to the array
+
+        :param value: the new value
+        :type value: Fraction
+        :rtype: None
+        """
+        denominator = value.denominator
+
+        # if the current denominator is not a multiple of the new one, then all the numerators need to be scaled
+        if self.denominator % denominator:
+            scale = denominator // gcd(self.denominator, denominator)
+            self.numerators = [numerator * scale for numerator in self.numerators]
+            self.denominator *= scale
+
+        self.numerators.append(value.numerator * (self.denominator // denominator))
+
+    def extend(self, values):
+        """Append many values to the array, growing the denominator only once
+
+        :param values: the new values
+        :type values: List[Fraction]
+        :rtype: None
+        """
+        denominator = self.denominator
+        for value in values:
+            if denominator % value.denominator:
+                denominator *= value.denominator // gcd(denominator, value.denominator)
+
+        if denominator != self.denominator:
+            scale = denominator // self.denominator
+            self.numerators = [numerator * scale for numerator in self.numerators]
+            self.denominator = denominator
+
+        self.numerators.extend(value.numerator * (denominator // value.denominator) for value in values)
+
+    def truncate(self, size):
+        """Remove the values starting from *size*
+
+        :param size: the new size of the array
+        :type size: int
+        :rtype: None
+        """
+        del self.numerators[size:]
+
+    def __len__(self):
+        return len(self.numerators)
+
+    def __getitem__(self, index):
+        return Fraction(self.numerators[index], self.denominator)
+
+
+def _in_decimal_context(method):
+    """run the method in the working precision of the "decimal" backend, as the Decimal operations round to the
+    precision of the current context"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.decimal_context is None:
+            return method(self, *args, **kwargs)
+        with localcontext(self.decimal_context):
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class Interpolator:
     """Class that creates and handles an interpolation instance
 
     THe behaviour can change based on the algorithm chosen, which can be found in *MODES*.
+    The numbers representation can change based on the backend chosen, which can be found in *BACKENDS*.
     """
-    MODES = ["newton", "divide", ]
+    MODES = ["newton", "divide", "barycentric", "piecewise", "spline", ]
+    BACKENDS = ["fraction", "float64", "decimal", ]
+    # the order in which *add_many* adds the points
+    ORDERS = ["insertion", "leja", ]
+    # the arithmetic of the exact c values built by *add_many*, with fractions or modulo primes (see *lib/modular*)
+    ENGINES = ["rational", "modular", ]
 
-    def __init__(self, algorithm=MODES[0]):
+    # the initial capacity of the numpy buffers used by the "float64" backend
+    INITIAL_CAPACITY = 16
+    # the number of differences (values times points) of "barycentric" *compute_many* in "float64" at once
+    BARYCENTRIC_CHUNK_SIZE = 1 << 16
+    # the smallest number of values for *compute_many* to use more than one process, as starting them is slow
+    PARALLEL_MIN_BATCH = 64
+    # the smallest number of values and of c values for *compute_many_exact* to use the subproduct tree, and the
+    # largest common denominator (bits) of the values and x_data it is used for, as the integers grow with it.
+    # the sizes are provisional, from `benchmark.py --multipoint` on random points: the tree is faster for 512
+    # values of 640 and 1000 points once the polynomial is cached, the results are mixed for 128 and 256 values,
+    # and the first call also converts the polynomial (about the time of 300 values of the Newton form)
+    MULTIPOINT_MIN_BATCH = 512
+    MULTIPOINT_MIN_SIZE = 640
+    MULTIPOINT_MAX_DENOMINATOR_BITS = 64
+    # the unit roundoff of float64, and the smallest subnormal float64, which is more than the absolute error of an
+    # operation which underflows, for the error bounds of *approx*
+    FLOAT_ROUNDOFF = 2.0 ** -53
+    FLOAT_UNDERFLOW = 2.0 ** -1074
+    # the methods and handlers recorded by *set_instrumentation*
+    INSTRUMENTED = ['add', 'add_many', 'compute', 'compute_many',
+                    'c_data_adder_handler', 'newton_compute_handler', 'compute_handler', ]
+
+    def __init__(self, algorithm=MODES[0], backend=BACKENDS[0], cache_size=0, piecewise_degree=3, spline_slopes=None,
+                 precision=28, guard_digits=8):
         """Initialize the interpolator with the algorithm chosen by the user
 
         :param algorithm: chosen algorithm for this interpolator from the list *Interpolator.MODES*
         :type algorithm: str
+        :param backend: chosen numbers representation from the list *Interpolator.BACKENDS*
+        :type backend: str
+        :param cache_size: the maximum number of *compute* results to be cached, 0 disables the cache
+        :type cache_size: int
+        :param piecewise_degree: the degree of the local polynomials of the "piecewise" algorithm
+        :type piecewise_degree: int
+        :param spline_slopes: the slopes at both ends of the "spline" algorithm (clamped), None for a natural spline
+        :type spline_slopes: Optional[Tuple[Fraction, Fraction]]
+        :param precision: the number of significant digits of the "decimal" backend
+        :type precision: int
+        :param guard_digits: the extra digits of the "decimal" backend, the arithmetic is done with
+                             precision + guard_digits digits to limit the rounding errors of the results
+        :type guard_digits: int
         """
         if algorithm not in Interpolator.MODES:
             raise ValueError(f"algorithm argument must be one of {Interpolator.MODES}")
+        if backend not in Interpolator.BACKENDS:
+            raise ValueError(f"backend argument must be one of {Interpolator.BACKENDS}")
+        if precision < 1 or guard_digits < 0:
+            raise ValueError("precision must be positive and guard_digits must not be negative")
+
+        self.algorithm = algorithm
+        self.backend = backend
+        self.precision = precision
+        self.guard_digits = guard_digits
+        # the working precision of the "decimal" backend, see *_in_decimal_context*
+        self.decimal_context = None
+        # {attribute name: function that decodes it} of the restored values that are not decoded yet, see *restore*
+        self.__lazy_data = {}
+
+        if backend == Interpolator.BACKENDS[1]:
+            # the data is stored in contiguous numpy buffers that grow geometrically, and the
+            # x_data, y_data, c_data are views over the used part of these buffers.
+            self.__buffers = {name: np.empty(Interpolator.INITIAL_CAPACITY, dtype=np.float64)
+                              for name in ('x_data', 'y_data', 'c_data')}
+            self.x_data = self.__buffers['x_data'][:0]
+            self.y_data = self.__buffers['y_data'][:0]
+            self.c_data = self.__buffers['c_data'][:0]
+            self.number_type = Interpolator.__to_float
+            self.newton_compute_handler = self.__float_compute
+        elif backend == Interpolator.BACKENDS[2]:
+            self.x_data = []
+            self.y_data = []
+            self.c_data = []
+            self.decimal_context = Context(prec=precision + guard_digits)
+            self.number_type = self.__to_decimal
+            self.newton_compute_handler = self.__decimal_compute
+        else:
+            self.x_data = []
+            self.y_data = []
+            self.c_data = []
+            self.number_type = Fraction
+            self.newton_compute_handler = self.__compute
+            # the exact arithmetic is done on x_data and c_data as integers over a common denominator,
+            # these are synced from x_data and c_data when needed by *__compute*
+            self.__exact_x_data = CommonDenominatorArray()
+            self.__exact_c_data = CommonDenominatorArray()
+            # the c values rounded to float for *approx*, synced like the common denominator arrays
+            self.__float_c_data = []
 
-        self.x_data = []
-        self.y_data = []
-        self.c_data = []
+        # the handler used by *compute*, all the modes that store the Newton form use it directly
+        self.compute_handler = self.newton_compute_handler
+
+        # the full divided differences table, a row for each point (see *__divided_differences_row*).
+        # it is only built when a point is removed or updated, and kept up to date after that.
+        self.dd_table = None
+
+        # the expanded (power basis) coefficients, lowest degree first, and (x - x0)...(x - xn-1) which is needed to
+        # add the next term. they are built by *to_polynomial* and only extended with the new c values after that.
+        self.__polynomial = None
+        self.__polynomial_basis = None
+        self.__polynomial_size = 0
+        # the common denominator version of __polynomial for *compute* in the "fraction" backend
+        self.__exact_polynomial = None
+        # (size of c_data, coefficients) of the polynomial of y = D x over integers for *compute_many_exact*
+        self.__integer_polynomial = None
+        # (version, x_data, y_data, w_data) in float64 of the "barycentric" mode for *approx_many*
+        self.__float_barycentric_data = None
+
+        # this is increased whenever the data points change, so the cached results of older versions are not used
+        self.version = 0
+
+        # LRU cache of *compute* results {x: result} for the version __cache_version
+        self.__cache = OrderedDict()
+        self.__cache_version = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.set_cache_size(cache_size)
+
+        # the number of *approx* results found in float64 with an error bound, and the ones computed exactly
+        self.filter_hits = 0
+        self.filter_misses = 0
+
+        # the *Instrumentation* that records the handlers, see *set_instrumentation*
+        self.instrumentation = None
 
         if algorithm == Interpolator.MODES[1]:
             # this is used for only "divide" method and this is the inner part of the tree
             # or you can think of it as the hidden part that is used to build the c values
             # so it's important and should be present
-            self.in_c_data = []
+            self.in_c_data = np.empty(0, dtype=np.float64) if backend == Interpolator.BACKENDS[1] else []
             self.c_data_adder_handler = self.__divide_c_data_adder_handler
         elif algorithm == Interpolator.MODES[0]:
             self.c_data_adder_handler = self.__newton_c_data_adder_handler
+        elif algorithm == Interpolator.MODES[2]:
+            # the barycentric weights, w_j = 1 / (x_j - x_0)...(x_j - x_n) without (x_j - x_j).
+            # in this mode c_data is not built on *add*, but only when the Newton form is needed (ex. *__str__*)
+            if backend == Interpolator.BACKENDS[1]:
+                self.__buffers['w_data'] = np.empty(Interpolator.INITIAL_CAPACITY, dtype=np.float64)
+                self.w_data = self.__buffers['w_data'][:0]
+                self.compute_handler = self.__float_barycentric_compute
+            else:
+                self.w_data = []
+                self.compute_handler = self.__barycentric_compute
+            self.c_data_adder_handler = self.__barycentric_weights_adder_handler
+        elif algorithm == Interpolator.MODES[3]:
+            # the points sorted by x with the local polynomials, c_data is not used in this mode
+            self.piecewise = PiecewiseIndex(piecewise_degree)
+            self.c_data_adder_handler = self.__piecewise_adder_handler
+            self.compute_handler = self.__piecewise_compute
+        elif algorithm == Interpolator.MODES[4]:
+            # the knots sorted by x with the cubics between them, c_data is not used in this mode
+            if spline_slopes is not None:
+                spline_slopes = tuple(map(self.number_type, spline_slopes))
+            self.spline = CubicSpline(spline_slopes)
+            self.c_data_adder_handler = self.__spline_adder_handler
+            self.compute_handler = self.__spline_compute
         else:
             raise ValueError(f"algorithm must be one of {Interpolator.MODES}")
 
@@ -41,28 +270,349 @@ class Interpolator:
         :return: [computed_value, x_differences]
         :rtype: Tuple[Fraction, Fraction]
         """
+        size = len(self.c_data)
+
+        if size == 0:
+            return 0, 1
 
-        # start by the first value of c_data if it exist
-        res = self.c_data[0] if len(self.c_data) > 0 else 0
+        self.__sync_exact_data()
 
-        # this will store the value of (x - x0)(x - x1)(x - x2)...
+        # x = p / q, x_i = X_i / D and c_i = C_i / E, so (x - x_i) = (p * D - X_i * q) / (q * D)
+        # all of this is computed over integers, and the Fraction normalization (gcd) is done only once at the end.
+        p, q = x.numerator, x.denominator
+        x_numerators, c_numerators = self.__exact_x_data.numerators, self.__exact_c_data.numerators
+        scale = q * self.__exact_x_data.denominator
+        scaled_p = p * self.__exact_x_data.denominator
+
+        # res_numerator / (E * scale^i) is the sum of the first i + 1 terms
+        res_numerator = c_numerators[0]
+
+        # this will store the numerator of (x - x0)(x - x1)(x - x2)...
         # this is where the optimization is, because using the normal method with 2 loops
         # the value of (x - x0) is computed many times and all the other values which use x
         # this variable will store them for use later.
         total_sub_x = 1
 
-        for i in range(1, len(self.c_data)):
-            total_sub_x *= (x - self.x_data[i - 1])
+        for i in range(1, size):
+            total_sub_x *= scaled_p - x_numerators[i - 1] * q
 
-            res += self.c_data[i] * total_sub_x
+            res_numerator = res_numerator * scale + c_numerators[i] * total_sub_x
 
         # add the last value of x_data because in the original compute, it is not added
-        # but we add it here because we need the x_differences with all the points from x_data
-        if len(self.x_data) > 0:
-            total_sub_x *= (x - self.x_data[-1])
+        # but we add it here because we need the x_differences with all the points from x_data.
+        # (the last point with a c value, as in "barycentric" mode c_data can be behind x_data)
+        total_sub_x *= scaled_p - x_numerators[size - 1] * q
+
+        return (Fraction(res_numerator, self.__exact_c_data.denominator * scale ** (size - 1)),
+                Fraction(total_sub_x, scale ** size))
+
+    def __decimal_compute(self, x):
+        """*__compute* for the "decimal" backend, every operation is rounded to the working precision
+
+        :param x: the value of x to be computed on the interpolation function
+        :type x: Decimal
+        :return: [computed_value, x_differences]
+        :rtype: Tuple[Decimal, Decimal]
+        """
+        size = len(self.c_data)
+
+        if size == 0:
+            return 0, 1
+
+        res = self.c_data[0]
+        total_sub_x = 1
+        for i in range(1, size):
+            total_sub_x *= x - self.x_data[i - 1]
+            res += self.c_data[i] * total_sub_x
+
+        total_sub_x *= x - self.x_data[size - 1]
 
         return res, total_sub_x
 
+    def __filtered_compute(self, x):
+        """*compute* in float64 using nested (Horner) multiplication, with a bound of its rounding error
+
+        each float operation is op(a, b) (1 + d) + e with |d| <= u and |e| <= eta (the underflow), and (x - x_i) is
+        the exact integer difference of *__compute* over its scale, so it has 3 roundings (both conversions and the
+        division). c_i goes through at most k = 5n + 2 roundings, so the error is at most
+        gamma(k) * sum(|c_i| |x - x0|...|x - xi-1|) + 3 eta * sum(|x - x0|...|x - xi-1|), with
+        gamma(k) = k u / (1 - k u), and both sums are computed with the value (and divided by 1 - gamma(k), as
+        they have no cancellation).
+
+        :param x: the value of x to be computed on the interpolation function
+        :type x: Fraction
+        :return: (value, error bound) with |P(x) - value| <= error bound, or None if the floats overflow
+        :rtype: Optional[Tuple[float, float]]
+        """
+        size = len(self.c_data)
+        if size == 0:
+            return 0.0, 0.0
+
+        self.__sync_exact_data()
+        for c in self.c_data[len(self.__float_c_data):]:
+            try:
+                self.__float_c_data.append(float(c))
+            except OverflowError:
+                self.__float_c_data.append(inf)
+
+        p, q = x.numerator, x.denominator
+        x_numerators = self.__exact_x_data.numerators
+        scale = q * self.__exact_x_data.denominator
+        scaled_p = p * self.__exact_x_data.denominator
+
+        c_data = self.__float_c_data
+        try:
+            float_scale = float(scale)
+            differences = [float(scaled_p - x_numerator * q) / float_scale for x_numerator in x_numerators[:size - 1]]
+        except OverflowError:
+            return None
+
+        # the value, the same with the absolute values, and with all the c values 1
+        res = c_data[size - 1]
+        absolute = abs(res)
+        products = 1.0
+        for i in range(size - 2, -1, -1):
+            difference = differences[i]
+            res = res * difference + c_data[i]
+            absolute = absolute * abs(difference) + abs(c_data[i])
+            products = products * abs(difference) + 1
+
+        if not (isfinite(res) and isfinite(absolute) and isfinite(products)):
+            return None
+
+        gamma = (5 * size + 2) * Interpolator.FLOAT_ROUNDOFF / (1 - (5 * size + 2) * Interpolator.FLOAT_ROUNDOFF)
+        # the few roundings of the bound itself are covered by the last factor
+        bound = ((gamma * absolute + 3 * Interpolator.FLOAT_UNDERFLOW * products) / (1 - gamma)
+                 * (1 + 16 * Interpolator.FLOAT_ROUNDOFF))
+        if not isfinite(bound):
+            return None
+
+        return res, bound
+
+    def __sync_exact_data(self):
+        """append the values of x_data and c_data that are not yet in their common denominator version
+
+        only the x values that have c values are needed by *__compute*.
+
+        :rtype: None
+        """
+        synced_size = len(self.__exact_c_data)
+        if synced_size < len(self.c_data):
+            self.__exact_x_data.extend(self.x_data[synced_size:len(self.c_data)])
+            self.__exact_c_data.extend(self.c_data[synced_size:])
+
+    def __float_compute(self, x):
+        """*__compute* for the "float64" backend, vectorized over the x_data array
+
+        :param x: the value of x to be computed on the interpolation function
+        :type x: float
+        :return: [computed_value, x_differences]
+        :rtype: Tuple[float, float]
+        """
+        if len(self.c_data) == 0:
+            return 0.0, 1.0
+
+        # (x - x0), (x - x0)(x - x1), ..., (x - x0)...(x - xn)
+        total_sub_x = np.cumprod(x - self.x_data[:len(self.c_data)])
+
+        res = self.c_data[0] + np.dot(self.c_data[1:], total_sub_x[:-1])
+
+        # return python floats, so division by zero raises *ZeroDivisionError* the same as Fraction
+        return float(res), float(total_sub_x[-1])
+
+    def __barycentric_compute(self, x):
+        """*__compute* for the "barycentric" mode, using the second (true) barycentric formula
+
+        P(x) = sum(w_j * y_j / (x - x_j)) / sum(w_j / (x - x_j))
+
+        :param x: the value of x to be computed on the interpolation function
+        :type x: Fraction
+        :return: [computed_value, None], x_differences is not needed for this mode
+        :rtype: Tuple[Fraction, None]
+        """
+        numerator = denominator = 0
+
+        for old_x, old_y, w in zip(self.x_data, self.y_data, self.w_data):
+            x_difference = x - old_x
+
+            # the formula is not defined at the nodes, but the result is known
+            if x_difference == 0:
+                return old_y, None
+
+            w_over_difference = w / x_difference
+            numerator += w_over_difference * old_y
+            denominator += w_over_difference
+
+        return (numerator / denominator if denominator else 0), None
+
+    def __float_barycentric_compute(self, x):
+        """*__barycentric_compute* for the "float64" backend, vectorized over the x_data array
+
+        :param x: the value of x to be computed on the interpolation function
+        :type x: float
+        :return: [computed_value, None], x_differences is not needed for this mode
+        :rtype: Tuple[float, None]
+        """
+        if len(self.x_data) == 0:
+            return 0.0, None
+
+        x_differences = x - self.x_data
+
+        exact = np.flatnonzero(x_differences == 0)
+        if len(exact):
+            return float(self.y_data[exact[0]]), None
+
+        w_over_differences = self.w_data / x_differences
+
+        return float(np.dot(w_over_differences, self.y_data) / np.sum(w_over_differences)), None
+
+    @staticmethod
+    def __float_barycentric_many(x_data, y_data, w_data, xs):
+        """*__float_barycentric_compute* vectorized over xs, in chunks of xs so the differences are not too large
+
+        the values of xs at the nodes are found by a binary search in the sorted x_data, and the numerator and the
+        denominator of the formula are found by one product of the 1 / (x - x_j) with (w_j y_j, w_j).
+
+        :param x_data: the x values
+        :type x_data: np.ndarray
+        :param y_data: the y values
+        :type y_data: np.ndarray
+        :param w_data: the (scaled) barycentric weights
+        :type w_data: np.ndarray
+        :param xs: inputs
+        :type xs: np.ndarray
+        :rtype: np.ndarray
+        """
+        res = np.zeros_like(xs)
+        if len(x_data) == 0:
+            return res
+
+        weighted = np.stack((w_data * y_data, w_data), axis=1)
+
+        # the rows of a chunk fit in the cache together
+        chunk = max(1, Interpolator.BARYCENTRIC_CHUNK_SIZE // len(x_data))
+        for i in range(0, len(xs), chunk):
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                sums = np.reciprocal(xs[i:i + chunk, np.newaxis] - x_data) @ weighted
+                res[i:i + chunk] = sums[:, 0] / sums[:, 1]
+
+        # the formula is not defined at the nodes, but the result is known
+        order = np.argsort(x_data, kind='stable')
+        sorted_x_data = x_data[order]
+        indices = np.minimum(np.searchsorted(sorted_x_data, xs), len(x_data) - 1)
+        at_nodes = sorted_x_data[indices] == xs
+        res[at_nodes] = y_data[order[indices[at_nodes]]]
+
+        return res
+
+    @staticmethod
+    def __to_float(x):
+        """convert the input to float, going through Fraction to accept the same inputs (ex. '1/3')
+
+        :param x: input number
+        :type x: Any
+        :rtype: float
+        """
+        return float(Fraction(x))
+
+    def __to_decimal(self, x):
+        """convert the input to Decimal rounded to the working precision, going through Fraction to accept the
+        same inputs (ex. '1/3')
+
+        :param x: input number
+        :type x: Any
+        :rtype: Decimal
+        """
+        if isinstance(x, Decimal):
+            return self.decimal_context.plus(x)
+
+        x = Fraction(x)
+        return self.decimal_context.divide(Decimal(x.numerator), Decimal(x.denominator))
+
+    def __append(self, name, value):
+        """append a value to one of the data arrays of the "float64" backend
+
+        the buffers grow by doubling, so appending is amortized O(1) and the data stays contiguous.
+
+        :param name: name of the data array (x_data, y_data or c_data)
+        :type name: str
+        :param value: the value to be appended
+        :type value: float
+        :rtype: None
+        """
+        buffer = self.__buffers[name]
+        size = len(getattr(self, name))
+
+        if size == len(buffer):
+            buffer = np.resize(buffer, size * 2)
+            self.__buffers[name] = buffer
+
+        buffer[size] = value
+        setattr(self, name, buffer[:size + 1])
+
+    def __extend(self, name, values):
+        """append many values to one of the data arrays (x_data, y_data, c_data or w_data) based on the backend
+
+        :param name: name of the data array
+        :type name: str
+        :param values: the values to be appended
+        :type values: list
+        :rtype: None
+        """
+        if self.backend != Interpolator.BACKENDS[1]:
+            getattr(self, name).extend(values)
+            return
+
+        buffer = self.__buffers[name]
+        size = len(getattr(self, name))
+        new_size = size + len(values)
+
+        if new_size > len(buffer):
+            buffer = np.resize(buffer, max(new_size, len(buffer) * 2))
+            self.__buffers[name] = buffer
+
+        buffer[size:new_size] = values
+        setattr(self, name, buffer[:new_size])
+
+    def __delete(self, name, index):
+        """delete a value from one of the data arrays of the "float64" backend, keeping the data contiguous
+
+        :param name: name of the data array
+        :type name: str
+        :param index: index of the value to be deleted
+        :type index: int
+        :rtype: None
+        """
+        buffer = self.__buffers[name]
+        size = len(getattr(self, name))
+
+        buffer[index:size - 1] = buffer[index + 1:size]
+        setattr(self, name, buffer[:size - 1])
+
+    def __truncate_c(self, size):
+        """remove the values of c_data starting from *size*
+
+        :param size: the new size of c_data
+        :type size: int
+        :rtype: None
+        """
+        if self.backend == Interpolator.BACKENDS[1]:
+            self.c_data = self.__buffers['c_data'][:min(size, len(self.c_data))]
+        else:
+            del self.c_data[size:]
+            if self.backend == Interpolator.BACKENDS[0]:
+                self.__exact_x_data.truncate(size)
+                self.__exact_c_data.truncate(size)
+                del self.__float_c_data[size:]
+
+        # the expanded coefficients include the removed c values, so they are built again when needed
+        if size < self.__polynomial_size:
+            self.__polynomial = None
+            self.__polynomial_basis = None
+            self.__polynomial_size = 0
+            self.__exact_polynomial = None
+        self.__integer_polynomial = None
+
     def __divide_c_data_adder_handler(self, x, y):
         """function that handles adding the new value of **c** for the divide algorithm
 
@@ -74,27 +624,212 @@ class Interpolator:
         """
         # if this is the first point, then just add it straight
         if self.size() == 0:
-            self.c_data.append(y)
-            self.in_c_data.append(y)
+            self.__append_c(y)
+            self.in_c_data = np.array([y]) if self.backend == Interpolator.BACKENDS[1] else [y]
         else:
-            current_bottom = y
-            new_in_c = [current_bottom]
-
-            # the x_data is reversed and used with the c_data
-            for old_x, old_in_c in zip(self.x_data[::-1], self.in_c_data):
-                # compute the next stage of the new c_data
-                current_bottom = (current_bottom - old_in_c) / (x - old_x)
-                new_in_c.append(current_bottom)
+            new_in_c = self.__divided_differences_row(x, y, self.__as_list(self.x_data), self.__as_list(self.in_c_data))
+            current_bottom = new_in_c[-1]
 
             # add the last item to the real c data.
-            self.c_data.append(current_bottom)
+            self.__append_c(current_bottom)
 
             # if this is the newton's method, 'in_c_data' should not be defined
             if 'in_c_data' in dir(self):
-                self.in_c_data = new_in_c
+                self.in_c_data = np.array(new_in_c) if self.backend == Interpolator.BACKENDS[1] else new_in_c
             else:
                 raise ValueError("divide algorithm handler is used, but the class structure is wrong")
 
+    @staticmethod
+    def __divided_differences_row(x, y, old_x_data, old_row):
+        """compute the divided differences row (diagonal) of a new point from the row of the point before it
+
+        the row of the point x_i is [y_i, f[x_i, x_i-1], ..., f[x_i, ..., x_0]], and its last item is c_i.
+
+        unlike *__compute*, this stays with Fraction arithmetic: the values of a row have unrelated denominators,
+        so a common denominator (*CommonDenominatorArray*) grows with each of them, and the integer version of the
+        same recurrence is slower than Fraction, which reduces the small gcds before multiplying. the bulk
+        builds of many points can use the "modular" engine instead (see *add_many*).
+
+        :param x: point x
+        :type x: Fraction
+        :param y: point y
+        :type y: Fraction
+        :param old_x_data: the x values of the points before this one
+        :type old_x_data: list
+        :param old_row: the row of the point before this one
+        :type old_row: list
+        :return: the row of the new point
+        :rtype: list
+        """
+        current_bottom = y
+        row = [current_bottom]
+
+        # the x_data is reversed and used with the old row
+        for old_x, old_in_c in zip(old_x_data[::-1], old_row):
+            # compute the next stage of the new row
+            current_bottom = (current_bottom - old_in_c) / (x - old_x)
+            row.append(current_bottom)
+
+        return row
+
+    def __barycentric_weights_adder_handler(self, x, y):
+        """function that handles adding the new barycentric weight for the barycentric algorithm
+
+        every old weight w_j is divided by (x_j - x), and the new weight is 1 / (x - x_0)...(x - x_n-1)
+        which is O(n) for each new point.
+
+        :param x: point x
+        :type x: Fraction
+        :param y: point y
+        :type y: Fraction
+        :rtype: None
+        """
+        if self.backend == Interpolator.BACKENDS[1]:
+            if np.any(self.x_data == x):
+                raise ZeroDivisionError
+
+            if len(self.x_data) == 0:
+                self.__append('w_data', 1.0)
+                return
+
+            # the old weights are changed in place, this is safe as the duplicate check is done
+            self.w_data /= self.x_data - x
+
+            # the weights are scaled (see *__normalize_weights*), so the new weight is found from the largest old
+            # one, w / w_k = -(x_k - x_0)...(x_k - x_n-1) / (x - x_0)...(x - x_n-1) without the (x_k - x_k) and
+            # (x - x_k) factors, as a mantissa and an exponent as the products can overflow
+            k = int(np.argmax(np.abs(self.w_data)))
+            other_x_data = np.delete(self.x_data, k)
+            mantissa, exponent = Interpolator.__float_product((self.x_data[k] - other_x_data) / (x - other_x_data))
+            self.__normalize_weights(-mantissa * self.w_data[k], exponent)
+        else:
+            # build the new weights first, so the old ones are not broken if x is duplicate
+            new_w_data = [w / (old_x - x) for old_x, w in zip(self.x_data, self.w_data)]
+
+            new_w = self.number_type(1)
+            for old_x in self.x_data:
+                new_w *= x - old_x
+            new_w_data.append(1 / new_w)
+
+            self.w_data = new_w_data
+
+    @staticmethod
+    def __float_product(values):
+        """the product of many floats as (mantissa, exponent) with product = mantissa * 2^exponent, which does not
+        overflow or underflow
+
+        :param values: the factors, not zero
+        :type values: np.ndarray
+        :rtype: Tuple[float, int]
+        """
+        mantissa, exponent = 1.0, 0
+        # the mantissas are at least 1/2, so the product of a chunk of them is a normal float
+        for i in range(0, len(values), 256):
+            chunk_mantissas, chunk_exponents = np.frexp(values[i:i + 256])
+            mantissa, shift = frexp(mantissa * float(np.prod(chunk_mantissas)))
+            exponent += int(chunk_exponents.sum()) + shift
+
+        return mantissa, exponent
+
+    def __normalize_weights(self, mantissa=None, exponent=0):
+        """scale the "float64" barycentric weights so that the largest one is less than 1, optionally appending the
+        weight mantissa * 2^exponent with the same scale
+
+        the weights of many points are very large or very small (about 2^n / n over the width of the points for
+        Chebyshev points), so they would overflow. the barycentric formula does not change when all the weights are
+        scaled by the same factor, which is a power of 2 here, so the scaling is exact.
+
+        :param mantissa: the mantissa of the new weight, None to only scale the weights
+        :type mantissa: Optional[float]
+        :param exponent: the exponent of the new weight
+        :type exponent: int
+        :rtype: None
+        """
+        largest = float(np.max(np.abs(self.w_data))) if len(self.w_data) else 0.0
+        shift = frexp(largest)[1] if largest else None
+        if mantissa is not None:
+            mantissa, new_exponent = frexp(mantissa)
+            exponent += new_exponent
+            shift = exponent if shift is None else max(shift, exponent)
+
+        if shift is None:
+            return
+
+        np.ldexp(self.w_data, -shift, out=self.w_data)
+        if mantissa is not None:
+            self.__append('w_data', ldexp(mantissa, exponent - shift))
+
+    def __piecewise_adder_handler(self, x, y):
+        """function that handles adding the new point to the sorted index of the piecewise algorithm
+
+        :param x: point x
+        :type x: Fraction
+        :param y: point y
+        :type y: Fraction
+        :rtype: None
+        """
+        self.piecewise.insert(x, y)
+
+    def __piecewise_compute(self, x):
+        """*__compute* for the "piecewise" mode, using the local polynomial around x
+
+        :param x: the value of x to be computed on the interpolation function
+        :type x: Fraction
+        :return: [computed_value, None], x_differences is not needed for this mode
+        :rtype: Tuple[Fraction, None]
+        """
+        return self.piecewise.compute(x), None
+
+    def __spline_adder_handler(self, x, y):
+        """function that handles adding the new knot to the spline, it is solved again on the next compute
+
+        :param x: point x
+        :type x: Fraction
+        :param y: point y
+        :type y: Fraction
+        :rtype: None
+        """
+        self.spline.insert(x, y)
+
+    def __spline_compute(self, x):
+        """*__compute* for the "spline" mode, using the cubic of the interval of x
+
+        :param x: the value of x to be computed on the interpolation function
+        :type x: Fraction
+        :return: [computed_value, None], x_differences is not needed for this mode
+        :rtype: Tuple[Fraction, None]
+        """
+        return self.spline.compute(x), None
+
+    def degree(self):
+        """ Get the degree of the interpolation function
+
+        :return: the degree of the polynomial, or of the local polynomials for the "piecewise" and "spline" modes
+        :rtype: int
+        """
+        if self.algorithm == Interpolator.MODES[3]:
+            return min(self.piecewise.degree, self.size() - 1)
+        if self.algorithm == Interpolator.MODES[4]:
+            return min(3, self.size() - 1)
+
+        return self.size() - 1
+
+    @_in_decimal_context
+    def __sync_c_data(self):
+        """build the missing values of c_data, which is only needed for the "barycentric" mode
+
+        as c_i only depends on the first i + 1 points, the missing values are added using the newton's algorithm
+        from where c_data stopped.
+
+        :rtype: None
+        """
+        # there is no global Newton form for the "piecewise" and "spline" modes
+        if self.algorithm in Interpolator.MODES[3:]:
+            return
+
+        for i in range(len(self.c_data), self.size()):
+            self.__newton_c_data_adder_handler(self.x_data[i], self.y_data[i])
+
     def __newton_c_data_adder_handler(self, x, y):
         """function that handles adding the new value of **c** for the newton's algorithm
 
@@ -107,9 +842,22 @@ class Interpolator:
         :type y: Fraction
         :rtype: None
         """
-        old_computed, x_differences = self.__compute(x)
-        self.c_data.append((y - old_computed) / x_differences)
+        old_computed, x_differences = self.newton_compute_handler(x)
+        self.__append_c((y - old_computed) / x_differences)
+
+    def __append_c(self, c):
+        """append a new value of **c** to c_data based on the backend
+
+        :param c: the new value of c
+        :type c: Union[Fraction, float]
+        :rtype: None
+        """
+        if self.backend == Interpolator.BACKENDS[1]:
+            self.__append('c_data', c)
+        else:
+            self.c_data.append(c)
 
+    @_in_decimal_context
     def add(self, x, y):
         """Add pair (x, y) to the interpolation memory
 
@@ -119,67 +867,1281 @@ class Interpolator:
         :type y: Fraction
         :rtype: None
         """
-        # convert the input to Fraction whatever it is.
-        x, y = map(Fraction, (x, y))
+        # convert the input to the backend number type (Fraction by default) whatever it is.
+        x, y = map(self.number_type, (x, y))
         try:
             # call the data handler, this should change based on the algorithm
             self.c_data_adder_handler(x, y)
         except ZeroDivisionError:
             # if there is division by zero, then this means there is duplicate in x values.
             raise ArithmeticError(f"this value of x ({x}) already exists")
+
+        # keep the divided differences table up to date, if it was built by *remove* or *update*
+        if self.dd_table is not None:
+            if 'in_c_data' in dir(self):
+                # the "divide" algorithm already computed the row of this point
+                self.dd_table.append(list(self.__as_list(self.in_c_data)))
+            else:
+                old_row = self.dd_table[-1] if self.dd_table else []
+                self.dd_table.append(self.__divided_differences_row(x, y, self.__as_list(self.x_data), old_row))
+
         # after c value is added, add x and y, adding them after c is important, because calculating c value uses
         # the past x, y values
-        self.x_data.append(x)
-        self.y_data.append(y)
+        if self.backend == Interpolator.BACKENDS[1]:
+            self.__append('x_data', x)
+            self.__append('y_data', y)
+        else:
+            self.x_data.append(x)
+            self.y_data.append(y)
 
-    def size(self):
-        """ Get the size of the interpolation dataset
+        self.version += 1
 
-        :return: size of the dataset stored in the interpolation memory
-        :rtype: int
-        """
-        return len(self.x_data)
+    @_in_decimal_context
+    def add_many(self, xs, ys, order=ORDERS[0], engine=ENGINES[0], workers=1):
+        """Add many pairs (x, y) to the interpolation memory at once
 
-    def compute(self, x):
-        """Pass value x to the interpolation function and get the result
+        the result is the same as calling *add* for each pair, but the new c values are built column by column of
+        the divided differences table, which is a single (vectorized for "float64") pass over each column.
+        if any of the x values already exists, nothing is added.
 
-        :param x: input
-        :type x: Fraction
-        :return: result of the compute
-        :rtype: Fraction
-        """
-        return self.__compute(x)[0]
+        the Newton form depends on the order of the points, with "leja" order the points are added so that each
+        one is the farthest from the ones before it, which keeps the c values smaller (and more stable in
+        "float64"). x_data stores the points in the order they were added.
 
-    def __str__(self):
-        """Build the interpolation representation as a string and return it
+        with the "modular" engine, the exact c values of "newton" and "divide" are computed modulo many primes and
+        reconstructed (see *lib/modular*), which gives the same values unless the probabilistic check of the
+        reconstruction fails. it is faster for "newton" with many points on a grid, but not for "divide", which also
+        reconstructs the last row. it is ignored by the other algorithms and backends, and after *remove* or
+        *update* (which keep the whole table).
 
-        :return: string representation of the interpolation
-        :rtype: str
+        :param xs: points x
+        :type xs: Union[list, np.ndarray]
+        :param ys: points y
+        :type ys: Union[list, np.ndarray]
+        :param order: the order of adding the points from the list *Interpolator.ORDERS*
+        :type order: str
+        :param engine: the arithmetic of the exact c values from the list *Interpolator.ENGINES*
+        :type engine: str
+        :param workers: the number of processes of the "modular" engine
+        :type workers: int
+        :rtype: None
         """
-        res = []
+        if order not in Interpolator.ORDERS:
+            raise ValueError(f"order argument must be one of {Interpolator.ORDERS}")
+        if engine not in Interpolator.ENGINES:
+            raise ValueError(f"engine argument must be one of {Interpolator.ENGINES}")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
 
-        # the size of the interpolation
-        c_data_len = len(self.c_data)
+        xs, ys = list(map(self.number_type, xs)), list(map(self.number_type, ys))
+        if len(xs) != len(ys):
+            raise ValueError("xs and ys must have the same length")
 
-        for i in range(c_data_len):
-            current_c = self.c_data[i]
+        # check for duplicates once, before changing anything
+        seen = set(self.__as_list(self.x_data))
+        for x in xs:
+            if x in seen:
+                raise ArithmeticError(f"this value of x ({x}) already exists")
+            seen.add(x)
 
-            # if the current value is zero, then there is no need to print it as it will cancel out with the zero
-            if current_c == 0:
-                continue
+        if not xs:
+            return
 
-            sub_res = str(current_c)
+        if order == Interpolator.ORDERS[1]:
+            leja_order = self.__leja_order(xs)
+            xs, ys = [xs[i] for i in leja_order], [ys[i] for i in leja_order]
 
-            for j in range(i):
-                sub_res += f'(x - {self.x_data[j]})'
+        self.version += 1
 
-            res.append(sub_res)
+        # the spline is sorted once, and solved on the next compute
+        if self.algorithm == Interpolator.MODES[4]:
+            self.spline.insert_many(xs, ys)
+            self.__extend('x_data', xs)
+            self.__extend('y_data', ys)
+            return
 
-        final = ' + '.join(res)
+        if (engine == Interpolator.ENGINES[1] and self.algorithm in Interpolator.MODES[:2]
+                and self.backend == Interpolator.BACKENDS[0] and self.dd_table is None):
+            # the divided differences of all the points are computed again, and only the new c values are kept
+            new_c, last_row = modular_divided_differences(self.x_data + xs, self.y_data + ys, self.size(),
+                                                          self.algorithm == Interpolator.MODES[1], workers)
+            self.c_data.extend(new_c)
+            if last_row is not None:
+                self.in_c_data = last_row
+            self.__extend('x_data', xs)
+            self.__extend('y_data', ys)
+            return
 
-        # if there is a data, but all of them cancel out, then just return zero
-        if not final and c_data_len > 0:
-            final = '0'
+        # the barycentric weights are O(n) and the piecewise index is O(log n) for each point anyway, and the exact
+        # newton's algorithm over a common denominator (see *__compute*) is faster than building the columns with
+        # Fraction operations
+        is_exact_newton = (self.algorithm == Interpolator.MODES[0] and self.backend == Interpolator.BACKENDS[0]
+                           and self.dd_table is None)
+        if self.algorithm in Interpolator.MODES[2:] or is_exact_newton:
+            for x, y in zip(xs, ys):
+                self.c_data_adder_handler(x, y)
+                self.__extend('x_data', [x])
+                self.__extend('y_data', [y])
+            return
+
+        old_size = self.size()
+        boundary_row = None
+        if self.dd_table:
+            boundary_row = self.dd_table[-1]
+        elif 'in_c_data' in dir(self):
+            boundary_row = self.__as_list(self.in_c_data)
+
+        if boundary_row is not None or old_size == 0:
+            # continue the divided differences table from the row of the last point
+            new_c, last_row, rows = self.__divided_differences_columns(
+                self.__as_list(self.x_data) + xs, old_size, ys, boundary_row or [], self.dd_table is not None)
+        else:
+            # the newton's algorithm does not keep the last row, so instead the new points are shifted by the old
+            # interpolation, r_i = (y_i - P(x_i)) / (x_i - x_0)...(x_i - x_n-1) = f[x_0, ..., x_n-1, x_i]
+            # and the divided differences of r over the new points only are the new c values.
+            if self.backend == Interpolator.BACKENDS[1]:
+                new_xs = np.array(xs)
+                x_differences = np.ones_like(new_xs)
+                for old_x in self.x_data:
+                    x_differences *= new_xs - old_x
+                residuals = ((np.array(ys) - self.compute_many(new_xs)) / x_differences).tolist()
+            else:
+                residuals = []
+                for x, y in zip(xs, ys):
+                    old_computed, x_differences = self.newton_compute_handler(x)
+                    residuals.append((y - old_computed) / x_differences)
+
+            new_c, last_row, rows = self.__divided_differences_columns(xs, 0, residuals, [], False)
+
+        if self.backend == Interpolator.BACKENDS[1]:
+            self.__extend('c_data', new_c)
+        else:
+            self.c_data.extend(new_c)
+
+        if 'in_c_data' in dir(self):
+            self.in_c_data = np.array(last_row) if self.backend == Interpolator.BACKENDS[1] else last_row
+        if rows is not None:
+            self.dd_table.extend(rows)
+
+        self.__extend('x_data', xs)
+        self.__extend('y_data', ys)
+
+    def __leja_order(self, xs):
+        """get the Leja order of the new points, each point maximizes the product of its distances to the points
+        before it (the old points, then the new points already chosen)
+
+        the order is only a heuristic, so the distances are computed in float as sums of logarithms.
+
+        :param xs: the new points x
+        :type xs: list
+        :return: the indices of xs in Leja order
+        :rtype: List[int]
+        """
+        candidates = np.array([float(x) for x in xs])
+
+        with np.errstate(divide='ignore'):
+            log_distances = np.zeros_like(candidates)
+            for old_x in self.__as_list(self.x_data):
+                log_distances += np.log(np.abs(candidates - float(old_x)))
+
+            order = []
+            remaining = np.ones(len(candidates), dtype=bool)
+            for _ in range(len(candidates)):
+                remaining_indices = np.flatnonzero(remaining)
+
+                # without old points, start from the point with the largest absolute value
+                if not order and self.size() == 0:
+                    chosen = int(np.argmax(np.abs(candidates)))
+                else:
+                    chosen = int(remaining_indices[np.argmax(log_distances[remaining_indices])])
+
+                order.append(chosen)
+                remaining[chosen] = False
+                log_distances += np.log(np.abs(candidates - candidates[chosen]))
+
+        return order
+
+    def __divided_differences_columns(self, x_data, start, values, boundary_row, keep_rows):
+        """build the divided differences of the points from *start* to the end, one column at a time
+
+        column j has the values f[x_i-j, ..., x_i] of the new points, and it is computed from column j - 1, using
+        the row of the point before *start* (boundary_row) for the first new point.
+
+        :param x_data: all the x values, the old ones then the new ones
+        :type x_data: list
+        :param start: index of the first new point
+        :type start: int
+        :param values: the y values of the new points (column 0)
+        :type values: list
+        :param boundary_row: the divided differences row of the point before *start* (see *__divided_differences_row*)
+        :type boundary_row: list
+        :param keep_rows: whether to return the full rows of the new points
+        :type keep_rows: bool
+        :return: [c values of the new points, the row of the last point, the rows of the new points or None]
+        :rtype: Tuple[list, list, Optional[list]]
+        """
+        size = len(x_data)
+        is_float = self.backend == Interpolator.BACKENDS[1]
+
+        if is_float:
+            x_data = np.array(x_data)
+            column = np.array(values)
+        else:
+            column = list(values)
+
+        new_c = [column[0]] if start == 0 else []
+        last_row = [column[-1]]
+        rows = [[value] for value in column] if keep_rows else None
+
+        for j in range(1, size):
+            first = max(start, j)
+
+            # the values of column j - 1 at i - 1 for i from *first*
+            if j <= start:
+                if is_float:
+                    lower = np.concatenate(([boundary_row[j - 1]], column[:-1]))
+                else:
+                    lower = [boundary_row[j - 1]] + column[:-1]
+                upper = column
+            else:
+                lower = column[:-1]
+                upper = column[1:]
+
+            if is_float:
+                column = (upper - lower) / (x_data[first:] - x_data[first - j:size - j])
+            else:
+                column = [(a - b) / (x - old_x)
+                          for a, b, x, old_x in zip(upper, lower, x_data[first:], x_data[first - j:size - j])]
+
+            # the first item of the columns after the old points is f[x_0, ..., x_j] which is c_j
+            if j >= start:
+                new_c.append(column[0])
+            last_row.append(column[-1])
+            if keep_rows:
+                for i in range(first, size):
+                    rows[i - start].append(column[i - first])
+
+        if is_float:
+            new_c, last_row = [float(c) for c in new_c], [float(value) for value in last_row]
+            if keep_rows:
+                rows = [[float(value) for value in row] for row in rows]
+
+        return new_c, last_row, rows
+
+    @_in_decimal_context
+    def restore(self, x_data, y_data, c_data, in_c_data=None, w_data=None):
+        """Set the interpolation memory from a saved state, without computing anything
+
+        this is used to load snapshots (see *lib/snapshot*), the interpolator must be empty and the values must be
+        the ones of an interpolator with the same algorithm and backend.
+
+        the values can also be lazy sections, which have a length and a *decode* method that returns the list of
+        values. in the "newton", "divide" and "barycentric" modes they are only decoded when the attribute is used
+        the first time (see *__getattr__*), so loading a snapshot does not decode the values that are not needed,
+        ex. y_data and in_c_data are not needed by *compute*.
+
+        :param x_data: points x
+        :type x_data: Union[list, np.ndarray]
+        :param y_data: points y
+        :type y_data: Union[list, np.ndarray]
+        :param c_data: the c values, can be less than the points in "barycentric" mode
+        :type c_data: Union[list, np.ndarray]
+        :param in_c_data: the last divided differences row for "divide" mode
+        :type in_c_data: Optional[Union[list, np.ndarray]]
+        :param w_data: the barycentric weights for "barycentric" mode
+        :type w_data: Optional[Union[list, np.ndarray]]
+        :rtype: None
+        """
+        if self.size():
+            raise ValueError("the state can only be restored into an empty interpolator")
+
+        if len(x_data) != len(y_data) or len(c_data) > len(x_data):
+            raise ValueError("the sizes of the state data do not match")
+
+        data = {'x_data': x_data, 'y_data': y_data, 'c_data': c_data}
+        if self.algorithm == Interpolator.MODES[1]:
+            if in_c_data is None or len(in_c_data) != len(x_data):
+                raise ValueError("in_c_data must be provided for the divide algorithm")
+            data['in_c_data'] = in_c_data
+        elif self.algorithm == Interpolator.MODES[2]:
+            if w_data is None or len(w_data) != len(x_data):
+                raise ValueError("w_data must be provided for the barycentric algorithm")
+            data['w_data'] = w_data
+        elif self.algorithm in Interpolator.MODES[3:]:
+            x_data = data['x_data'] = Interpolator.__decoded(x_data)
+            y_data = data['y_data'] = Interpolator.__decoded(y_data)
+            if self.algorithm == Interpolator.MODES[3]:
+                for x, y in zip(x_data, y_data):
+                    self.piecewise.insert(self.number_type(x), self.number_type(y))
+            else:
+                self.spline.insert_many(list(map(self.number_type, x_data)), list(map(self.number_type, y_data)))
+        elif len(c_data) != len(x_data):
+            raise ValueError("the sizes of the state data do not match")
+
+        for name, values in data.items():
+            if callable(getattr(values, 'decode', None)):
+                if self.algorithm in Interpolator.MODES[:3]:
+                    delattr(self, name)
+                    self.__lazy_data[name] = values.decode
+                    continue
+                values = values.decode()
+
+            if name == 'in_c_data':
+                self.in_c_data = np.array(values) if self.backend == Interpolator.BACKENDS[1] else list(values)
+            else:
+                self.__extend(name, values)
+
+        self.version += 1
+
+    @staticmethod
+    def __decoded(values):
+        """the list of values of a lazy section (see *restore*), other values are returned as they are"""
+        return values.decode() if callable(getattr(values, 'decode', None)) else values
+
+    def __getattr__(self, name):
+        """decode a lazy section of *restore* when it is used the first time, this is only called for the
+        attributes that are not set, so there is no cost after that
+        """
+        lazy_data = self.__dict__.get('_Interpolator__lazy_data')
+        if not lazy_data or name not in lazy_data:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        values = lazy_data.pop(name)()
+        setattr(self, name, values)
+        return values
+
+    def __dir__(self):
+        # the sections that are not decoded yet are attributes as well (ex. 'in_c_data' shows the "divide" mode)
+        return list(super().__dir__()) + list(self.__dict__.get('_Interpolator__lazy_data', ()))
+
+    @_in_decimal_context
+    def remove(self, x):
+        """Remove the point with the value x from the interpolation memory
+
+        only the c values of the points after it are recomputed.
+
+        :param x: point x
+        :type x: Fraction
+        :rtype: None
+        """
+        index = self.__index_of(x)
+
+        if self.algorithm == Interpolator.MODES[3]:
+            self.piecewise.remove(self.x_data[index])
+        elif self.algorithm == Interpolator.MODES[4]:
+            self.spline.remove(self.x_data[index])
+
+        if self.algorithm == Interpolator.MODES[2]:
+            # remove the (x_j - x) factor from the weights of the other points
+            if self.backend == Interpolator.BACKENDS[1]:
+                self.w_data *= self.x_data - self.x_data[index]
+                self.__delete('w_data', index)
+                self.__normalize_weights()
+            else:
+                removed_x = self.x_data[index]
+                del self.w_data[index]
+                self.w_data = [w * (old_x - removed_x)
+                               for old_x, w in zip(self.x_data[:index] + self.x_data[index + 1:], self.w_data)]
+
+        if self.backend == Interpolator.BACKENDS[1]:
+            self.__delete('x_data', index)
+            self.__delete('y_data', index)
+        else:
+            del self.x_data[index]
+            del self.y_data[index]
+
+        self.__rebuild_from(index)
+        self.version += 1
+
+    @_in_decimal_context
+    def update(self, x, new_y):
+        """Change the y value of the point with the value x in the interpolation memory
+
+        only the c values of this point and the points after it are recomputed.
+
+        :param x: point x
+        :type x: Fraction
+        :param new_y: the new value of y
+        :type new_y: Fraction
+        :rtype: None
+        """
+        index = self.__index_of(x)
+
+        self.y_data[index] = self.number_type(new_y)
+
+        if self.algorithm == Interpolator.MODES[3]:
+            self.piecewise.update(self.x_data[index], self.y_data[index])
+        elif self.algorithm == Interpolator.MODES[4]:
+            self.spline.update(self.x_data[index], self.y_data[index])
+
+        self.__rebuild_from(index)
+        self.version += 1
+
+    def __index_of(self, x):
+        """get the index of the point with the value x
+
+        :param x: point x
+        :type x: Fraction
+        :return: the index of the point in x_data
+        :rtype: int
+        """
+        x = self.number_type(x)
+
+        if self.backend == Interpolator.BACKENDS[1]:
+            indices = np.flatnonzero(self.x_data == x)
+            if len(indices):
+                return int(indices[0])
+        elif x in self.x_data:
+            return self.x_data.index(x)
+
+        raise ValueError(f"this value of x ({x}) does not exist")
+
+    def __rebuild_from(self, index):
+        """recompute the c values of the points starting from *index*, the points before it are not affected
+
+        the rows of the divided differences table before *index* are kept, and the rest is recomputed, each row
+        from the row before it. if the table does not exist, the unaffected rows are built first.
+
+        :param index: the index of the first changed point
+        :type index: int
+        :rtype: None
+        """
+        self.__truncate_c(index)
+
+        # the barycentric weights do not depend on y, and the c values are built when needed.
+        # and the "piecewise" and "spline" modes do not use c_data
+        if self.algorithm in Interpolator.MODES[2:]:
+            return
+
+        x_data, y_data = self.__as_list(self.x_data), self.__as_list(self.y_data)
+
+        if self.dd_table is None:
+            self.dd_table = []
+            for i in range(index):
+                old_row = self.dd_table[-1] if self.dd_table else []
+                self.dd_table.append(self.__divided_differences_row(x_data[i], y_data[i], x_data[:i], old_row))
+        else:
+            del self.dd_table[index:]
+
+        for i in range(index, len(x_data)):
+            old_row = self.dd_table[-1] if self.dd_table else []
+            row = self.__divided_differences_row(x_data[i], y_data[i], x_data[:i], old_row)
+            self.dd_table.append(row)
+            self.__append_c(row[-1])
+
+        if 'in_c_data' in dir(self):
+            in_c_data = self.dd_table[-1] if self.dd_table else []
+            self.in_c_data = np.array(in_c_data) if self.backend == Interpolator.BACKENDS[1] else list(in_c_data)
+
+    def __as_list(self, data):
+        """get the data as a python list, which is faster to loop over than numpy arrays
+
+        :param data: one of the data arrays
+        :type data: Union[list, np.ndarray]
+        :rtype: list
+        """
+        return data.tolist() if self.backend == Interpolator.BACKENDS[1] else data
+
+    def size(self):
+        """ Get the size of the interpolation dataset
+
+        :return: size of the dataset stored in the interpolation memory
+        :rtype: int
+        """
+        return len(self.x_data)
+
+    @_in_decimal_context
+    def compute(self, x):
+        """Pass value x to the interpolation function and get the result
+
+        :param x: input
+        :type x: Fraction
+        :return: result of the compute
+        :rtype: Fraction
+        """
+        x = self.number_type(x)
+
+        if self.cache_size:
+            # the results of the older versions of the data are not valid anymore
+            if self.__cache_version != self.version:
+                self.__cache.clear()
+                self.__cache_version = self.version
+
+            if x in self.__cache:
+                self.cache_hits += 1
+                self.__cache.move_to_end(x)
+                return self.__cache[x]
+
+            self.cache_misses += 1
+            res = self.__compute_handler_dispatch(x)
+
+            self.__cache[x] = res
+            if len(self.__cache) > self.cache_size:
+                # remove the least recently used result
+                self.__cache.popitem(last=False)
+
+            return res
+
+        return self.__compute_handler_dispatch(x)
+
+    def __compute_handler_dispatch(self, x):
+        """choose how to compute x, this is the uncached version of *compute*
+
+        :param x: input
+        :type x: Fraction
+        :return: result of the compute
+        :rtype: Fraction
+        """
+        # if the expanded coefficients are used, they are faster to evaluate exactly using Horner.
+        # this is not done for "float64", as the power basis is less stable than the Newton form.
+        if self.__polynomial is not None and self.backend == Interpolator.BACKENDS[0]:
+            return self.__polynomial_compute(x)
+
+        return self.compute_handler(x)[0]
+
+    @_in_decimal_context
+    def approx(self, x, digits, with_exact=False):
+        """Compute x rounded to *digits* significant digits, the same as rounding the result of *compute*
+
+        for the "fraction" backend with the Newton form ("newton" and "divide"), the result is first computed in
+        float64 with a bound of its error (see *__filtered_compute*). if all the values within the bound round to
+        the same decimal, it is the rounded exact result, so the exact computation is only done when they do not
+        (filter_hits and filter_misses count both cases).
+
+        a rounded result that ends with a zero digit is computed exactly if it is within the bound, as the exact
+        result could be it, which is written shorter (ex. 0.1 and not 0.100000 for 1/10) by the decimal division of
+        the exact fraction.
+
+        :param x: input
+        :type x: Fraction
+        :param digits: the number of significant digits
+        :type digits: int
+        :param with_exact: also return the result of *compute* if it was computed, so it is not computed again
+        :type with_exact: bool
+        :return: the rounded result, and with *with_exact* the result of *compute* or None when the filter gave the
+                 rounded result without it
+        :rtype: Union[Decimal, Tuple[Decimal, Any]]
+        """
+        context = Context(prec=digits)
+        x = self.number_type(x)
+
+        if self.backend != Interpolator.BACKENDS[0]:
+            exact = self.compute(x)
+            res = context.plus(Decimal(exact))
+            return (res, exact) if with_exact else res
+
+        if self.algorithm in Interpolator.MODES[:2]:
+            filtered = self.__filtered_compute(x)
+            if filtered is not None:
+                value, bound = filtered
+                low, high = Decimal(nextafter(value - bound, -inf)), Decimal(nextafter(value + bound, inf))
+                res = context.plus(low)
+                if res == context.plus(high) and (res.as_tuple().digits[-1] != 0 or not low <= res <= high):
+                    self.filter_hits += 1
+                    return (res, None) if with_exact else res
+            self.filter_misses += 1
+
+        exact = self.compute(x)
+        res = context.divide(Decimal(exact.numerator), Decimal(exact.denominator))
+        return (res, exact) if with_exact else res
+
+    def set_cache_size(self, cache_size):
+        """Set the maximum number of *compute* results to be cached, the least recently used ones are removed first
+
+        :param cache_size: the maximum number of cached results, 0 disables the cache
+        :type cache_size: int
+        :rtype: None
+        """
+        if cache_size < 0:
+            raise ValueError("cache_size must not be negative")
+
+        self.cache_size = cache_size
+        while len(self.__cache) > cache_size:
+            self.__cache.popitem(last=False)
+
+    def clear(self):
+        """Remove all the points from the interpolation memory, the cache size and statistics are kept
+
+        :rtype: None
+        """
+        version, cache_hits, cache_misses = self.version, self.cache_hits, self.cache_misses
+        filter_hits, filter_misses = self.filter_hits, self.filter_misses
+        # the handlers are created again, so they are wrapped again after that
+        instrumentation = self.instrumentation
+        self.set_instrumentation(None)
+
+        piecewise_degree = self.piecewise.degree if self.algorithm == Interpolator.MODES[3] else 3
+        spline_slopes = self.spline.slopes if self.algorithm == Interpolator.MODES[4] else None
+        self.__init__(self.algorithm, self.backend, self.cache_size, piecewise_degree, spline_slopes,
+                      self.precision, self.guard_digits)
+
+        self.version = version + 1
+        self.cache_hits, self.cache_misses = cache_hits, cache_misses
+        self.filter_hits, self.filter_misses = filter_hits, filter_misses
+        self.set_instrumentation(instrumentation)
+
+    def set_instrumentation(self, instrumentation):
+        """Start recording the calls, time and Fraction operations of the methods and handlers in *INSTRUMENTED*
+
+        the methods are replaced by recording wrappers, and restored when it is stopped, so nothing is recorded or
+        checked when it is off.
+
+        :param instrumentation: where to record, or None to stop recording (the old records are kept in it)
+        :type instrumentation: Optional[Instrumentation]
+        :rtype: None
+        """
+        if self.instrumentation is not None:
+            for name, function in self.instrumentation.originals.items():
+                if hasattr(Interpolator, name):
+                    # the method of the class is used again
+                    delattr(self, name)
+                else:
+                    setattr(self, name, function)
+            self.instrumentation.originals = {}
+
+        self.instrumentation = instrumentation
+        if instrumentation is None:
+            return
+
+        wrappers = []
+        for name in Interpolator.INSTRUMENTED:
+            function = getattr(self, name)
+            instrumentation.originals[name] = function
+
+            # compute_handler is the same as newton_compute_handler in the Newton modes, it is only recorded once
+            for original, wrapper in wrappers:
+                if original == function:
+                    break
+            else:
+                wrapper = instrumentation.wrap(function.__name__.replace('_Interpolator', ''), function)
+                wrappers.append((function, wrapper))
+
+            setattr(self, name, wrapper)
+
+    def stats(self):
+        """Get statistics about the interpolation, the cache and the instrumentation if it is on
+
+        the bit lengths of the c values show how expensive the exact arithmetic is becoming, as every operation is
+        on integers of this size.
+
+        :return: {name: value}, 'handlers' is the records of *Instrumentation.to_dict*
+        :rtype: dict
+        """
+        res = {
+            'points': self.size(),
+            'version': self.version,
+            'cache_size': self.cache_size,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'filter_hits': self.filter_hits,
+            'filter_misses': self.filter_misses,
+        }
+
+        if self.backend == Interpolator.BACKENDS[0]:
+            self.__sync_exact_data()
+            res['c_numerator_bits'] = max((c.numerator.bit_length() for c in self.c_data), default=0)
+            res['c_denominator_bits'] = max((c.denominator.bit_length() for c in self.c_data), default=0)
+            res['c_common_denominator_bits'] = self.__exact_c_data.denominator.bit_length()
+        elif self.backend == Interpolator.BACKENDS[2]:
+            res['precision'] = self.precision
+            res['guard_digits'] = self.guard_digits
+
+        if self.instrumentation is not None:
+            res['handlers'] = self.instrumentation.to_dict()
+
+        return res
+
+    def __polynomial_compute(self, x):
+        """*compute* using the cached expanded coefficients with Horner, over a common denominator
+
+        P(p / q) = (A_n * p^n + A_n-1 * p^n-1 * q + ... + A_0 * q^n) / (E * q^n)
+
+        :param x: input
+        :type x: Fraction
+        :return: result of the compute
+        :rtype: Fraction
+        """
+        self.__sync_c_data()
+        self.__sync_polynomial()
+
+        if not self.__polynomial:
+            return 0
+
+        if self.__exact_polynomial is None:
+            self.__exact_polynomial = CommonDenominatorArray()
+            self.__exact_polynomial.extend(self.__polynomial)
+
+        p, q = x.numerator, x.denominator
+        numerators = self.__exact_polynomial.numerators
+
+        res = numerators[-1]
+        q_power = 1
+        for i in range(len(numerators) - 2, -1, -1):
+            q_power *= q
+            res = res * p + numerators[i] * q_power
+
+        return Fraction(res, self.__exact_polynomial.denominator * q_power)
+
+    @_in_decimal_context
+    def to_polynomial(self):
+        """Get the coefficients of the interpolation function in the power basis a0 + a1 x + ... + an x^n
+
+        the coefficients are cached, and adding points only adds their terms c_i (x - x0)...(x - xi-1) to them.
+        after this is called, *compute* uses them in the "fraction" backend.
+
+        :return: the coefficients, lowest degree first
+        :rtype: Union[List[Fraction], np.ndarray]
+        """
+        if self.algorithm in Interpolator.MODES[3:]:
+            raise ValueError(f"the {self.algorithm} algorithm does not have a single polynomial")
+
+        self.__sync_c_data()
+        self.__sync_polynomial()
+
+        return self.__polynomial.copy()
+
+    def __sync_polynomial(self):
+        """add the terms of the c values which are not yet in the expanded coefficients
+
+        :rtype: None
+        """
+        is_float = self.backend == Interpolator.BACKENDS[1]
+
+        if self.__polynomial is None:
+            self.__polynomial = np.zeros(0) if is_float else []
+            self.__polynomial_basis = np.ones(1) if is_float else [self.number_type(1)]
+            self.__polynomial_size = 0
+
+        if self.__polynomial_size == len(self.c_data):
+            return
+
+        polynomial, basis = self.__polynomial, self.__polynomial_basis
+
+        for i in range(self.__polynomial_size, len(self.c_data)):
+            c, x = self.c_data[i], self.x_data[i]
+
+            # polynomial += c * basis, basis is one degree higher
+            if is_float:
+                polynomial = np.append(polynomial, 0.0) + c * basis
+                basis = np.append(0.0, basis) - x * np.append(basis, 0.0)
+            else:
+                polynomial = [a + c * b for a, b in zip(polynomial + [0], basis)]
+                # basis *= (x - xi)
+                basis = [high - x * low for high, low in zip([0] + basis, basis + [0])]
+
+        self.__polynomial, self.__polynomial_basis = polynomial, basis
+        self.__polynomial_size = len(self.c_data)
+        self.__exact_polynomial = None
+
+    def expanded_str(self):
+        """Build the interpolation representation in the power basis as a string and return it
+
+        :return: string representation of the expanded interpolation, highest degree first
+        :rtype: str
+        """
+        res = []
+
+        polynomial = self.to_polynomial()
+
+        for i in range(len(polynomial) - 1, -1, -1):
+            a = polynomial[i]
+
+            # same as *__str__*, zero terms are not printed
+            if a == 0:
+                continue
+
+            if i == 0:
+                res.append(str(a))
+            elif i == 1:
+                res.append(f'{a}x')
+            else:
+                res.append(f'{a}x^{i}')
+
+        final = ' + '.join(res)
+
+        if not final and len(polynomial) > 0:
+            final = '0'
+
+        return final.replace(' + -', ' - ').replace(' - -', ' + ')
+
+    @_in_decimal_context
+    def compute_many(self, xs, workers=1):
+        """Pass many values of x to the interpolation function and get the results in the same order
+
+        the Newton form is evaluated using nested (Horner) multiplication
+        c0 + (x - x0)(c1 + (x - x1)(c2 + ...)), which does not need the (x - x0)(x - x1)... products
+        that *compute* builds. for the "float64" backend, each step is vectorized over all of xs.
+
+        for the "fraction" backend, the values can be split over *workers* processes (see *lib/parallel*), which is
+        only done for at least *PARALLEL_MIN_BATCH* values. the "piecewise" and "spline" modes are always computed
+        in this process, as each value only needs a few operations, and "barycentric" uses its weights (vectorized)
+        for "float64".
+
+        :param xs: inputs
+        :type xs: Union[list, np.ndarray]
+        :param workers: the maximum number of processes for the "fraction" backend
+        :type workers: int
+        :return: results of the compute, ndarray for the "float64" backend and list otherwise
+        :rtype: Union[list, np.ndarray]
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        if self.algorithm == Interpolator.MODES[3]:
+            res = [self.compute(x) for x in xs]
+            return np.array(res, dtype=np.float64) if self.backend == Interpolator.BACKENDS[1] else res
+
+        if self.algorithm == Interpolator.MODES[4]:
+            # vectorized over the intervals of xs for "float64"
+            if self.backend == Interpolator.BACKENDS[1]:
+                return self.spline.compute_many(np.fromiter(map(self.number_type, xs), dtype=np.float64))
+            return self.spline.compute_many(list(map(self.number_type, xs)))
+
+        # the Newton form of many points overflows in "float64", the (scaled) barycentric weights do not
+        if self.algorithm == Interpolator.MODES[2] and self.backend == Interpolator.BACKENDS[1]:
+            return Interpolator.__float_barycentric_many(self.x_data, self.y_data, self.w_data,
+                                                         np.fromiter(map(self.number_type, xs), dtype=np.float64))
+
+        self.__sync_c_data()
+
+        if self.backend == Interpolator.BACKENDS[1]:
+            if isinstance(xs, np.ndarray) and xs.dtype.kind in 'iuf':
+                xs = xs.astype(np.float64)
+            else:
+                xs = np.fromiter(map(self.number_type, xs), dtype=np.float64)
+
+            return Interpolator.__float_horner(self.c_data, self.x_data, xs)
+        elif self.backend == Interpolator.BACKENDS[2]:
+            return [Interpolator.__horner(self.c_data, self.x_data, x) for x in map(self.number_type, xs)]
+        else:
+            xs = list(map(self.number_type, xs))
+
+            if len(self.c_data) == 0:
+                return [0] * len(xs)
+
+            self.__sync_exact_data()
+
+            # the same integer arithmetic as *__compute*, over the common denominator versions of x_data and c_data
+            newton_form = (self.__exact_x_data.numerators, self.__exact_x_data.denominator,
+                           self.__exact_c_data.numerators, self.__exact_c_data.denominator)
+
+            workers = min(workers, len(xs))
+            if workers > 1 and len(xs) >= Interpolator.PARALLEL_MIN_BATCH:
+                return parallel_exact_newton_values(newton_form, xs, workers)
+
+            return self.compute_many_exact(xs)
+
+    def compute_many_exact(self, xs):
+        """Pass many values of x to the interpolation function and get the exact results in the same order
+
+        for at least *MULTIPOINT_MIN_BATCH* values and *MULTIPOINT_MIN_SIZE* points, the cached polynomial is
+        evaluated at all of them using a subproduct tree (see *lib/multipoint*), which is O(M(n) log n) integer
+        operations instead of the O(n m) of the Newton form, where M(n) is the cost of multiplying polynomials.
+        otherwise it is computed with the Newton form like *compute_many*, and the results are the same.
+
+        the values and x_data are scaled to integers z = L x by their common denominator L, so values with a large
+        common denominator (above *MULTIPOINT_MAX_DENOMINATOR_BITS*) use the Newton form as well.
+
+        :param xs: inputs
+        :type xs: list
+        :return: results of the compute
+        :rtype: List[Fraction]
+        """
+        # there is a single polynomial over integers only for the exact Newton form
+        if self.backend != Interpolator.BACKENDS[0] or self.algorithm in Interpolator.MODES[3:]:
+            return self.compute_many(xs)
+
+        xs = list(map(self.number_type, xs))
+
+        self.__sync_c_data()
+        self.__sync_exact_data()
+
+        if len(self.c_data) == 0:
+            return [0] * len(xs)
+
+        if len(xs) >= Interpolator.MULTIPOINT_MIN_BATCH and len(self.c_data) >= Interpolator.MULTIPOINT_MIN_SIZE:
+            common_denominator = lcm(self.__exact_x_data.denominator, *(x.denominator for x in xs))
+            if common_denominator.bit_length() <= Interpolator.MULTIPOINT_MAX_DENOMINATOR_BITS:
+                return self.__multipoint_values(xs, common_denominator)
+
+        return exact_newton_values(self.__exact_x_data.numerators, self.__exact_x_data.denominator,
+                                   self.__exact_c_data.numerators, self.__exact_c_data.denominator, xs)
+
+    def __multipoint_values(self, xs, common_denominator):
+        """*compute_many_exact* using the subproduct tree
+
+        with x_i = X_i / D and c_i = C_i / E, the Newton form in y = D x is
+        P = sum(C_i D^(n-1-i) (y - X_0)...(y - X_i-1)) / (E D^(n-1)), and its numerator is expanded once to the
+        power basis and cached. for values with the common denominator L = k D, it is rescaled to z = k y, and
+        evaluated at the integers z = L x.
+
+        :param xs: inputs
+        :type xs: List[Fraction]
+        :param common_denominator: the common denominator L of xs and x_data
+        :type common_denominator: int
+        :rtype: List[Fraction]
+        """
+        size = len(self.c_data)
+        x_denominator = self.__exact_x_data.denominator
+
+        if self.__integer_polynomial is None or self.__integer_polynomial[0] != size:
+            coefficients = [0] * size
+            power = 1
+            for i in range(size - 1, -1, -1):
+                coefficients[i] = self.__exact_c_data.numerators[i] * power
+                power *= x_denominator
+
+            self.__integer_polynomial = (size, newton_to_power_basis(self.__exact_x_data.numerators, coefficients))
+
+        polynomial = self.__integer_polynomial[1]
+
+        # a_j y^j = a_j k^(n-1-j) z^j / k^(n-1)
+        scale = common_denominator // x_denominator
+        if scale > 1:
+            polynomial = polynomial.copy()
+            power = 1
+            for j in range(len(polynomial) - 1, -1, -1):
+                polynomial[j] *= power
+                power *= scale
+
+        values = evaluate_many(polynomial, [x.numerator * (common_denominator // x.denominator) for x in xs])
+
+        denominator = self.__exact_c_data.denominator * common_denominator ** (size - 1)
+        return [Fraction(value, denominator) for value in values]
+
+    @_in_decimal_context
+    def approx_many(self, xs):
+        """Compute many values of x approximately in float64, vectorized for all the backends
+
+        this is for uses that do not need exact results, like plotting. for the "fraction" backend, the Newton form
+        is converted to float64 once, the "barycentric" mode uses its weights in float64, the "spline" mode is solved again in float64 (as solving it exactly is slow
+        for many knots), and the "piecewise" mode computes each x.
+
+        :param xs: inputs
+        :type xs: Union[list, np.ndarray]
+        :return: approximate results of the compute
+        :rtype: np.ndarray
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+
+        if self.backend == Interpolator.BACKENDS[1]:
+            return self.compute_many(xs)
+
+        to_float = Interpolator.__float_or_inf
+        if self.algorithm == Interpolator.MODES[3]:
+            return np.array([to_float(self.piecewise.compute(self.number_type(x))) for x in xs.tolist()],
+                            dtype=np.float64)
+        if self.algorithm == Interpolator.MODES[4]:
+            slopes = self.spline.slopes
+            float_spline = CubicSpline(None if slopes is None else tuple(map(to_float, slopes)))
+            float_spline.insert_many(list(map(to_float, self.spline.x_data)), list(map(to_float, self.spline.y_data)))
+            return float_spline.compute_many(xs)
+
+        if self.algorithm == Interpolator.MODES[2]:
+            # the Newton form of many points overflows in float64, the scaled barycentric weights do not
+            if self.__float_barycentric_data is None or self.__float_barycentric_data[0] != self.version:
+                self.__float_barycentric_data = (self.version, *self.__float_barycentric_arrays())
+            with np.errstate(over='ignore', invalid='ignore'):
+                return Interpolator.__float_barycentric_many(*self.__float_barycentric_data[1:], xs)
+
+        self.__sync_c_data()
+
+        # the c values which overflow make the results infinite or nan, instead of failing
+        with np.errstate(over='ignore', invalid='ignore'):
+            return Interpolator.__float_horner(np.array(list(map(to_float, self.c_data)), dtype=np.float64),
+                                               np.array(list(map(to_float, self.x_data[:len(self.c_data)])),
+                                                        dtype=np.float64), xs)
+
+    def __float_barycentric_arrays(self):
+        """the points and the barycentric weights of the "fraction" and "decimal" backends in float64, for
+        *approx_many*
+
+        the weights are scaled by the same power of 2 so that the largest one is about 1 (see *__normalize_weights*),
+        from the exponents of their exact values, so they do not overflow.
+
+        :return: x_data, y_data and w_data
+        :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray]
+        """
+        mantissas, exponents = [], []
+        for w in map(Fraction, self.w_data):
+            # w = (n / d) = (n / d 2^exponent) 2^exponent, and the integer division is correctly rounded
+            exponent = abs(w.numerator).bit_length() - w.denominator.bit_length()
+            if exponent > 0:
+                mantissas.append(w.numerator / (w.denominator << exponent))
+            else:
+                mantissas.append((w.numerator << -exponent) / w.denominator)
+            exponents.append(exponent)
+
+        w_data = np.array(mantissas, dtype=np.float64)
+        if len(w_data):
+            exponents = np.array(exponents)
+            np.ldexp(w_data, exponents - exponents.max(), out=w_data)
+
+        to_float = Interpolator.__float_or_inf
+        return (np.array(list(map(to_float, self.x_data)), dtype=np.float64),
+                np.array(list(map(to_float, self.y_data)), dtype=np.float64), w_data)
+
+    @staticmethod
+    def __float_or_inf(x):
+        """convert the number to float, the numbers too large for a float are infinite with their sign
+
+        :param x: the number
+        :type x: Union[Fraction, Decimal, float]
+        :rtype: float
+        """
+        try:
+            return float(x)
+        except OverflowError:
+            return inf if x > 0 else -inf
+
+    @staticmethod
+    def __float_horner(c_data, x_data, xs):
+        """Compute the Newton form at many values of x using nested (Horner) multiplication, vectorized over xs
+
+        :param c_data: the c values
+        :type c_data: np.ndarray
+        :param x_data: the x values
+        :type x_data: np.ndarray
+        :param xs: inputs
+        :type xs: np.ndarray
+        :rtype: np.ndarray
+        """
+        if len(c_data) == 0:
+            return np.zeros_like(xs)
+
+        res = np.full_like(xs, c_data[-1])
+        for i in range(len(c_data) - 2, -1, -1):
+            res *= xs - x_data[i]
+            res += c_data[i]
+
+        return res
+
+    @staticmethod
+    def __horner(c_data, x_data, x):
+        """Compute the Newton form at x using nested (Horner) multiplication, with the arithmetic of the values
+
+        :param c_data: the c values
+        :type c_data: list
+        :param x_data: the x values
+        :type x_data: list
+        :param x: input
+        :type x: Decimal
+        :rtype: Decimal
+        """
+        if not c_data:
+            return 0
+
+        res = c_data[-1]
+        for i in range(len(c_data) - 2, -1, -1):
+            res = res * (x - x_data[i]) + c_data[i]
+
+        return res
+
+    def error_estimate(self, xs=None):
+        """Estimate the rounding error of the results by comparing them with the exact "fraction" backend
+
+        the same points are interpolated exactly, so this is the error of the arithmetic in the working precision
+        (the build of the c values and the compute), not of rounding the input points to it.
+
+        :param xs: the values of x to compare at, by default the middle of each two consecutive points
+        :type xs: Optional[list]
+        :return: the largest absolute error, and the same relative to the largest exact value
+        :rtype: Tuple[float, float]
+        """
+        x_data = list(map(Fraction, self.__as_list(self.x_data)))
+        y_data = list(map(Fraction, self.__as_list(self.y_data)))
+
+        if xs is None:
+            sorted_x = sorted(x_data)
+            xs = [(a + b) / 2 for a, b in zip(sorted_x, sorted_x[1:])] or sorted_x
+
+        piecewise_degree = self.piecewise.degree if self.algorithm == Interpolator.MODES[3] else 3
+        spline_slopes = None
+        if self.algorithm == Interpolator.MODES[4] and self.spline.slopes is not None:
+            spline_slopes = tuple(map(Fraction, self.spline.slopes))
+
+        exact = Interpolator(self.algorithm, Interpolator.BACKENDS[0], piecewise_degree=piecewise_degree,
+                             spline_slopes=spline_slopes)
+        exact.add_many(x_data, y_data)
+
+        exact_results = exact.compute_many(xs)
+        errors = [abs(Fraction(result) - exact_result)
+                  for result, exact_result in zip(self.compute_many(xs), exact_results)]
+
+        max_error = max(errors, default=Fraction(0))
+        max_exact = max((abs(exact_result) for exact_result in exact_results), default=Fraction(0))
+
+        return float(max_error), float(max_error / max_exact) if max_exact else float(max_error)
+
+    @_in_decimal_context
+    def __str__(self):
+        """Build the interpolation representation as a string and return it
+
+        for the "piecewise" mode, each range of x is printed in a line with its local polynomial, and for the
+        "spline" mode each interval is printed with its cubic around the first knot.
+
+        :return: string representation of the interpolation
+        :rtype: str
+        """
+        if self.algorithm == Interpolator.MODES[3]:
+            return '\n'.join(f'[{first_x}, {last_x}]: {Interpolator.__newton_str(c_data, x_data)}'
+                             for first_x, last_x, c_data, x_data in self.piecewise.pieces())
+        if self.algorithm == Interpolator.MODES[4]:
+            return '\n'.join(f'[{first_x}, {last_x}]: {Interpolator.__shifted_str(coefficients, first_x)}'
+                             for first_x, last_x, coefficients in self.spline.pieces())
+
+        self.__sync_c_data()
+
+        return Interpolator.__newton_str(self.c_data, self.x_data)
+
+    def render_nested(self):
+        """Build the interpolation representation in the nested (Horner) Newton form, a part at a time
+
+        c0 + (x - x0)(c1 + (x - x1)(c2 + ...)) has every c and x once, so its size is linear in the number of
+        points, unlike *__str__* where the term of c_i has i factors. the parts can be written as they are built,
+        without building the full string (see *write_nested*).
+
+        for the "piecewise" and "spline" modes, each range of x is a line with its nested local polynomial.
+
+        :return: generator of the parts of the string
+        :rtype: Iterator[str]
+        """
+        if self.algorithm == Interpolator.MODES[3]:
+            for i, (first_x, last_x, c_data, x_data) in enumerate(self.__local_pieces()):
+                yield f'{chr(10) if i else ""}[{first_x}, {last_x}]: '
+                yield from Interpolator.__nested_chunks(c_data, x_data)
+            return
+        if self.algorithm == Interpolator.MODES[4]:
+            for i, (first_x, last_x, coefficients) in enumerate(self.__local_pieces()):
+                yield f'{chr(10) if i else ""}[{first_x}, {last_x}]: '
+                yield from Interpolator.__nested_chunks(coefficients, [first_x] * (len(coefficients) - 1))
+            return
+
+        self.__sync_c_data()
+
+        yield from Interpolator.__nested_chunks(self.__as_list(self.c_data), self.__as_list(self.x_data))
+
+    @_in_decimal_context
+    def __local_pieces(self):
+        """get the pieces of the "piecewise" or "spline" mode, which are built in the working precision before
+        *render_nested* yields anything
+
+        :rtype: list
+        """
+        if self.algorithm == Interpolator.MODES[3]:
+            return self.piecewise.pieces()
+        return self.spline.pieces()
+
+    def write_nested(self, writer):
+        """Write the nested form of *render_nested* to a writer as it is built
+
+        :param writer: any object with a write(str) method, ex. sys.stdout or an open file
+        :type writer: TextIO
+        :rtype: None
+        """
+        for chunk in self.render_nested():
+            writer.write(chunk)
+
+    @staticmethod
+    def __nested_chunks(c_data, x_data):
+        """Build the nested form of a Newton polynomial, a term at a time
+
+        :param c_data: the c values of the polynomial
+        :type c_data: list
+        :param x_data: the x values of the polynomial
+        :type x_data: list
+        :return: generator of the parts of the string
+        :rtype: Iterator[str]
+        """
+        # the zero c values at the end do not change the polynomial
+        size = len(c_data)
+        while size and c_data[size - 1] == 0:
+            size -= 1
+
+        if size == 0:
+            if len(c_data):
+                yield '0'
+            return
+
+        for i in range(size):
+            c = c_data[i]
+            # the first c is not inside parentheses, and the last one is not followed by a factor
+            chunk = str(c) if c != 0 else ''
+
+            if i < size - 1:
+                x = x_data[i]
+                factor = f'(x - {x})(' if x >= 0 else f'(x + {-x})('
+                chunk = f'{chunk} + {factor}' if chunk else factor
+
+            yield chunk
+
+        yield ')' * (size - 1)
+
+    @staticmethod
+    def __newton_str(c_data, x_data):
+        """Build the string representation of a Newton polynomial
+
+        :param c_data: the c values of the polynomial
+        :type c_data: Union[list, np.ndarray]
+        :param x_data: the x values of the polynomial
+        :type x_data: Union[list, np.ndarray]
+        :return: string representation of the polynomial
+        :rtype: str
+        """
+        res = []
+
+        # the size of the interpolation
+        c_data_len = len(c_data)
+
+        # (x - x0)(x - x1)...(x - xi-1), extended by one factor for each term, so each x is converted once
+        prefix = ''
+
+        for i in range(c_data_len):
+            current_c = c_data[i]
+
+            if i:
+                prefix += f'(x - {x_data[i - 1]})'
+
+            # if the current value is zero, then there is no need to print it as it will cancel out with the zero
+            if current_c == 0:
+                continue
+
+            res.append(str(current_c) + prefix)
+
+        final = ' + '.join(res)
+
+        # if there is a data, but all of them cancel out, then just return zero
+        if not final and c_data_len > 0:
+            final = '0'
+
+        # convert +- into - and -- into +, as sometimes the concatenation does this if the numbers are negative.
+        return final.replace(' + -', ' - ').replace(' - -', ' + ')
+
+    @staticmethod
+    def __shifted_str(coefficients, x0):
+        """Build the string representation of a polynomial in powers of (x - x0)
+
+        :param coefficients: the coefficients, lowest degree first
+        :type coefficients: list
+        :param x0: the center of the powers
+        :type x0: Fraction
+        :return: string representation of the polynomial
+        :rtype: str
+        """
+        res = []
+
+        for i, a in enumerate(coefficients):
+            # same as *__newton_str*, zero terms are not printed
+            if a == 0:
+                continue
+
+            if i == 0:
+                res.append(str(a))
+            elif i == 1:
+                res.append(f'{a}(x - {x0})')
+            else:
+                res.append(f'{a}(x - {x0})^{i}')
+
+        final = ' + '.join(res) or '0'
 
-        # convert +- into - and -- into +, as sometimes the concatenation does this if the numbers are negative.
         return final.replace(' + -', ' - ').replace(' - -', ' + ')
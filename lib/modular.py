@@ -0,0 +1,334 @@
+"""Exact divided differences using modular arithmetic and rational reconstruction
+
+The points are scaled to integers, x = X / D and y = Y / E, and the divided differences of (X, Y) are computed
+modulo many primes below 2^31 (so the products fit in int64), vectorized over a batch of primes at once. The
+residues are combined with the Chinese remainder theorem, and each value is found from its residue by rational
+reconstruction, which is accepted when it also matches the residues of primes that were not used to find it.
+
+The check is probabilistic: the values are not verified with exact arithmetic, a wrong reconstruction is only
+accepted if the differences of all its values from the right ones are divisible by every prime of the checking
+batch (a product of about 2^990), which does not happen for values that are not chosen against these primes.
+
+The primes are independent, so their batches can be computed by a pool of processes, which receive the points
+once from the pool initializer (like *lib/parallel*).
+"""
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from math import gcd, isqrt, lcm
+
+import numpy as np
+
+# the number of primes computed together, the first round uses one batch and each round doubles the primes
+PRIMES_PER_BATCH = 32
+
+# the largest absolute value of the integers that are reduced with numpy
+_INT64_LIMIT = 1 << 63
+
+# the scaled points of the worker process, set by *_init_worker*
+_worker_points = None
+
+
+def _is_prime(n):
+    """deterministic Miller-Rabin for n < 4759123141"""
+    if n < 2:
+        return False
+    for p in (2, 3, 5, 7, 11, 13):
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in (2, 7, 61):
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def primes(count, start=(1 << 31) - 1):
+    """Get the largest primes that are at most *start*
+
+    :param count: the number of primes
+    :type count: int
+    :param start: the largest value to check
+    :type start: int
+    :return: the primes, largest first
+    :rtype: List[int]
+    """
+    res = []
+    n = start
+    while len(res) < count:
+        if _is_prime(n):
+            res.append(n)
+        n -= 1
+    return res
+
+
+def _residues(values, moduli):
+    """the values modulo each of the moduli, as an array of shape (len(moduli), len(values))"""
+    moduli = np.asarray(moduli, dtype=np.int64)[:, np.newaxis]
+    if all(-_INT64_LIMIT < value < _INT64_LIMIT for value in values):
+        return np.asarray(values, dtype=np.int64)[np.newaxis, :] % moduli
+
+    return np.array([[value % int(p) for value in values] for p in moduli[:, 0]], dtype=np.int64)
+
+
+def _inverse(values, moduli):
+    """the modular inverses values^(p - 2) mod p of an array, each row has its own prime in moduli (a column)"""
+    exponents = moduli - 2
+    res = np.ones_like(values)
+    base = values % moduli
+
+    for bit in range(int(exponents.max()).bit_length()):
+        odd = (exponents >> bit) & 1 == 1
+        res = np.where(odd, res * base % moduli, res)
+        base = base * base % moduli
+
+    return res
+
+
+def _divided_differences(points, batch):
+    """the divided differences of the points modulo a batch of primes
+
+    each divided difference is kept as a numerator and a denominator, so a column only needs a few
+    multiplications, and only the values that are returned are divided at the end.
+
+    :param points: the scaled points (X values, Y values)
+    :type points: Tuple[List[int], List[int]]
+    :param batch: the primes
+    :type batch: List[int]
+    :return: the residues of the c values (top diagonal) and of the last row (bottom diagonal), each of shape
+             (len(batch), size), and for each prime whether it can be used (it does not divide any X difference)
+    :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray]
+    """
+    x_values, y_values = points
+    size = len(x_values)
+    moduli = np.asarray(batch, dtype=np.int64)[:, np.newaxis]
+
+    x_residues = _residues(x_values, batch)
+    numerators = _residues(y_values, batch)
+    denominators = np.ones_like(numerators)
+
+    shape = (len(batch), size)
+    top_numerators, top_denominators = np.empty(shape, dtype=np.int64), np.ones(shape, dtype=np.int64)
+    bottom_numerators, bottom_denominators = np.empty(shape, dtype=np.int64), np.ones(shape, dtype=np.int64)
+    top_numerators[:, 0], bottom_numerators[:, 0] = numerators[:, 0], numerators[:, -1]
+    valid = np.ones(len(batch), dtype=bool)
+
+    for k in range(1, size):
+        x_differences = (x_residues[:, k:] - x_residues[:, :-k]) % moduli
+        valid &= (x_differences != 0).all(axis=1)
+
+        # a / b - c / d = (a d - c b) / (b d), over (x_i+k - x_i)
+        numerators, denominators = (
+            (numerators[:, 1:] * denominators[:, :-1] % moduli - numerators[:, :-1] * denominators[:, 1:]) % moduli,
+            denominators[:, 1:] * denominators[:, :-1] % moduli * x_differences % moduli)
+
+        top_numerators[:, k], top_denominators[:, k] = numerators[:, 0], denominators[:, 0]
+        bottom_numerators[:, k], bottom_denominators[:, k] = numerators[:, -1], denominators[:, -1]
+
+    top = top_numerators * _inverse(top_denominators, moduli) % moduli
+    bottom = bottom_numerators * _inverse(bottom_denominators, moduli) % moduli
+    return top, bottom, valid
+
+
+def _init_worker(points):
+    global _worker_points
+    _worker_points = points
+
+
+def _divided_differences_batch(batch):
+    return _divided_differences(_worker_points, batch)
+
+
+def _crt_basis(batch):
+    """the modulus of the batch and e_i with e_i = 1 (mod p_i) and 0 modulo the other primes"""
+    modulus = 1
+    for p in batch:
+        modulus *= p
+    return modulus, [modulus // p * pow(modulus // p, -1, p) for p in batch]
+
+
+def _batch_values(batch_residues, batch):
+    """the values modulo the product of a batch of primes, from their residues
+
+    :param batch_residues: the values modulo each prime of the batch, of shape (len(batch), number of values)
+    :type batch_residues: np.ndarray
+    :param batch: the primes of the batch
+    :type batch: List[int]
+    :return: the values and their modulus
+    :rtype: Tuple[List[int], int]
+    """
+    batch_modulus, basis = _crt_basis(batch)
+    return [sum(r * e for r, e in zip(column, basis)) % batch_modulus for column in batch_residues.T.tolist()], \
+        batch_modulus
+
+
+def _combine(parts):
+    """combine values modulo coprime moduli to the values modulo their product, using the Chinese remainder theorem
+
+    the parts are combined in pairs, so the large moduli are only combined with moduli of the same size.
+
+    :param parts: the values and their modulus for each part
+    :type parts: List[Tuple[List[int], int]]
+    :return: the values and their modulus
+    :rtype: Tuple[List[int], int]
+    """
+    if len(parts) == 1:
+        return parts[0]
+
+    half = len(parts) // 2
+    (first, first_modulus), (second, second_modulus) = _combine(parts[:half]), _combine(parts[half:])
+
+    # r = r1 + M1 ((r2 - r1) / M1 mod M2)
+    inverse = pow(first_modulus % second_modulus, -1, second_modulus)
+    return ([r1 + first_modulus * ((r2 - r1) * inverse % second_modulus) for r1, r2 in zip(first, second)],
+            first_modulus * second_modulus)
+
+
+def _reconstruct(residue, modulus, bound):
+    """the fraction a / b with a = residue * b (mod modulus), |a| <= bound and 0 < b <= bound, or None
+
+    the extended Euclidean algorithm stops at the first remainder below the bound (Wang's algorithm), which
+    is quick when the fraction has a small denominator.
+    """
+    r0, r1 = modulus, residue % modulus
+    s0, s1 = 0, 1
+    while r1 > bound:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        s0, s1 = s1, s0 - q * s1
+
+    if s1 == 0 or abs(s1) > bound or gcd(r1, s1) != 1:
+        return None
+    return (r1, s1) if s1 > 0 else (-r1, -s1)
+
+
+def _reconstruct_all(residues, modulus):
+    """reconstruct the fractions of all the residues, or None if any of them can not be reconstructed yet
+
+    the values share most of their denominators, so each residue is multiplied by the lcm of the denominators
+    found before it, and only the rest of its denominator is reconstructed.
+    """
+    bound = isqrt(modulus // 2)
+    denominator = 1
+    res = []
+
+    for residue in residues:
+        scaled = residue * denominator % modulus
+        fraction = _reconstruct(scaled, modulus, bound)
+        if fraction is None:
+            return None
+
+        numerator, new_denominator = fraction
+        res.append(Fraction(numerator, new_denominator * denominator))
+        denominator *= new_denominator
+
+    return res
+
+
+def _matches(fractions, residues, modulus):
+    return all((value.numerator - r * value.denominator) % modulus == 0 for value, r in zip(fractions, residues))
+
+
+def modular_divided_differences(xs, ys, start=0, last_row=False, workers=1):
+    """Compute the exact divided differences of the points using modular arithmetic
+
+    the values are accepted when one more batch of *PRIMES_PER_BATCH* primes agrees with them, which is a
+    probabilistic check and not an exact verification (see the module documentation).
+
+    :param xs: points x, all different
+    :type xs: List[Fraction]
+    :param ys: points y
+    :type ys: List[Fraction]
+    :param start: the first c value to be returned, the ones before it are already known
+    :type start: int
+    :param last_row: also compute the divided differences row of the last point (see *Interpolator*)
+    :type last_row: bool
+    :param workers: the number of processes computing the batches of primes
+    :type workers: int
+    :return: the c values from *start* (f[x_0, ..., x_i]), and the last row if it is needed
+    :rtype: Tuple[List[Fraction], Optional[List[Fraction]]]
+    """
+    size = len(xs)
+    if size == 0:
+        return [], [] if last_row else None
+
+    # x = X / D and y = Y / E, and the divided differences of order k are scaled by D^k / E
+    x_denominator = lcm(*(x.denominator for x in xs))
+    y_denominator = lcm(*(y.denominator for y in ys))
+    points = ([x.numerator * (x_denominator // x.denominator) for x in xs],
+              [y.numerator * (y_denominator // y.denominator) for y in ys])
+
+    # the residues of the values to be reconstructed, the c values from start and the last row
+    def wanted(top, bottom):
+        return np.hstack((top[:, start:], bottom)) if last_row else top[:, start:]
+
+    residues, modulus = [], 1
+    # the values reconstructed at the end of the last round, which are checked with the next batch
+    values = None
+    next_prime = (1 << 31) - 1
+    batches_count = 1
+    executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(points,)) if workers > 1 else None
+
+    def compute(batches):
+        if executor is None:
+            return [_divided_differences(points, batch) for batch in batches]
+        return list(executor.map(_divided_differences_batch, batches))
+
+    def batch_parts(batches):
+        parts = []
+        for batch, (top, bottom, valid) in zip(batches, compute(batches)):
+            # the primes that divide a difference of x can not be used
+            batch = [p for p, is_valid in zip(batch, valid) if is_valid]
+            if batch:
+                parts.append(_batch_values(wanted(top[valid], bottom[valid]), batch))
+        return parts
+
+    try:
+        while True:
+            batches = []
+            for _ in range(batches_count):
+                batch = primes(PRIMES_PER_BATCH, next_prime)
+                next_prime = batch[-1] - 1
+                batches.append(batch)
+
+            parts = []
+            if values is not None:
+                # the first batch of the round checks the values, as its primes were not used to find them
+                parts = batch_parts(batches[:1])
+                if parts and _matches(values, *parts[0]):
+                    return _unscale(values, size, start, last_row, x_denominator, y_denominator)
+                batches = batches[1:]
+
+            parts += batch_parts(batches)
+            if parts:
+                # the batches of the round are combined together before the (larger) values of the last rounds
+                parts = _combine(parts)
+                residues, modulus = parts if modulus == 1 else _combine([(residues, modulus), parts])
+
+            values = _reconstruct_all(residues, modulus) if modulus > 1 else None
+            batches_count *= 2
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def _unscale(values, size, start, last_row, x_denominator, y_denominator):
+    """scale the divided differences of (X, Y) back to the ones of (x, y), the order k is multiplied by D^k / E"""
+    c_data = [value * Fraction(x_denominator ** k, y_denominator) for k, value in enumerate(values[:size - start],
+                                                                                           start)]
+    if not last_row:
+        return c_data, None
+
+    row = [value * Fraction(x_denominator ** k, y_denominator) for k, value in enumerate(values[size - start:])]
+    return c_data, row
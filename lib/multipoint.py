@@ -0,0 +1,209 @@
+"""Evaluation of an integer polynomial at many integer points using a subproduct tree
+
+The polynomial is reduced modulo the products of (z - z_i) of the halves of the points, down to small groups of
+points, where the (small) remainders are evaluated directly. The products are monic, so the remainders stay
+integers and are found using the reciprocal power series of the reversed divisor.
+
+Most of the work is in multiplying large polynomials, which is done by packing each polynomial in one int (Kronecker
+substitution), so a single large int multiplication does it.
+
+The polynomials are lists of int, lowest degree first.
+"""
+
+# the number of points evaluated directly (with Horner) at the leaves of the tree
+LEAF_SIZE = 16
+# the length of the polynomials below which they are multiplied term by term
+SCHOOLBOOK_SIZE = 8
+
+
+def _pack(polynomial, bits):
+    """the polynomial at 2^bits, the halves are packed separately so it is not quadratic in the length"""
+    if len(polynomial) <= SCHOOLBOOK_SIZE:
+        res = 0
+        for coefficient in reversed(polynomial):
+            res = (res << bits) + coefficient
+        return res
+
+    half = len(polynomial) // 2
+    return _pack(polynomial[:half], bits) + (_pack(polynomial[half:], bits) << (bits * half))
+
+
+def _unpack(value, bits, size):
+    """the inverse of *_pack*, the coefficients must be less than 2^(bits - 1) in absolute value"""
+    if size <= SCHOOLBOOK_SIZE:
+        res = []
+        mask, sign = (1 << bits) - 1, 1 << (bits - 1)
+        for _ in range(size):
+            coefficient = value & mask
+            if coefficient >= sign:
+                coefficient -= 1 << bits
+            res.append(coefficient)
+            value = (value - coefficient) >> bits
+        return res
+
+    half = size // 2
+    shift = bits * half
+    low = value & ((1 << shift) - 1)
+    if low >> (shift - 1):
+        low -= 1 << shift
+
+    return _unpack(low, bits, half) + _unpack((value - low) >> shift, bits, size - half)
+
+
+def multiply(a, b):
+    """Multiply two integer polynomials
+
+    :param a: first polynomial
+    :type a: List[int]
+    :param b: second polynomial
+    :type b: List[int]
+    :rtype: List[int]
+    """
+    if not a or not b:
+        return []
+
+    if min(len(a), len(b)) <= SCHOOLBOOK_SIZE:
+        res = [0] * (len(a) + len(b) - 1)
+        for i, a_i in enumerate(a):
+            if a_i:
+                for j, b_j in enumerate(b):
+                    res[i + j] += a_i * b_j
+        return res
+
+    # every coefficient of the product is less than 2^(bits - 1) in absolute value
+    bits = (max(abs(c) for c in a).bit_length() + max(abs(c) for c in b).bit_length()
+            + min(len(a), len(b)).bit_length() + 1)
+
+    return _unpack(_pack(a, bits) * _pack(b, bits), bits, len(a) + len(b) - 1)
+
+
+def _add(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    return [x + y for x, y in zip(a, b)] + a[len(b):]
+
+
+def _series_inverse(polynomial, precision):
+    """the power series g with polynomial * g = 1 (mod z^precision) using Newton's iteration, polynomial[0] is 1"""
+    res = [1]
+    size = 1
+    while size < precision:
+        size = min(2 * size, precision)
+        # g = g + g (1 - polynomial g), which doubles the correct terms
+        error = [-c for c in multiply(polynomial[:size], res)[:size]]
+        error[0] += 1
+        res = _add(res, multiply(res, error)[:size])[:size]
+
+    return res
+
+
+def _remainder(polynomial, divisor):
+    """the remainder of the division by a monic divisor
+
+    the reversed quotient is the reversed polynomial times the reciprocal of the reversed divisor, which are
+    power series with integer coefficients as the divisor is monic.
+    """
+    degree = len(divisor) - 1
+    quotient_size = len(polynomial) - degree
+    if quotient_size <= 0:
+        return polynomial
+
+    inverse = _series_inverse(divisor[::-1], quotient_size)
+    quotient = multiply(polynomial[:degree - 1:-1] if degree else polynomial[::-1], inverse)[:quotient_size][::-1]
+
+    # only the terms below the degree of the divisor are needed from quotient * divisor
+    return [a - b for a, b in zip(polynomial[:degree], multiply(quotient[:degree], divisor[:degree])[:degree])]
+
+
+def _horner(polynomial, z):
+    res = 0
+    for coefficient in reversed(polynomial):
+        res = res * z + coefficient
+    return res
+
+
+def _subproduct_tree(points):
+    """the tree of the products of (z - z_i), a node is (product, left, right, points of a leaf)"""
+    if len(points) <= LEAF_SIZE:
+        product = [1]
+        for z in points:
+            # product *= (z - z_i)
+            product = [high - z * low for high, low in zip([0] + product, product + [0])]
+        return product, None, None, points
+
+    half = len(points) // 2
+    left, right = _subproduct_tree(points[:half]), _subproduct_tree(points[half:])
+    return multiply(left[0], right[0]), left, right, None
+
+
+def _evaluate_tree(polynomial, node, res):
+    product, left, right, points = node
+    polynomial = _remainder(polynomial, product)
+
+    if points is not None:
+        res.extend(_horner(polynomial, z) for z in points)
+        return
+
+    _evaluate_tree(polynomial, left, res)
+    _evaluate_tree(polynomial, right, res)
+
+
+def evaluate_many(polynomial, points):
+    """Evaluate an integer polynomial at many integer points
+
+    the points are split into groups of about the degree of the polynomial, as larger trees would not reduce it.
+
+    :param polynomial: the coefficients, lowest degree first
+    :type polynomial: List[int]
+    :param points: the values of z
+    :type points: List[int]
+    :return: the values in the same order as the points
+    :rtype: List[int]
+    """
+    group_size = max(len(polynomial), LEAF_SIZE)
+
+    res = []
+    for i in range(0, len(points), group_size):
+        _evaluate_tree(polynomial, _subproduct_tree(points[i:i + group_size]), res)
+
+    return res
+
+
+def newton_to_power_basis(nodes, coefficients):
+    """Expand an integer Newton form c0 + c1 (z - z0) + c2 (z - z0)(z - z1) + ... to the power basis
+
+    the two halves are expanded separately, and the second one is multiplied by the product of the nodes of the
+    first one.
+
+    :param nodes: the nodes z_i of the Newton form, at least as many as the coefficients
+    :type nodes: List[int]
+    :param coefficients: the coefficients c_i
+    :type coefficients: List[int]
+    :return: the coefficients in the power basis, lowest degree first
+    :rtype: List[int]
+    """
+    if not coefficients:
+        return []
+
+    return _newton_to_power_basis(nodes, coefficients)[0]
+
+
+def _newton_to_power_basis(nodes, coefficients):
+    """*newton_to_power_basis* and the product of (z - z_i) of all the nodes of the coefficients"""
+    if len(coefficients) <= LEAF_SIZE:
+        # nested from the last coefficient, res = c_i + (z - z_i) res
+        res = [coefficients[-1]]
+        for i in range(len(coefficients) - 2, -1, -1):
+            res = [high - nodes[i] * low for high, low in zip([0] + res, res + [0])]
+            res[0] += coefficients[i]
+
+        product = [1]
+        for z in nodes[:len(coefficients)]:
+            product = [high - z * low for high, low in zip([0] + product, product + [0])]
+        return res, product
+
+    half = len(coefficients) // 2
+    low, low_product = _newton_to_power_basis(nodes[:half], coefficients[:half])
+    high, high_product = _newton_to_power_basis(nodes[half:], coefficients[half:])
+
+    return _add(low, multiply(low_product, high)), multiply(low_product, high_product)
@@ -0,0 +1,299 @@
+from fractions import Fraction
+
+import numpy as np
+
+from lib.interpolate import CommonDenominatorArray, Interpolator
+
+
+class MultiSeriesInterpolator:
+    """Class that interpolates many series of y values over the same x values
+
+    The differences (x - x_i) only depend on the x values, so they are computed once for each x and applied to all
+    the series: *compute* goes over the points once for all the series, and adding a point computes the reciprocals
+    it needs once.
+
+    For "fraction", the c values of a new point are built like the "newton" algorithm of *Interpolator*, from the
+    values of the series at x which are computed over integers (see *Interpolator.__compute*), so each series only
+    needs two Fraction operations. For "float64", the divided differences rows of all the series are built
+    together like the "divide" algorithm, each row is an array with a value for every series.
+    """
+    BACKENDS = Interpolator.BACKENDS[:2]
+
+    def __init__(self, series, backend=BACKENDS[0]):
+        """Initialize an empty interpolator
+
+        :param series: the number of y values of each point
+        :type series: int
+        :param backend: chosen numbers representation from the list *MultiSeriesInterpolator.BACKENDS*
+        :type backend: str
+        """
+        if series < 1:
+            raise ValueError("series must be at least 1")
+        if backend not in MultiSeriesInterpolator.BACKENDS:
+            raise ValueError(f"backend argument must be one of {MultiSeriesInterpolator.BACKENDS}")
+
+        self.series = series
+        self.backend = backend
+        self.number_type = Fraction if backend == MultiSeriesInterpolator.BACKENDS[0] else float
+
+        # a row of y values for each point, and the c values of all the series for each point (a row in c_data).
+        # the rows are lists for "fraction" and the rows of 2d arrays for "float64", which are the used part of
+        # buffers that grow by doubling (like the "float64" backend of *Interpolator*)
+        if backend == MultiSeriesInterpolator.BACKENDS[1]:
+            self.__buffers = {
+                'x_data': np.empty(Interpolator.INITIAL_CAPACITY),
+                'y_data': np.empty((Interpolator.INITIAL_CAPACITY, series)),
+                'c_data': np.empty((Interpolator.INITIAL_CAPACITY, series)),
+                # the last divided differences row, a row of values for each point like c_data
+                'in_c_data': np.empty((Interpolator.INITIAL_CAPACITY, series)),
+            }
+            self.__set_size(0)
+        else:
+            self.x_data = []
+            self.y_data = []
+            self.c_data = []
+            # x_data and each column (series) of c_data over a common denominator, for the integer arithmetic
+            self.__exact_x_data = CommonDenominatorArray()
+            self.__exact_c_data = [CommonDenominatorArray() for _ in range(series)]
+
+    def size(self):
+        return len(self.x_data)
+
+    def __set_size(self, size):
+        """point the "float64" data arrays to the first *size* rows of their buffers
+
+        :param size: the number of points
+        :type size: int
+        :rtype: None
+        """
+        for name, buffer in self.__buffers.items():
+            setattr(self, name, buffer[:size])
+
+    def __reserve(self, size):
+        """grow the "float64" buffers to hold at least *size* points, at least doubling them, so adding a point
+        copies the old ones O(1) times on average
+
+        :param size: the number of points
+        :type size: int
+        :rtype: None
+        """
+        capacity = len(self.__buffers['x_data'])
+        if size <= capacity:
+            return
+
+        capacity = max(size, capacity * 2)
+        old_size = self.size()
+        for name, buffer in self.__buffers.items():
+            new_buffer = np.empty((capacity,) + buffer.shape[1:])
+            new_buffer[:old_size] = buffer[:old_size]
+            self.__buffers[name] = new_buffer
+        self.__set_size(old_size)
+
+    def add(self, x, ys):
+        """Add the point x with a y value for each series
+
+        :param x: point x
+        :type x: Fraction
+        :param ys: the y values of the series
+        :type ys: list
+        :rtype: None
+        """
+        self.add_many([x], [ys])
+
+    def add_many(self, xs, ys_rows):
+        """Add many points, if any of the x values already exists or any row has a wrong number of y values,
+        nothing is added
+
+        :param xs: points x
+        :type xs: list
+        :param ys_rows: the y values of the series for each point
+        :type ys_rows: list
+        :rtype: None
+        """
+        points = [(self.number_type(Fraction(x)), [self.number_type(Fraction(y)) for y in ys])
+                  for x, ys in zip(xs, ys_rows)]
+
+        # check all the points once, before changing anything
+        seen = set(self.x_data)
+        for x, ys in points:
+            if len(ys) != self.series:
+                raise ValueError(f"{self.series} y values are needed, got {len(ys)}")
+            if x in seen:
+                raise ArithmeticError(f"this value of x ({x}) already exists")
+            seen.add(x)
+
+        if not points:
+            return
+
+        if self.backend == MultiSeriesInterpolator.BACKENDS[1]:
+            self.__add_float_points(np.array([x for x, _ in points]), np.array([ys for _, ys in points]))
+            return
+
+        for x, ys in points:
+            # c = (y - P(x)) / (x - x0)...(x - xn-1) for each series, with the reciprocal of the product shared
+            old_values, x_differences = self.__exact_compute(x)
+            reciprocal = 1 / x_differences
+            self.c_data.append([(y - old_value) * reciprocal for y, old_value in zip(ys, old_values)])
+            self.y_data.append(ys)
+            self.x_data.append(x)
+
+    def __add_float_points(self, xs, ys_rows):
+        """add the "float64" points in one pass over the divided differences table, like the "divide" algorithm
+        for all the new points and series at once
+
+        the values of the new points start as their y values, and in step j each one becomes
+        f[x_i-j, ..., x_i] = (f[x_i-j+1, ..., x_i] - f[x_i-j, ..., x_i-1]) / (x_i - x_i-j), where the value before
+        the first new point is the last divided differences row (in_c_data) of the old points. the value of x_i
+        is its c value after step i, and the last one after each step is the new in_c_data. this is the same
+        arithmetic as adding the points one by one, in O(n) vectorized steps instead of O(n m).
+
+        :param xs: the x values of the new points
+        :type xs: np.ndarray
+        :param ys_rows: the y values of the series for each new point
+        :type ys_rows: np.ndarray
+        :rtype: None
+        """
+        old_size = self.size()
+        size = old_size + len(xs)
+        self.__reserve(size)
+
+        x_data = self.__buffers['x_data'][:size]
+        x_data[old_size:] = xs
+        self.__buffers['y_data'][old_size:size] = ys_rows
+        values = self.__buffers['c_data'][old_size:size]
+        values[:] = ys_rows
+        in_c_data = self.__buffers['in_c_data']
+
+        if len(xs) == 1:
+            # the steps of one point are the values of its row, so they are built as a row over the old points
+            reciprocals = 1 / (xs[0] - x_data[:old_size][::-1])
+            current_bottom = ys_rows[0]
+            row = [current_bottom]
+            for reciprocal, old_in_c in zip(reciprocals, in_c_data[:old_size]):
+                current_bottom = (current_bottom - old_in_c) * reciprocal
+                row.append(current_bottom)
+
+            in_c_data[:size] = row
+            values[0] = current_bottom
+            self.__set_size(size)
+            return
+
+        last = values[-1].copy()
+        for j in range(1, size):
+            # the values of the points before max(j, old_size) are done
+            start = max(j, old_size)
+            reciprocals = (1 / (x_data[start:] - x_data[start - j:size - j]))[:, np.newaxis]
+            start -= old_size
+
+            if start == 0:
+                first = (values[0] - in_c_data[j - 1]) * reciprocals[0]
+                values[1:] = (values[1:] - values[:-1]) * reciprocals[1:]
+                values[0] = first
+            else:
+                values[start:] = (values[start:] - values[start - 1:-1]) * reciprocals
+
+            # the old row j - 1 is not used after this step
+            in_c_data[j - 1] = last
+            last = values[-1].copy()
+        in_c_data[size - 1] = last
+
+        self.__set_size(size)
+
+    def compute(self, x):
+        """Compute all the series at x, using nested (Horner) multiplication of the Newton form
+
+        :param x: input
+        :type x: Fraction
+        :return: the value of each series, ndarray for the "float64" backend and list otherwise
+        :rtype: Union[list, np.ndarray]
+        """
+        x = self.number_type(Fraction(x))
+        size = self.size()
+
+        if self.backend == MultiSeriesInterpolator.BACKENDS[1]:
+            if size == 0:
+                return np.zeros(self.series)
+
+            res = self.c_data[-1].copy()
+            for i in range(size - 2, -1, -1):
+                res *= x - self.x_data[i]
+                res += self.c_data[i]
+            return res
+
+        return self.__exact_compute(x)[0]
+
+    def __exact_compute(self, x):
+        """compute all the series at x over integers, like *Interpolator.__compute* with the differences shared
+
+        :param x: input
+        :type x: Fraction
+        :return: [the value of each series, (x - x0)...(x - xn)]
+        :rtype: Tuple[List[Fraction], Fraction]
+        """
+        size = self.size()
+        if size == 0:
+            return [0] * self.series, Fraction(1)
+
+        self.__sync_exact_data()
+
+        # x = p / q and x_i = X_i / D, so (x - x_i) = (p * D - X_i * q) / (q * D)
+        p, q = x.numerator, x.denominator
+        x_numerators = self.__exact_x_data.numerators
+        scale = q * self.__exact_x_data.denominator
+        scaled_p = p * self.__exact_x_data.denominator
+        c_numerators = [column.numerators for column in self.__exact_c_data]
+
+        # res_j / (E_j * scale^(size - 1 - i)) is the nested value of the series j starting from c_i
+        res = [numerators[-1] for numerators in c_numerators]
+        power = 1
+        for i in range(size - 2, -1, -1):
+            power *= scale
+            x_difference = scaled_p - x_numerators[i] * q
+            res = [numerators[i] * power + x_difference * value for numerators, value in zip(c_numerators, res)]
+
+        total_sub_x = 1
+        for x_numerator in x_numerators:
+            total_sub_x *= scaled_p - x_numerator * q
+
+        values = [Fraction(value, column.denominator * power) for value, column in zip(res, self.__exact_c_data)]
+        return values, Fraction(total_sub_x, scale ** size)
+
+    def __sync_exact_data(self):
+        """append the values of x_data and c_data that are not yet in their common denominator version
+
+        :rtype: None
+        """
+        synced_size = len(self.__exact_x_data)
+        if synced_size < self.size():
+            self.__exact_x_data.extend(self.x_data[synced_size:])
+            for j, column in enumerate(self.__exact_c_data):
+                column.extend([row[j] for row in self.c_data[synced_size:]])
+
+    def compute_many(self, xs):
+        """Compute all the series at many values of x
+
+        :param xs: inputs
+        :type xs: list
+        :return: a row of the values of the series for each x, 2d ndarray for the "float64" backend
+        :rtype: Union[List[list], np.ndarray]
+        """
+        if self.backend == MultiSeriesInterpolator.BACKENDS[1]:
+            xs = np.fromiter((float(Fraction(x)) for x in xs), dtype=np.float64)
+            if self.size() == 0:
+                return np.zeros((len(xs), self.series))
+
+            # the same as *compute*, vectorized over xs (rows) and the series (columns)
+            res = np.tile(self.c_data[-1], (len(xs), 1))
+            for i in range(self.size() - 2, -1, -1):
+                res *= (xs - self.x_data[i])[:, np.newaxis]
+                res += self.c_data[i]
+            return res
+
+        return [self.compute(x) for x in xs]
+
+    def clear(self):
+        """Remove all the points, the number of series and the backend are kept
+
+        :rtype: None
+        """
+        self.__init__(self.series, self.backend)
@@ -0,0 +1,86 @@
+"""Evaluation of the exact Newton form over integers, in the current process or in a pool of processes
+
+The pool workers receive the Newton form once, from the pool initializer, and then only the chunks of x values are
+sent to them, so the (large) integers of the interpolation are not pickled for every task.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+
+# the number of chunks of each worker, more chunks balance the work better when some x values are slower
+CHUNKS_PER_WORKER = 4
+
+# the Newton form of the interpolation in the worker process, set by *_init_worker*
+_worker_newton_form = None
+
+
+def exact_newton_values(x_numerators, x_denominator, c_numerators, c_denominator, xs):
+    """Compute the Newton form at many values of x using nested (Horner) multiplication over integers
+
+    x_i = X_i / D, c_i = C_i / E and x = p / q, so (x - x_i) = (p * D - X_i * q) / (q * D), and the Fraction
+    normalization (gcd) is done only once for each result.
+
+    :param x_numerators: the numerators X_i of the x values with a c value
+    :type x_numerators: List[int]
+    :param x_denominator: the common denominator D of the x values
+    :type x_denominator: int
+    :param c_numerators: the numerators C_i of the c values
+    :type c_numerators: List[int]
+    :param c_denominator: the common denominator E of the c values
+    :type c_denominator: int
+    :param xs: the values of x
+    :type xs: List[Fraction]
+    :return: the results in the same order as xs
+    :rtype: List[Fraction]
+    """
+    size = len(c_numerators)
+
+    if size == 0:
+        return [0] * len(xs)
+
+    qs = [x.denominator for x in xs]
+    scaled_ps = [x.numerator * x_denominator for x in xs]
+    scales = [q * x_denominator for q in qs]
+
+    # res / (E * (q * D)^(size - 1 - i)) is the nested value starting from c_i
+    res = [c_numerators[-1]] * len(xs)
+    powers = [1] * len(xs)
+    for i in range(size - 2, -1, -1):
+        c, old_x = c_numerators[i], x_numerators[i]
+        powers = [power * scale for power, scale in zip(powers, scales)]
+        res = [c * power + (scaled_p - old_x * q) * r
+               for power, scaled_p, q, r in zip(powers, scaled_ps, qs, res)]
+
+    return [Fraction(r, c_denominator * power) for r, power in zip(res, powers)]
+
+
+def _init_worker(newton_form):
+    global _worker_newton_form
+    _worker_newton_form = newton_form
+
+
+def _compute_chunk(xs):
+    return exact_newton_values(*_worker_newton_form, xs)
+
+
+def parallel_exact_newton_values(newton_form, xs, workers):
+    """*exact_newton_values* split over chunks of xs computed by a pool of processes
+
+    :param newton_form: the arguments of *exact_newton_values* before xs
+    :type newton_form: tuple
+    :param xs: the values of x
+    :type xs: List[Fraction]
+    :param workers: the number of processes
+    :type workers: int
+    :return: the results in the same order as xs
+    :rtype: List[Fraction]
+    """
+    chunk_size = -(-len(xs) // (workers * CHUNKS_PER_WORKER))
+    chunks = [xs[i:i + chunk_size] for i in range(0, len(xs), chunk_size)]
+
+    res = []
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(newton_form,)) as executor:
+        # map returns the results of the chunks in order
+        for chunk_res in executor.map(_compute_chunk, chunks):
+            res.extend(chunk_res)
+
+    return res
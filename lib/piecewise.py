@@ -0,0 +1,191 @@
+from bisect import bisect_left
+
+
+class PiecewiseIndex:
+    """Class that keeps the points sorted by x, and interpolates locally using the nearest points
+
+    Each value of x is computed using a Newton polynomial of low *degree* over a window of *degree* + 1
+    consecutive points around it, which is found by bisection in O(log n) and computed in O(degree).
+
+    The c values of the windows are cached by the x of their first point, and adding, removing or changing a point
+    only removes the windows that contain it.
+    """
+
+    def __init__(self, degree=3):
+        """Initialize an empty index
+
+        :param degree: the degree of the local polynomials
+        :type degree: int
+        """
+        if degree < 1:
+            raise ValueError("degree must be at least 1")
+
+        self.degree = degree
+
+        # the points sorted by x
+        self.x_data = []
+        self.y_data = []
+
+        # {x of the first point of the window: (window size, c values of the window)}
+        self.windows = {}
+
+    def size(self):
+        return len(self.x_data)
+
+    def insert(self, x, y):
+        """Add the point (x, y) to the index
+
+        :param x: point x
+        :type x: Fraction
+        :param y: point y
+        :type y: Fraction
+        :raises ZeroDivisionError: if x already exists, same as the division by (x - x) in the other algorithms
+        :rtype: None
+        """
+        position = bisect_left(self.x_data, x)
+
+        if position < len(self.x_data) and self.x_data[position] == x:
+            raise ZeroDivisionError(f"this value of x ({x}) already exists")
+
+        # the windows with points on both sides of the new point
+        self.__invalidate(position - self.degree, position - 1)
+
+        self.x_data.insert(position, x)
+        self.y_data.insert(position, y)
+
+    def remove(self, x):
+        """Remove the point with the value x from the index
+
+        :param x: point x
+        :type x: Fraction
+        :rtype: None
+        """
+        position = self.__position_of(x)
+
+        self.__invalidate(position - self.degree, position)
+
+        del self.x_data[position]
+        del self.y_data[position]
+
+    def update(self, x, y):
+        """Change the y value of the point with the value x
+
+        :param x: point x
+        :type x: Fraction
+        :param y: the new value of y
+        :type y: Fraction
+        :rtype: None
+        """
+        position = self.__position_of(x)
+
+        self.__invalidate(position - self.degree, position)
+
+        self.y_data[position] = y
+
+    def compute(self, x):
+        """Compute x using the window of the nearest points
+
+        :param x: input
+        :type x: Fraction
+        :return: result of the compute
+        :rtype: Fraction
+        """
+        size = len(self.x_data)
+        if size == 0:
+            return 0
+
+        position = bisect_left(self.x_data, x)
+        if position < size and self.x_data[position] == x:
+            return self.y_data[position]
+
+        start = self.__window_start(position)
+        c_data = self.__window(start)
+
+        # nested (Horner) form of the Newton polynomial of the window
+        res = c_data[-1]
+        for i in range(len(c_data) - 2, -1, -1):
+            res = c_data[i] + (x - self.x_data[start + i]) * res
+
+        return res
+
+    def pieces(self):
+        """Get the windows used between the points
+
+        :return: list of (first x, last x, c values, x values of the window) for each range of x that uses the same
+                 window, sorted by x
+        :rtype: List[Tuple[Fraction, Fraction, list, list]]
+        """
+        size = len(self.x_data)
+        if size == 1:
+            return [(self.x_data[0], self.x_data[0], [self.y_data[0]], self.x_data[:1])]
+
+        res = []
+        last_start = None
+        for i in range(size - 1):
+            # the window of the values between x_i and x_i+1
+            start = self.__window_start(i + 1)
+            if start == last_start:
+                res[-1] = (res[-1][0], self.x_data[i + 1], res[-1][2], res[-1][3])
+            else:
+                window_size = min(self.degree + 1, size)
+                res.append((self.x_data[i], self.x_data[i + 1], self.__window(start),
+                            self.x_data[start:start + window_size]))
+                last_start = start
+
+        return res
+
+    def __position_of(self, x):
+        position = bisect_left(self.x_data, x)
+
+        if position == len(self.x_data) or self.x_data[position] != x:
+            raise ValueError(f"this value of x ({x}) does not exist")
+
+        return position
+
+    def __window_start(self, position):
+        """get the index of the first point of the window for a value of x between the points position - 1 and
+        position, the window is centered around it but it must be inside the points.
+
+        :param position: the position of the value in the sorted points
+        :type position: int
+        :rtype: int
+        """
+        window_size = min(self.degree + 1, len(self.x_data))
+        return min(max(position - window_size // 2, 0), len(self.x_data) - window_size)
+
+    def __window(self, start):
+        """get the c values of the window starting at *start*, building them if they are not cached
+
+        :param start: the index of the first point of the window
+        :type start: int
+        :rtype: list
+        """
+        window_size = min(self.degree + 1, len(self.x_data))
+        key = self.x_data[start]
+
+        cached = self.windows.get(key)
+        if cached is not None and cached[0] == window_size:
+            return cached[1]
+
+        x_data = self.x_data[start:start + window_size]
+        c_data = self.y_data[start:start + window_size]
+
+        # the divided differences table, one column at a time in place, the first item of each column is c_j
+        for j in range(1, window_size):
+            for i in range(window_size - 1, j - 1, -1):
+                c_data[i] = (c_data[i] - c_data[i - 1]) / (x_data[i] - x_data[i - j])
+
+        self.windows[key] = (window_size, c_data)
+        return c_data
+
+    def __invalidate(self, first, last):
+        """remove the cached windows which start at the points from *first* to *last*
+
+        :param first: the index of the first point
+        :type first: int
+        :param last: the index of the last point
+        :type last: int
+        :rtype: None
+        """
+        for i in range(max(first, 0), min(last, len(self.x_data) - 1) + 1):
+            self.windows.pop(self.x_data[i], None)
@@ -0,0 +1,148 @@
+from fractions import Fraction
+
+
+class PointsReader:
+    """Class that streams the (x, y) points stored in a file, a pair in each line
+
+    The pairs can be separated by whitespace (ex. "  0.00   1.34") or by a comma (csv, ex. "0.0,4.0"), and the
+    numbers can be in any format the number type accepts (ex. "-7.0710678e-01" or "1/3" for Fraction).
+    The format is detected once from the first non-empty line, and the file is read in large chunks.
+
+    The lines that could not be read are not reported while reading, but stored in *malformed* with their line
+    numbers, so they can be reported at once after reading the file.
+
+    The first non-empty line can be a header with a name for each column (ex. "x,y1,y2"), when none of its values
+    is a number. it is stored in *header* and not read as a point.
+
+    With *multi_column*, each line can have many y values after x (a column for each series), the number of
+    columns is detected from the header or the first non-empty line, and the points are (x, [y1, ..., ym]).
+    Otherwise only the first y value of each line is read, and the other values are ignored.
+    """
+    FORMATS = ["whitespace", "csv", ]
+
+    # the size of the chunks the file is read with
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, filename, number_type=Fraction, chunk_size=CHUNK_SIZE, multi_column=False):
+        """Initialize the reader, the file is only opened when the points are iterated
+
+        :param filename: the file to read the points from
+        :type filename: str
+        :param number_type: the function to convert each number from its string
+        :type number_type: Callable[[str], Any]
+        :param chunk_size: the number of characters to read at once
+        :type chunk_size: int
+        :param multi_column: read all the y columns of each line, instead of only the first one, None to read them
+                             only if the file has a header with more than one y column
+        :type multi_column: Optional[bool]
+        """
+        self.filename = filename
+        self.number_type = number_type
+        self.chunk_size = chunk_size
+        self.multi_column = multi_column
+        # the multi_column mode of the last read, after it is decided from the header
+        self.is_multi_column = bool(multi_column)
+
+        # the names of the columns from the header line, or None if the file has no header
+        self.header = None
+        # one of *PointsReader.FORMATS*, detected from the first non-empty line
+        self.format = None
+        # the number of values in each line (x and the y values) for *multi_column*, detected from the first line
+        self.columns = None
+        # [(line_number, line)] of the lines that are not a pair of numbers
+        self.malformed = []
+
+    def __iter__(self):
+        """Read the points from the file
+
+        :return: generator of the points in the order of the file
+        :rtype: Iterator[Tuple[Any, Any]]
+        """
+        self.format = None
+        self.columns = None
+        self.header = None
+        self.is_multi_column = bool(self.multi_column)
+        self.malformed = []
+
+        line_number = 0
+
+        with open(self.filename, 'r') as f:
+            remainder = ''
+
+            while True:
+                chunk = f.read(self.chunk_size)
+                if not chunk:
+                    break
+
+                lines = (remainder + chunk).split('\n')
+                # the last line may continue in the next chunk
+                remainder = lines.pop()
+
+                for line in lines:
+                    line_number += 1
+                    point = self.__parse_line(line, line_number)
+                    if point is not None:
+                        yield point
+
+            if remainder:
+                point = self.__parse_line(remainder, line_number + 1)
+                if point is not None:
+                    yield point
+
+    def __parse_line(self, line, line_number):
+        """Convert a line to a point, or store it in *malformed* if it is not a point
+
+        :param line: a line from the file
+        :type line: str
+        :param line_number: the number of the line in the file, starting from 1
+        :type line_number: int
+        :return: the point or None if the line is empty or malformed
+        :rtype: Optional[Tuple[Any, Union[Any, list]]]
+        """
+        line = line.strip()
+        if not line:
+            return None
+
+        first_line = self.format is None
+        if first_line:
+            self.format = PointsReader.FORMATS[1] if ',' in line else PointsReader.FORMATS[0]
+
+        values = line.split(',') if self.format == PointsReader.FORMATS[1] else line.split()
+
+        if first_line:
+            if len(values) >= 2 and not any(map(self.__is_number, values)):
+                self.header = [value.strip() for value in values]
+            if self.multi_column is None:
+                self.is_multi_column = self.header is not None and len(self.header) > 2
+            if self.header is not None:
+                if self.is_multi_column:
+                    self.columns = len(self.header)
+                return None
+
+        if self.is_multi_column and self.columns is None and len(values) >= 2:
+            self.columns = len(values)
+
+        if len(values) < 2 or (self.is_multi_column and len(values) != self.columns):
+            self.malformed.append((line_number, line))
+            return None
+
+        try:
+            if self.is_multi_column:
+                return self.number_type(values[0].strip()), [self.number_type(value.strip()) for value in values[1:]]
+            return self.number_type(values[0].strip()), self.number_type(values[1].strip())
+        except (ValueError, ZeroDivisionError):
+            self.malformed.append((line_number, line))
+            return None
+
+    def __is_number(self, value):
+        """check if a value of a line can be read as a number
+
+        :param value: a value from a line
+        :type value: str
+        :rtype: bool
+        """
+        try:
+            self.number_type(value.strip())
+            return True
+        except (ValueError, ZeroDivisionError):
+            return False
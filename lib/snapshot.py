@@ -0,0 +1,254 @@
+"""Binary snapshots of the full state of an Interpolator
+
+The snapshot stores the points and the computed values (c_data, and in_c_data or w_data based on the algorithm),
+so loading it does not recompute anything. The "fraction" and "decimal" sections are copied from the memory mapped
+file, and only decoded when the interpolator uses them (see *Interpolator.restore*).
+
+format (all integers are little endian):
+
+    header      b'INTERP', format version (u16), algorithm (str), backend (str), piecewise degree (u16),
+                precision (u16), guard digits (u16)
+    section     x_data, y_data, c_data, then in_c_data for "divide", w_data for "barycentric" or the end slopes for a
+                clamped "spline" (empty for a natural one)
+
+    str         length (u16), utf-8 bytes
+    section     number of values (u64), size of the values in bytes (u64), values
+    value       "fraction": numerator then denominator, each as length (u32), signed bytes
+                "float64": 8 bytes double, the section is a contiguous array
+                "decimal": the signed integer coefficient then the exponent, each as length (u32), signed bytes
+
+only the snapshots of the current format version can be loaded.
+"""
+import mmap
+import struct
+from decimal import Decimal
+from fractions import Fraction
+
+import numpy as np
+
+from lib.interpolate import Interpolator
+
+MAGIC = b'INTERP'
+FORMAT_VERSION = 4
+
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+
+
+def _encode_int(n):
+    """encode a signed integer with its length before it
+
+    :param n: the integer
+    :type n: int
+    :rtype: bytes
+    """
+    # one extra bit for the sign
+    data = n.to_bytes((n.bit_length() + 8) // 8, 'little', signed=True)
+    return _U32.pack(len(data)) + data
+
+
+def _encode_str(s):
+    data = s.encode('utf-8')
+    return _U16.pack(len(data)) + data
+
+
+def _encode_section(values, backend):
+    """encode a list of values to a section
+
+    :param values: the values of the section
+    :type values: Union[list, np.ndarray]
+    :param backend: the backend of the values, one of *Interpolator.BACKENDS*
+    :type backend: str
+    :rtype: bytes
+    """
+    res = []
+
+    if backend == Interpolator.BACKENDS[1]:
+        res.append(np.asarray(values, dtype='<f8').tobytes())
+    elif backend == Interpolator.BACKENDS[2]:
+        for value in values:
+            sign, digits, exponent = value.as_tuple()
+            coefficient = int(''.join(map(str, digits)))
+            res.append(_encode_int(-coefficient if sign else coefficient))
+            res.append(_encode_int(exponent))
+    else:
+        for value in values:
+            res.append(_encode_int(value.numerator))
+            res.append(_encode_int(value.denominator))
+
+    data = b''.join(res)
+    return _U64.pack(len(values)) + _U64.pack(len(data)) + data
+
+
+def save_state(interpolator, filename):
+    """Save the full state of the interpolator to a binary snapshot file
+
+    :param interpolator: the interpolator to be saved
+    :type interpolator: Interpolator
+    :param filename: the file to save the snapshot to
+    :type filename: str
+    :rtype: None
+    """
+    backend = interpolator.backend
+    extra = []
+    if interpolator.algorithm == Interpolator.MODES[1]:
+        extra = interpolator.in_c_data
+    elif interpolator.algorithm == Interpolator.MODES[2]:
+        extra = interpolator.w_data
+    elif interpolator.algorithm == Interpolator.MODES[4] and interpolator.spline.slopes is not None:
+        extra = list(interpolator.spline.slopes)
+
+    with open(filename, 'wb') as f:
+        f.write(MAGIC + _U16.pack(FORMAT_VERSION))
+        f.write(_encode_str(interpolator.algorithm) + _encode_str(backend))
+        f.write(_U16.pack(interpolator.piecewise.degree if interpolator.algorithm == Interpolator.MODES[3] else 0))
+        f.write(_U16.pack(interpolator.precision) + _U16.pack(interpolator.guard_digits))
+
+        for values in (interpolator.x_data, interpolator.y_data, interpolator.c_data, extra):
+            f.write(_encode_section(values, backend))
+
+
+class _SnapshotDecoder:
+    """Decode the values of a snapshot in order, directly from the memory mapped file or from a copied section"""
+
+    def __init__(self, data):
+        """
+        :param data: the memory mapped file, or the bytes of a section
+        :type data: Union[memoryview, bytes]
+        """
+        self.data = data
+        self.offset = 0
+
+    def read(self, size):
+        if self.offset + size > len(self.data):
+            raise ValueError("the snapshot file is truncated")
+
+        res = self.data[self.offset:self.offset + size]
+        self.offset += size
+        return res
+
+    def read_int(self):
+        length = _U32.unpack(self.read(_U32.size))[0]
+        return int.from_bytes(self.read(length), 'little', signed=True)
+
+    def read_str(self):
+        length = _U16.unpack(self.read(_U16.size))[0]
+        return bytes(self.read(length)).decode('utf-8')
+
+    def read_section(self, backend):
+        """read a section, the "float64" sections are used as arrays without decoding each value, and the bytes of
+        the other sections are copied out of the file to be decoded later
+
+        :param backend: the backend of the values, one of *Interpolator.BACKENDS*
+        :type backend: str
+        :rtype: Union[_LazySection, np.ndarray]
+        """
+        size, data_size = (_U64.unpack(self.read(_U64.size))[0] for _ in range(2))
+
+        if backend == Interpolator.BACKENDS[1]:
+            if data_size != size * 8:
+                raise ValueError("the snapshot file is corrupted")
+            return np.frombuffer(self.read(data_size), dtype='<f8')
+
+        return _LazySection(size, bytes(self.read(data_size)), backend)
+
+    def read_values(self, size, backend):
+        """decode *size* "fraction" or "decimal" values
+
+        :param size: the number of values
+        :type size: int
+        :param backend: the backend of the values, one of *Interpolator.BACKENDS*
+        :type backend: str
+        :rtype: Union[List[Fraction], List[Decimal]]
+        """
+        read_int = self.read_int
+        if backend == Interpolator.BACKENDS[2]:
+            # the string conversion is exact, it is not rounded to the precision of the context
+            return [Decimal(f'{read_int()}E{read_int()}') for _ in range(size)]
+
+        return [Fraction(read_int(), read_int()) for _ in range(size)]
+
+
+class _LazySection:
+    """The values of a "fraction" or "decimal" section, which are decoded when *Interpolator.restore* needs them"""
+
+    def __init__(self, size, data, backend):
+        """
+        :param size: the number of values
+        :type size: int
+        :param data: the encoded values
+        :type data: bytes
+        :param backend: the backend of the values, one of *Interpolator.BACKENDS*
+        :type backend: str
+        """
+        self.size = size
+        self.data = data
+        self.backend = backend
+
+    def __len__(self):
+        return self.size
+
+    def decode(self):
+        """decode all the values of the section
+
+        :rtype: Union[List[Fraction], List[Decimal]]
+        """
+        decoder = _SnapshotDecoder(self.data)
+        res = decoder.read_values(self.size, self.backend)
+        if decoder.offset != len(self.data):
+            raise ValueError("the snapshot file is corrupted")
+        return res
+
+
+def load_state(filename, cache_size=0):
+    """Load an interpolator from a binary snapshot file
+
+    :param filename: the snapshot file
+    :type filename: str
+    :param cache_size: the cache size of the new interpolator (see *Interpolator.set_cache_size*)
+    :type cache_size: int
+    :return: the interpolator with the same state as the saved one
+    :rtype: Interpolator
+    """
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+        data = memoryview(mapped_file)
+        try:
+            decoder = _SnapshotDecoder(data)
+
+            if bytes(decoder.read(len(MAGIC))) != MAGIC:
+                raise ValueError(f"{filename} is not an interpolator snapshot")
+
+            version = _U16.unpack(decoder.read(_U16.size))[0]
+            if version != FORMAT_VERSION:
+                raise ValueError(f"snapshot format version {version} is not supported")
+
+            algorithm = decoder.read_str()
+            backend = decoder.read_str()
+            piecewise_degree = _U16.unpack(decoder.read(_U16.size))[0]
+            precision, guard_digits = (_U16.unpack(decoder.read(_U16.size))[0] for _ in range(2))
+            x_data, y_data, c_data, extra = [decoder.read_section(backend) for _ in range(4)]
+
+            if algorithm == Interpolator.MODES[3]:
+                interpolator = Interpolator(algorithm, backend, cache_size, piecewise_degree,
+                                            precision=precision, guard_digits=guard_digits)
+            elif algorithm == Interpolator.MODES[4]:
+                if isinstance(extra, _LazySection):
+                    extra = extra.decode()
+                interpolator = Interpolator(algorithm, backend, cache_size,
+                                            spline_slopes=tuple(extra) if len(extra) else None,
+                                            precision=precision, guard_digits=guard_digits)
+            else:
+                interpolator = Interpolator(algorithm, backend, cache_size,
+                                            precision=precision, guard_digits=guard_digits)
+
+            # the float arrays are copied by *restore* and the other sections are copies of their bytes, so they do
+            # not depend on the mapped file after this
+            interpolator.restore(x_data, y_data, c_data,
+                                 in_c_data=extra if algorithm == Interpolator.MODES[1] else None,
+                                 w_data=extra if algorithm == Interpolator.MODES[2] else None)
+            del decoder, x_data, y_data, c_data, extra
+        finally:
+            data.release()
+
+    return interpolator
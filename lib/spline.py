@@ -0,0 +1,245 @@
+from bisect import bisect_right
+
+import numpy as np
+
+
+class CubicSpline:
+    """Class that keeps the knots sorted by x, and interpolates them using a cubic spline
+
+    The spline is "natural" (zero second derivative at both ends) by default, or "clamped" if the slopes at both
+    ends are given. The tridiagonal system of the second derivatives is solved by the Thomas algorithm in O(n),
+    and it is only solved when a value is computed after the knots change, so adding many knots is linear.
+
+    The arithmetic is done with the type of the given values, so it is exact with Fraction.
+    """
+
+    def __init__(self, slopes=None):
+        """Initialize an empty spline
+
+        :param slopes: the slopes (first derivative) at the first and last knots for a "clamped" spline,
+                       or None for a "natural" spline
+        :type slopes: Optional[Tuple[Fraction, Fraction]]
+        """
+        self.slopes = slopes
+
+        # the knots sorted by x
+        self.x_data = []
+        self.y_data = []
+
+        # [a, b, c, d] of each interval, a + b(x - x_i) + c(x - x_i)^2 + d(x - x_i)^3, None if they need solving
+        self.coefficients = None
+        # the arrays of x_data and coefficients for *compute_many* with floats
+        self.__arrays = None
+
+    def size(self):
+        return len(self.x_data)
+
+    def insert(self, x, y):
+        """Add the knot (x, y) to the spline
+
+        :param x: knot x
+        :type x: Fraction
+        :param y: knot y
+        :type y: Fraction
+        :raises ZeroDivisionError: if x already exists, same as the division by (x - x) in the other algorithms
+        :rtype: None
+        """
+        position = bisect_right(self.x_data, x)
+
+        if position > 0 and self.x_data[position - 1] == x:
+            raise ZeroDivisionError(f"this value of x ({x}) already exists")
+
+        self.x_data.insert(position, x)
+        self.y_data.insert(position, y)
+        self.__invalidate()
+
+    def insert_many(self, xs, ys):
+        """Add many knots to the spline at once, the x values must be new and different
+
+        :param xs: knots x
+        :type xs: list
+        :param ys: knots y
+        :type ys: list
+        :rtype: None
+        """
+        points = sorted(zip(self.x_data + list(xs), self.y_data + list(ys)))
+
+        self.x_data = [point[0] for point in points]
+        self.y_data = [point[1] for point in points]
+        self.__invalidate()
+
+    def remove(self, x):
+        """Remove the knot with the value x
+
+        :param x: knot x
+        :type x: Fraction
+        :rtype: None
+        """
+        position = self.__position_of(x)
+
+        del self.x_data[position]
+        del self.y_data[position]
+        self.__invalidate()
+
+    def update(self, x, y):
+        """Change the y value of the knot with the value x
+
+        :param x: knot x
+        :type x: Fraction
+        :param y: the new value of y
+        :type y: Fraction
+        :rtype: None
+        """
+        self.y_data[self.__position_of(x)] = y
+        self.__invalidate()
+
+    def compute(self, x):
+        """Compute x using the cubic of its interval, the first and last cubics are used outside the knots
+
+        :param x: input
+        :type x: Fraction
+        :return: result of the compute
+        :rtype: Fraction
+        """
+        if not self.x_data:
+            return 0
+
+        self.solve()
+
+        i = self.__interval_of(x)
+        a, b, c, d = self.coefficients[i]
+        dx = x - self.x_data[i]
+
+        return a + dx * (b + dx * (c + dx * d))
+
+    def compute_many(self, xs):
+        """Compute many values of x, vectorized for floats
+
+        :param xs: inputs
+        :type xs: Union[list, np.ndarray]
+        :return: results of the compute
+        :rtype: Union[list, np.ndarray]
+        """
+        if not isinstance(xs, np.ndarray):
+            return [self.compute(x) for x in xs]
+
+        if not self.x_data:
+            return np.zeros(len(xs))
+
+        self.solve()
+
+        if self.__arrays is None:
+            self.__arrays = (np.array(self.x_data, dtype=np.float64),
+                             np.array(self.coefficients, dtype=np.float64).reshape(-1, 4))
+        x_data, coefficients = self.__arrays
+
+        intervals = np.clip(np.searchsorted(x_data, xs, side='right') - 1, 0, len(coefficients) - 1)
+        a, b, c, d = coefficients[intervals].T
+        dx = xs - x_data[intervals]
+
+        return a + dx * (b + dx * (c + dx * d))
+
+    def solve(self):
+        """Build the coefficients of the intervals if the knots changed since the last solve
+
+        :rtype: None
+        """
+        if self.coefficients is not None:
+            return
+
+        x_data, y_data = self.x_data, self.y_data
+        size = len(x_data)
+
+        # zero and one of the number type, so the divisions do not turn the Fractions into floats
+        zero = y_data[0] * 0
+        one = zero + 1
+
+        if size == 1:
+            self.coefficients = [[y_data[0], zero, zero, zero]]
+            return
+
+        h = [x_data[i + 1] - x_data[i] for i in range(size - 1)]
+        slopes = [(y_data[i + 1] - y_data[i]) / h[i] for i in range(size - 1)]
+
+        # the tridiagonal system of the second derivatives m, lower[i] m[i-1] + diagonal[i] m[i] + upper[i] m[i+1]
+        lower, diagonal, upper, rhs = [zero] * size, [one] * size, [zero] * size, [zero] * size
+        for i in range(1, size - 1):
+            lower[i], diagonal[i], upper[i] = h[i - 1], 2 * (h[i - 1] + h[i]), h[i]
+            rhs[i] = 6 * (slopes[i] - slopes[i - 1])
+
+        if self.slopes is not None:
+            first_slope, last_slope = self.slopes
+            diagonal[0], upper[0] = 2 * h[0], h[0]
+            rhs[0] = 6 * (slopes[0] - first_slope)
+            lower[-1], diagonal[-1] = h[-1], 2 * h[-1]
+            rhs[-1] = 6 * (last_slope - slopes[-1])
+
+        m = CubicSpline.__thomas(lower, diagonal, upper, rhs)
+
+        self.coefficients = [
+            [y_data[i], slopes[i] - h[i] * (2 * m[i] + m[i + 1]) / 6, m[i] / 2, (m[i + 1] - m[i]) / (6 * h[i])]
+            for i in range(size - 1)
+        ]
+
+    def pieces(self):
+        """Get the cubics of the intervals
+
+        :return: list of (first x, last x, [a, b, c, d]) sorted by x
+        :rtype: List[Tuple[Fraction, Fraction, list]]
+        """
+        if not self.x_data:
+            return []
+
+        self.solve()
+
+        if len(self.x_data) == 1:
+            return [(self.x_data[0], self.x_data[0], self.coefficients[0])]
+
+        return [(self.x_data[i], self.x_data[i + 1], self.coefficients[i]) for i in range(len(self.x_data) - 1)]
+
+    @staticmethod
+    def __thomas(lower, diagonal, upper, rhs):
+        """Solve a tridiagonal system in O(n) using the Thomas algorithm
+
+        :param lower: the values below the diagonal, lower[0] is not used
+        :type lower: list
+        :param diagonal: the values of the diagonal
+        :type diagonal: list
+        :param upper: the values above the diagonal, upper[-1] is not used
+        :type upper: list
+        :param rhs: the right hand side of the system
+        :type rhs: list
+        :return: the solution
+        :rtype: list
+        """
+        size = len(diagonal)
+        new_upper, new_rhs = [0] * size, [0] * size
+
+        new_upper[0] = upper[0] / diagonal[0]
+        new_rhs[0] = rhs[0] / diagonal[0]
+        for i in range(1, size):
+            denominator = diagonal[i] - lower[i] * new_upper[i - 1]
+            new_upper[i] = upper[i] / denominator
+            new_rhs[i] = (rhs[i] - lower[i] * new_rhs[i - 1]) / denominator
+
+        res = new_rhs
+        for i in range(size - 2, -1, -1):
+            res[i] = new_rhs[i] - new_upper[i] * res[i + 1]
+
+        return res
+
+    def __position_of(self, x):
+        position = bisect_right(self.x_data, x) - 1
+
+        if position < 0 or self.x_data[position] != x:
+            raise ValueError(f"this value of x ({x}) does not exist")
+
+        return position
+
+    def __interval_of(self, x):
+        """get the index of the interval of x, the first and last intervals are extended outside the knots"""
+        return min(max(bisect_right(self.x_data, x) - 1, 0), max(len(self.x_data) - 2, 0))
+
+    def __invalidate(self):
+        self.coefficients = None
+        self.__arrays = None
@@ -0,0 +1,18 @@
+"""Helpers shared by the tests"""
+import os
+import tempfile
+
+
+def temporary_path(test, name):
+    """Get the path of a file in a new temporary directory, which is removed when the test ends
+
+    :param test: the test that uses the file
+    :type test: unittest.TestCase
+    :param name: the name of the file
+    :type name: str
+    :return: the path of the file, which does not exist yet
+    :rtype: str
+    """
+    directory = tempfile.TemporaryDirectory()
+    test.addCleanup(directory.cleanup)
+    return os.path.join(directory.name, name)
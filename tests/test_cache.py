@@ -0,0 +1,40 @@
+import unittest
+from fractions import Fraction
+
+from lib.interpolate import Interpolator
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.interpolator = Interpolator(cache_size=2)
+        self.interpolator.add_many([Fraction(0), Fraction(1), Fraction(2)], [Fraction(1), Fraction(2), Fraction(5)])
+
+    def test_hits_and_misses(self):
+        for x in (Fraction(1, 2), Fraction(1, 2), Fraction(3, 2), Fraction(1, 2)):
+            self.interpolator.compute(x)
+        self.assertEqual((self.interpolator.cache_hits, self.interpolator.cache_misses), (2, 2))
+
+    def test_least_recently_used_removed(self):
+        for x in (Fraction(1, 2), Fraction(3, 2), Fraction(1, 2), Fraction(5, 2), Fraction(3, 2)):
+            self.interpolator.compute(x)
+        # 3/2 was the least recently used one when 5/2 was added
+        self.assertEqual((self.interpolator.cache_hits, self.interpolator.cache_misses), (1, 4))
+
+    def test_invalidated_by_changes(self):
+        self.assertEqual(self.interpolator.compute(Fraction(3)), 10)
+        self.interpolator.add(Fraction(3), Fraction(7))
+        self.assertEqual(self.interpolator.compute(Fraction(3)), 7)
+        self.assertEqual(self.interpolator.cache_hits, 0)
+
+    def test_set_cache_size(self):
+        self.interpolator.compute(Fraction(1, 2))
+        self.interpolator.set_cache_size(0)
+        self.interpolator.compute(Fraction(1, 2))
+        self.assertEqual((self.interpolator.cache_hits, self.interpolator.cache_misses), (0, 1))
+
+        with self.assertRaises(ValueError):
+            self.interpolator.set_cache_size(-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+import io
+import os
+import unittest
+from contextlib import redirect_stdout
+
+from interactive_main import run_script
+from support import temporary_path
+
+
+def run(*commands):
+    """run the commands as a script, and get the exit status and the output"""
+    output = io.StringIO()
+    with redirect_stdout(output):
+        status = run_script(commands)
+    return status, output.getvalue()
+
+
+class TestAdd(unittest.TestCase):
+    def test_zero_denominator(self):
+        status, output = run('add 1/0 2')
+        self.assertEqual(status, 1)
+        self.assertIn('is not correct', output)
+
+    def test_zero_denominator_in_many_points(self):
+        status, output = run('add 1/0 2 3 4', 'compute 0')
+        self.assertEqual(status, 1)
+        self.assertIn('malformed points: (1/0, 2)', output)
+        self.assertIn('= 4', output)
+
+
+class TestAddFile(unittest.TestCase):
+    def write(self, text):
+        filename = temporary_path(self, 'points.txt')
+        with open(filename, 'w') as f:
+            f.write(text)
+        return filename
+
+    def test_extra_values_ignored(self):
+        filename = self.write('1 2\n3 4 note\n5 6 7\n')
+        status, output = run(f'addfile {filename}', 'compute 7')
+        self.assertEqual(status, 0)
+        self.assertIn('added 3 points', output)
+        self.assertIn('P2(7) = 8', output)
+
+    def test_series_asked(self):
+        filename = self.write('0 1 2\n1 2 3\n')
+        status, output = run(f'addfile {filename} series', 'series 2', f'addfile {filename} columns')
+        self.assertEqual(status, 1)
+        self.assertIn('added 2 points of 2 series', output)
+        self.assertIn('P(2) = 3, 4', output)
+        self.assertIn('unknown option columns', output)
+
+    def test_header(self):
+        for text, added in (('x,y1,y2\n0,1,2\n1,2,3\n', 'added 2 points of 2 series'),
+                            ('x y\n0 1 2\n1 2 3\n', 'added 2 points\n')):
+            with self.subTest(text=text):
+                status, output = run(f'addfile {self.write(text)}')
+                self.assertEqual(status, 0)
+                self.assertIn(added, output)
+
+
+class TestRemoveAndSet(unittest.TestCase):
+    def test_zero_denominator(self):
+        status, output = run('add 1 2', 'remove 1/0', 'set 1/0 2', 'set 1 1/0', 'compute 1')
+        self.assertEqual(status, 1)
+        self.assertIn('the input for remove is not correct', output)
+        self.assertEqual(output.count('the input for set is not correct'), 2)
+        self.assertIn('= 2', output)
+
+
+class TestTabulate(unittest.TestCase):
+    def test_zero_denominator(self):
+        status, output = run('add 1 2 3 4', 'tabulate 1/0 2 3', 'tabulate 1 3 3')
+        self.assertEqual(status, 1)
+        self.assertIn('the input for tabulate is not correct', output)
+        self.assertIn('(2, 3)', output)
+
+    def test_compute_zero_denominator(self):
+        status, output = run('add 1 2 3 4', 'compute 1/0')
+        self.assertEqual(status, 1)
+        self.assertIn('Error in evaluating value', output)
+
+
+class TestApprox(unittest.TestCase):
+    def test_ans_is_exact(self):
+        status, output = run('add 0 0 3 1 7 5', 'approx 1/3', 'ans')
+        self.assertEqual(status, 0)
+        self.assertIn('P2(1/3) = 0.0264550', output)
+        self.assertIn('ans = 5/189', output)
+
+    def test_ans_before_points_change(self):
+        status, output = run('add 0 0 3 1 7 5', 'approx 1/3', 'add 1 1', 'ans', 'stats')
+        self.assertEqual(status, 0)
+        self.assertIn('ans = 5/189', output)
+        self.assertIn('filter-hits = 1', output)
+
+
+class TestPrint(unittest.TestCase):
+    def test_long_numbers(self):
+        # longer than the default limit of int to str conversion (4300 digits)
+        large = '1' + '0' * 5000
+        filename = temporary_path(self, 'nested.txt')
+        status, output = run(f'add 0 {large} 1 0', 'print', 'print nested', f'print nested {filename}')
+        self.assertEqual(status, 0)
+        self.assertEqual(output.count(large), 4)
+        with open(filename) as f:
+            self.assertIn(large, f.read())
+
+    def test_expanded_without_single_polynomial(self):
+        for algorithm in ('piecewise', 'spline'):
+            with self.subTest(algorithm=algorithm):
+                status, output = run(f'config algorithm={algorithm}', 'add 0 0 1 1 2 4', 'print expanded',
+                                     'compute 1')
+                self.assertEqual(status, 1)
+                self.assertIn('print expanded is not available', output)
+                self.assertIn('= 1', output)
+
+
+class TestComputeLocation(unittest.TestCase):
+    def test_backends(self):
+        for backend, result in (('fraction', '25/4'), ('float64', '6.25'), ('decimal', '6.25')):
+            with self.subTest(backend=backend):
+                status, output = run(f'config backend={backend}', 'add 1 1 2 4 3 9', 'comploc 1.5')
+                self.assertEqual(status, 0)
+                self.assertIn(f'P2(5/2) = P2(2.5) = {result}', output)
+
+    def test_wrong_location(self):
+        status, output = run('add 1 1 2 4 3 9', 'comploc 1/0', 'comploc 2.5', 'comploc 2')
+        self.assertEqual(status, 1)
+        self.assertIn('Error in evaluating value x = 1/0', output)
+        self.assertIn('the value location 5/2 you are trying to compute does not exist', output)
+        self.assertIn('P2(3) = P2(3) = 9', output)
+
+
+class TestConfig(unittest.TestCase):
+    def test_failed_rebuild_keeps_points(self):
+        # both x values are 1.0 in float64
+        status, output = run('add 1 2 1.00000000000000000001 3', 'config backend=float64', 'config backend',
+                             'compute 2')
+        self.assertEqual(status, 1)
+        self.assertIn('the points can not be kept with the new config', output)
+        self.assertNotIn('wrong format', output)
+        self.assertIn('backend = fraction', output)
+        self.assertIn('P1(2) = 100000000000000000002', output)
+
+    def test_rebuild_from_exact_points(self):
+        # the x values are the same with 2 digits, and rounded with 3 digits
+        status, output = run('config backend=decimal', 'config guard-digits=0', 'add 1/3 0 0.334 1',
+                             'config precision=2', 'config precision=3', 'config precision=30',
+                             'config backend=fraction', 'compute 1/3', 'compute 0.334')
+        self.assertEqual(status, 1)
+        self.assertIn('this value of x (0.33) already exists', output)
+        self.assertIn('P1(1/3) = 0\n', output)
+        self.assertIn('P1(167/500) = 1\n', output)
+
+
+class TestPlot(unittest.TestCase):
+    def setUp(self):
+        self.filename = temporary_path(self, 'plot.png')
+
+    def test_zero_denominator(self):
+        status, output = run('add 1 2 3 4', f'plot {self.filename} 1/0 2')
+        self.assertEqual(status, 1)
+        self.assertIn('the range for plot is not correct', output)
+        self.assertFalse(os.path.exists(self.filename))
+
+    def test_values_too_large_for_float(self):
+        # the c values are about 10^200 and 10^400, so the float values of the line overflow
+        small = '1/1' + '0' * 200
+        status, output = run(f'add 0 0 {small} 1 2{small[1:]} 0', f'plot {self.filename}')
+        self.assertEqual(status, 0)
+        self.assertIn('plot saved', output)
+        self.assertTrue(os.path.exists(self.filename))
+
+
+if __name__ == '__main__':
+    unittest.main()
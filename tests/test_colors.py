@@ -0,0 +1,35 @@
+import io
+import unittest
+
+from lib.colors import RESET, ColorWriter, compile_template, foreground
+
+
+class TestCompileTemplate(unittest.TestCase):
+    def test_color(self):
+        self.assertEqual(compile_template('#RED#[ERROR]% \\#x'), foreground(9) + '[ERROR]' + RESET + ' \\#x')
+
+    def test_without_color(self):
+        self.assertEqual(compile_template('@YELLOW@#RED#[$#BLUE#*%]% {}', False), '[*] {}')
+
+
+class TestColorWriter(unittest.TestCase):
+    def test_buffered(self):
+        stream = io.StringIO()
+        # StringIO is not a terminal, so the markup is removed
+        writer = ColorWriter(stream, color=True, buffer_size=10)
+
+        writer.write_line('#GREEN#{}%', 'abc')
+        self.assertEqual(stream.getvalue(), '')
+        writer.write_line('#GREEN#{}%', 'defghi')
+        self.assertEqual(stream.getvalue(), 'abc\ndefghi\n')
+
+    def test_flushed_on_exit(self):
+        stream = io.StringIO()
+        with ColorWriter(stream) as writer:
+            writer.write_line('(#GREEN#{}%, {})', 1, '#RED#')
+        # the values are not searched for markup
+        self.assertEqual(stream.getvalue(), '(1, #RED#)\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
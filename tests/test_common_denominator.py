@@ -0,0 +1,76 @@
+import unittest
+from fractions import Fraction
+from random import Random
+
+from lib.interpolate import CommonDenominatorArray, Interpolator
+
+
+def newton_value(xs, ys, x):
+    """the value at x of the Newton form, computed with Fraction operations only"""
+    table = list(ys)
+    c_data = [table[0]]
+    for k in range(1, len(xs)):
+        table = [(table[i + 1] - table[i]) / (xs[i + k] - xs[i]) for i in range(len(table) - 1)]
+        c_data.append(table[0])
+
+    res = c_data[-1]
+    for i in range(len(c_data) - 2, -1, -1):
+        res = c_data[i] + (x - xs[i]) * res
+    return res
+
+
+class TestCommonDenominatorArray(unittest.TestCase):
+    def test_values(self):
+        values = [Fraction(1, 2), Fraction(-2, 3), Fraction(5), Fraction(7, 4), Fraction(0)]
+        array = CommonDenominatorArray()
+        for value in values:
+            array.append(value)
+
+        self.assertEqual(len(array), len(values))
+        self.assertEqual([array[i] for i in range(len(array))], values)
+        self.assertEqual(array.denominator, 12)
+        self.assertEqual(array.numerators, [6, -8, 60, 21, 0])
+
+    def test_truncate(self):
+        array = CommonDenominatorArray()
+        for value in (Fraction(1, 3), Fraction(1, 5), Fraction(2)):
+            array.append(value)
+
+        array.truncate(1)
+        array.append(Fraction(3, 5))
+        self.assertEqual([array[0], array[1]], [Fraction(1, 3), Fraction(3, 5)])
+
+
+class TestExactCompute(unittest.TestCase):
+    def test_same_as_fraction_arithmetic(self):
+        rng = Random(6)
+        xs = [Fraction(x, rng.randint(1, 30)) for x in rng.sample(range(-200, 200), 30)]
+        xs = list(dict.fromkeys(xs))
+        ys = [Fraction(rng.randint(-50, 50), rng.randint(1, 20)) for _ in xs]
+        inputs = [Fraction(rng.randint(-100, 100), rng.randint(1, 13)) for _ in range(10)]
+
+        for algorithm in Interpolator.MODES[:2]:
+            with self.subTest(algorithm=algorithm):
+                interpolator = Interpolator(algorithm)
+                for x, y in zip(xs, ys):
+                    interpolator.add(x, y)
+
+                for x in inputs + xs[:3]:
+                    self.assertEqual(interpolator.compute(x), newton_value(xs, ys, x))
+
+    def test_after_remove(self):
+        xs = [Fraction(0), Fraction(1, 3), Fraction(2, 7), Fraction(5, 2)]
+        ys = [Fraction(1), Fraction(2, 5), Fraction(-1), Fraction(3)]
+        interpolator = Interpolator()
+        for x, y in zip(xs, ys):
+            interpolator.add(x, y)
+        interpolator.compute(Fraction(1, 9))
+
+        interpolator.remove(xs[1])
+        interpolator.add(Fraction(4, 11), Fraction(7))
+        new_xs, new_ys = xs[:1] + xs[2:] + [Fraction(4, 11)], ys[:1] + ys[2:] + [Fraction(7)]
+        self.assertEqual(interpolator.compute(Fraction(1, 9)), newton_value(new_xs, new_ys, Fraction(1, 9)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from fractions import Fraction
+
+import numpy as np
+
+from lib.interpolate import Interpolator
+
+XS = [Fraction(0), Fraction(1, 2), Fraction(2), Fraction(-3), Fraction(7, 3)]
+YS = [Fraction(1), Fraction(-2), Fraction(5, 4), Fraction(3), Fraction(0)]
+INPUTS = [Fraction(1, 3), Fraction(-5, 2), Fraction(2), Fraction(10)]
+
+
+class TestComputeMany(unittest.TestCase):
+    def test_same_as_compute(self):
+        for algorithm in Interpolator.MODES[:2]:
+            with self.subTest(algorithm=algorithm):
+                interpolator = Interpolator(algorithm)
+                for x, y in zip(XS, YS):
+                    interpolator.add(x, y)
+
+                self.assertEqual(interpolator.compute_many(INPUTS), [interpolator.compute(x) for x in INPUTS])
+
+    def test_float64(self):
+        exact = Interpolator()
+        interpolator = Interpolator(Interpolator.MODES[0], Interpolator.BACKENDS[1])
+        for x, y in zip(XS, YS):
+            exact.add(x, y)
+            interpolator.add(x, y)
+
+        results = interpolator.compute_many(np.array([float(x) for x in INPUTS]))
+        self.assertIsInstance(results, np.ndarray)
+        np.testing.assert_allclose(results, [float(exact.compute(x)) for x in INPUTS], rtol=1e-12)
+
+    def test_empty(self):
+        self.assertEqual(Interpolator().compute_many(INPUTS), [0] * len(INPUTS))
+        np.testing.assert_array_equal(Interpolator(backend=Interpolator.BACKENDS[1]).compute_many([1.0, 2.0]),
+                                      [0.0, 0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from fractions import Fraction
+
+from lib.instrument import Instrumentation
+from lib.interpolate import Interpolator
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_wrap(self):
+        instrumentation = Instrumentation(count_operations=True)
+        add = instrumentation.wrap('add', lambda a, b: a + b)
+
+        self.assertEqual(add(Fraction(1, 2), Fraction(1, 3)), Fraction(5, 6))
+        self.assertEqual(add(1, 2), 3)
+
+        records = instrumentation.to_dict()['add']
+        self.assertEqual(records['calls'], 2)
+        # only the Fraction addition is counted
+        self.assertEqual(records['operations'], 1)
+        self.assertGreaterEqual(records['time'], 0)
+
+    def test_without_operations(self):
+        instrumentation = Instrumentation()
+        instrumentation.wrap('f', abs)(-1)
+        self.assertEqual(instrumentation.to_dict(), {'f': {'calls': 1, 'time': instrumentation.time['f']}})
+
+
+class TestInterpolatorInstrumentation(unittest.TestCase):
+    def test_records_and_restores(self):
+        interpolator = Interpolator()
+        instrumentation = Instrumentation()
+        interpolator.set_instrumentation(instrumentation)
+
+        interpolator.add(Fraction(0), Fraction(1))
+        interpolator.add_many([Fraction(1), Fraction(2)], [Fraction(2), Fraction(5)])
+        interpolator.compute(Fraction(3))
+
+        handlers = interpolator.stats()['handlers']
+        self.assertEqual(handlers['add']['calls'], 1)
+        self.assertEqual(handlers['add_many']['calls'], 1)
+        self.assertEqual(handlers['compute']['calls'], 1)
+
+        interpolator.set_instrumentation(None)
+        interpolator.compute(Fraction(4))
+        self.assertEqual(instrumentation.calls['compute'], 1)
+        self.assertNotIn('handlers', interpolator.stats())
+        self.assertNotIn('compute', vars(interpolator))
+
+    def test_stats_bits(self):
+        interpolator = Interpolator()
+        interpolator.add_many([Fraction(0), Fraction(1), Fraction(3)], [Fraction(0), Fraction(1), Fraction(0)])
+
+        stats = interpolator.stats()
+        # c = [0, 1, -1/3]
+        self.assertEqual((stats['points'], stats['c_numerator_bits'], stats['c_denominator_bits']), (3, 1, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
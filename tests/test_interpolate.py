@@ -0,0 +1,96 @@
+import unittest
+from fractions import Fraction
+
+import numpy as np
+
+from lib.instrument import Instrumentation
+from lib.interpolate import Interpolator
+
+
+class TestBarycentricFloat(unittest.TestCase):
+    def test_many_chebyshev_points(self):
+        # the weights of more than about 1000 Chebyshev points overflow without scaling
+        size = 1100
+        xs = np.cos((2 * np.arange(size) + 1) * np.pi / (2 * size))
+        interpolator = Interpolator(Interpolator.MODES[2], Interpolator.BACKENDS[1])
+        interpolator.add_many(xs, np.cos(3 * xs))
+
+        self.assertTrue(np.isfinite(interpolator.w_data).all())
+        for x in (0.3, -0.77, 0.999):
+            self.assertAlmostEqual(interpolator.compute(x), np.cos(3 * x), places=12)
+
+        points = np.array([-0.5, 0.1, xs[7]])
+        np.testing.assert_allclose(interpolator.approx_many(points), np.cos(3 * points), atol=1e-12)
+
+        interpolator.remove(xs[5])
+        self.assertAlmostEqual(interpolator.compute(0.3), np.cos(0.9), places=12)
+
+    def test_scaled_weights(self):
+        xs, ys = [0, 1, 3, 4, 7], [1, 2, 0, 5, 1]
+        interpolator = Interpolator(Interpolator.MODES[2], Interpolator.BACKENDS[1])
+        interpolator.add_many(xs, ys)
+        exact = Interpolator(Interpolator.MODES[2])
+        exact.add_many(xs, ys)
+
+        # the same weights up to a common factor
+        ratios = interpolator.w_data / np.array([float(w) for w in exact.w_data])
+        np.testing.assert_allclose(ratios, ratios[0])
+        self.assertAlmostEqual(interpolator.compute(2.5), float(exact.compute(Fraction(5, 2))), places=12)
+
+    def test_compute_many_at_nodes(self):
+        xs, ys = [3, -1, 0.5, 2, -4], [1, 2, 0, 5, 1]
+        interpolator = Interpolator(Interpolator.MODES[2], Interpolator.BACKENDS[1])
+        interpolator.add_many(xs, ys)
+
+        res = interpolator.compute_many(xs[::-1] + [1.25])
+        np.testing.assert_array_equal(res[:-1], ys[::-1])
+        self.assertAlmostEqual(res[-1], interpolator.compute(1.25), places=12)
+
+
+class TestBarycentricApproxMany(unittest.TestCase):
+    def test_exact_backends(self):
+        # the weights are about 10^-440, which is 0 in float64 without scaling
+        xs = [Fraction(i * 10 ** 40) for i in range(12)]
+        ys = [Fraction(i % 3, 7) for i in range(12)]
+        values = [Fraction(5, 2) * 10 ** 40, Fraction(10 ** 41 + 1), xs[4]]
+        for backend in (Interpolator.BACKENDS[0], Interpolator.BACKENDS[2]):
+            with self.subTest(backend=backend):
+                interpolator = Interpolator(Interpolator.MODES[2], backend, precision=30)
+                interpolator.add_many(xs, ys)
+
+                expected = [float(interpolator.compute(x)) for x in values]
+                np.testing.assert_allclose(interpolator.approx_many([float(x) for x in values]), expected,
+                                           rtol=1e-9)
+
+    def test_points_changed(self):
+        interpolator = Interpolator(Interpolator.MODES[2])
+        interpolator.add_many([Fraction(0), Fraction(1)], [Fraction(0), Fraction(1)])
+        np.testing.assert_allclose(interpolator.approx_many([0.5, 2]), [0.5, 2])
+
+        interpolator.add(Fraction(2), Fraction(4))
+        np.testing.assert_allclose(interpolator.approx_many([0.5, 2]), [0.25, 4])
+
+
+class TestApprox(unittest.TestCase):
+    def setUp(self):
+        self.interpolator = Interpolator()
+        self.interpolator.add_many([Fraction(0), Fraction(3), Fraction(7)], [Fraction(0), Fraction(1), Fraction(5)])
+        self.instrumentation = Instrumentation()
+        self.interpolator.set_instrumentation(self.instrumentation)
+
+    def test_filter_hit(self):
+        res, exact = self.interpolator.approx(Fraction(1, 3), 6, with_exact=True)
+        self.assertEqual((str(res), exact), ('0.0264550', None))
+        self.assertEqual(self.instrumentation.calls['compute'], 0)
+        self.assertEqual(self.interpolator.filter_hits, 1)
+
+    def test_filter_miss(self):
+        # the result is exactly 1, which ends with zero digits when it is rounded to 6 digits
+        res, exact = self.interpolator.approx(Fraction(3), 6, with_exact=True)
+        self.assertEqual((str(res), exact), ('1', 1))
+        self.assertEqual(self.instrumentation.calls['compute'], 1)
+        self.assertEqual(self.interpolator.filter_misses, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
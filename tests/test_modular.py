@@ -0,0 +1,65 @@
+import unittest
+from fractions import Fraction
+from random import Random
+
+from lib.interpolate import Interpolator
+from lib.modular import modular_divided_differences, primes
+
+
+def divided_differences(xs, ys):
+    """the c values and the last row of the points, with Fraction arithmetic"""
+    row, c_data, last_row = list(ys), [ys[0]], [ys[-1]]
+    for k in range(1, len(xs)):
+        row = [(row[i + 1] - row[i]) / (xs[i + k] - xs[i]) for i in range(len(row) - 1)]
+        c_data.append(row[0])
+        last_row.append(row[-1])
+    return c_data, last_row
+
+
+class TestModularDividedDifferences(unittest.TestCase):
+    def setUp(self):
+        random = Random(24)
+        self.xs = random.sample([Fraction(i, 7) for i in range(-500, 500)], 30)
+        self.ys = [Fraction(random.randint(-10 ** 9, 10 ** 9), random.randint(1, 10 ** 6)) for _ in self.xs]
+
+    def test_same_as_fraction_arithmetic(self):
+        c_data, last_row = divided_differences(self.xs, self.ys)
+        self.assertEqual(modular_divided_differences(self.xs, self.ys, last_row=True), (c_data, last_row))
+        self.assertEqual(modular_divided_differences(self.xs, self.ys, start=20), (c_data[20:], None))
+
+    def test_prime_divides_x_difference(self):
+        # the first prime that is used divides x_1 - x_0
+        largest_prime = primes(1)[0]
+        xs = [Fraction(0), Fraction(largest_prime), Fraction(1, 3), Fraction(-2)]
+        ys = [Fraction(1), Fraction(-5), Fraction(2, 9), Fraction(7)]
+        self.assertEqual(modular_divided_differences(xs, ys, last_row=True), divided_differences(xs, ys))
+
+    def test_empty(self):
+        self.assertEqual(modular_divided_differences([], [], last_row=True), ([], []))
+
+
+class TestModularEngine(unittest.TestCase):
+    def test_same_as_rational_engine(self):
+        random = Random(24)
+        xs = random.sample([Fraction(i, 5) for i in range(-200, 200)], 40)
+        ys = [Fraction(random.randint(-1000, 1000), random.randint(1, 50)) for _ in xs]
+
+        for algorithm in Interpolator.MODES[:2]:
+            with self.subTest(algorithm=algorithm):
+                rational, modular = Interpolator(algorithm), Interpolator(algorithm)
+                rational.add_many(xs, ys)
+                # in two parts, so only the new c values are kept the second time
+                modular.add_many(xs[:25], ys[:25], engine=Interpolator.ENGINES[1])
+                modular.add_many(xs[25:], ys[25:], engine=Interpolator.ENGINES[1])
+
+                self.assertEqual(modular.c_data, rational.c_data)
+                if algorithm == Interpolator.MODES[1]:
+                    self.assertEqual(modular.in_c_data, rational.in_c_data)
+
+                modular.add(Fraction(1000), Fraction(1))
+                rational.add(Fraction(1000), Fraction(1))
+                self.assertEqual(modular.compute(Fraction(1, 3)), rational.compute(Fraction(1, 3)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+from fractions import Fraction
+from random import Random
+
+from lib.interpolate import Interpolator
+from lib.multipoint import evaluate_many, multiply, newton_to_power_basis
+
+
+def horner(polynomial, z):
+    res = 0
+    for coefficient in reversed(polynomial):
+        res = res * z + coefficient
+    return res
+
+
+class TestPolynomials(unittest.TestCase):
+    def setUp(self):
+        self.random = Random(23)
+
+    def test_multiply(self):
+        for size_a, size_b in ((1, 1), (3, 20), (40, 37)):
+            with self.subTest(sizes=(size_a, size_b)):
+                a = [self.random.randint(-10 ** 30, 10 ** 30) for _ in range(size_a)]
+                b = [self.random.randint(-10 ** 30, 10 ** 30) for _ in range(size_b)]
+                expected = [0] * (size_a + size_b - 1)
+                for i, value_a in enumerate(a):
+                    for j, value_b in enumerate(b):
+                        expected[i + j] += value_a * value_b
+                self.assertEqual(multiply(a, b), expected)
+
+    def test_evaluate_many(self):
+        polynomial = [self.random.randint(-10 ** 6, 10 ** 6) for _ in range(50)]
+        points = [self.random.randint(-1000, 1000) for _ in range(70)]
+        self.assertEqual(evaluate_many(polynomial, points), [horner(polynomial, z) for z in points])
+
+    def test_newton_to_power_basis(self):
+        nodes = [self.random.randint(-50, 50) for _ in range(30)]
+        coefficients = [self.random.randint(-50, 50) for _ in range(30)]
+        polynomial = newton_to_power_basis(nodes, coefficients)
+
+        for z in (-3, 0, 7):
+            expected, product = 0, 1
+            for node, coefficient in zip(nodes, coefficients):
+                expected += coefficient * product
+                product *= z - node
+            self.assertEqual(horner(polynomial, z), expected)
+
+
+class TestComputeManyExact(unittest.TestCase):
+    def setUp(self):
+        # the subproduct tree is used for any number of points and values
+        for name in ('MULTIPOINT_MIN_BATCH', 'MULTIPOINT_MIN_SIZE'):
+            self.addCleanup(setattr, Interpolator, name, getattr(Interpolator, name))
+            setattr(Interpolator, name, 0)
+
+        random = Random(23)
+        self.xs = random.sample([Fraction(i, 3) for i in range(-100, 100)], 40)
+        self.ys = [Fraction(random.randint(-100, 100), random.randint(1, 9)) for _ in self.xs]
+        self.inputs = [Fraction(random.randint(-300, 300), random.choice((1, 2, 5))) for _ in range(60)]
+
+    def test_same_as_compute(self):
+        for algorithm in Interpolator.MODES[:3]:
+            with self.subTest(algorithm=algorithm):
+                interpolator = Interpolator(algorithm)
+                interpolator.add_many(self.xs[:30], self.ys[:30])
+                expected = [interpolator.compute(x) for x in self.inputs]
+                self.assertEqual(interpolator.compute_many_exact(self.inputs), expected)
+
+                # the cached polynomial is updated with the new points
+                interpolator.add_many(self.xs[30:], self.ys[30:])
+                expected = [interpolator.compute(x) for x in self.inputs]
+                self.assertEqual(interpolator.compute_many(self.inputs), expected)
+
+    def test_large_denominator(self):
+        interpolator = Interpolator()
+        interpolator.add_many(self.xs, self.ys)
+        inputs = [Fraction(1, 2 ** 70 + 1), Fraction(3, 7)]
+        self.assertEqual(interpolator.compute_many_exact(inputs), [interpolator.compute(x) for x in inputs])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from fractions import Fraction
+
+import numpy as np
+
+from lib.interpolate import Interpolator
+from lib.multiseries import MultiSeriesInterpolator
+
+XS = [Fraction(0), Fraction(1, 2), Fraction(2), Fraction(-3), Fraction(5, 3)]
+ROWS = [[Fraction(1), Fraction(0)], [Fraction(2), Fraction(-1, 3)], [Fraction(0), Fraction(4)],
+        [Fraction(7, 2), Fraction(1)], [Fraction(-1), Fraction(2)]]
+INPUTS = [Fraction(1), Fraction(-7, 4), Fraction(10)]
+
+
+def separate_results(backend):
+    """the results of an Interpolator for each series, a row for each input"""
+    columns = []
+    for j in range(len(ROWS[0])):
+        interpolator = Interpolator(backend=backend)
+        interpolator.add_many(XS, [row[j] for row in ROWS])
+        columns.append([interpolator.compute(x) for x in INPUTS])
+    return [list(row) for row in zip(*columns)]
+
+
+class TestMultiSeriesInterpolator(unittest.TestCase):
+    def test_same_as_separate_series(self):
+        interpolator = MultiSeriesInterpolator(2)
+        interpolator.add(XS[0], ROWS[0])
+        interpolator.add_many(XS[1:], ROWS[1:])
+
+        expected = separate_results(Interpolator.BACKENDS[0])
+        self.assertEqual([interpolator.compute(x) for x in INPUTS], expected)
+        self.assertEqual(interpolator.compute_many(INPUTS), expected)
+
+    def test_float64(self):
+        interpolator = MultiSeriesInterpolator(2, MultiSeriesInterpolator.BACKENDS[1])
+        interpolator.add(XS[0], ROWS[0])
+        interpolator.add_many(XS[1:], ROWS[1:])
+
+        expected = np.array(separate_results(Interpolator.BACKENDS[0]), dtype=np.float64)
+        self.assertTrue(np.allclose(interpolator.compute_many(INPUTS), expected))
+        self.assertTrue(np.allclose(interpolator.compute(INPUTS[1]), expected[1]))
+
+    def test_float64_add_many_same_as_add(self):
+        # more points than the initial capacity of the buffers, added in two batches and one by one
+        rng = np.random.default_rng(2020)
+        xs = rng.permutation(40) / 7
+        ys_rows = rng.random((40, 3))
+
+        batches = MultiSeriesInterpolator(3, MultiSeriesInterpolator.BACKENDS[1])
+        batches.add_many(xs[:25], ys_rows[:25])
+        batches.add_many(xs[25:], ys_rows[25:])
+        single = MultiSeriesInterpolator(3, MultiSeriesInterpolator.BACKENDS[1])
+        for x, ys in zip(xs, ys_rows):
+            single.add(x, ys)
+
+        self.assertEqual(batches.size(), 40)
+        np.testing.assert_array_equal(batches.x_data, xs)
+        np.testing.assert_array_equal(batches.y_data, ys_rows)
+        np.testing.assert_array_equal(batches.c_data, single.c_data)
+        np.testing.assert_array_equal(batches.in_c_data, single.in_c_data)
+
+    def test_wrong_points(self):
+        for backend in MultiSeriesInterpolator.BACKENDS:
+            with self.subTest(backend=backend):
+                interpolator = MultiSeriesInterpolator(2, backend)
+                interpolator.add(1, [1, 2])
+
+                with self.assertRaises(ValueError):
+                    interpolator.add(2, [1])
+                with self.assertRaises(ArithmeticError):
+                    interpolator.add_many([3, 1], [[0, 0], [0, 0]])
+                with self.assertRaises(ValueError):
+                    interpolator.add_many([3, 4], [[0, 0], [0]])
+                # nothing is added when one of the points is wrong
+                self.assertEqual(interpolator.size(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
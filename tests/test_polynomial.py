@@ -0,0 +1,58 @@
+import unittest
+from fractions import Fraction
+
+import numpy as np
+
+from lib.interpolate import Interpolator
+
+
+class TestPolynomial(unittest.TestCase):
+    def test_coefficients(self):
+        # 2x^3 - x + 1/2
+        xs = [Fraction(-1), Fraction(0), Fraction(1, 2), Fraction(3)]
+        interpolator = Interpolator()
+        for x in xs:
+            interpolator.add(x, 2 * x ** 3 - x + Fraction(1, 2))
+
+        self.assertEqual(interpolator.to_polynomial(), [Fraction(1, 2), -1, 0, 2])
+        self.assertEqual(interpolator.expanded_str(), '2x^3 - 1x + 1/2')
+
+    def test_extended_and_invalidated(self):
+        interpolator = Interpolator(Interpolator.MODES[1])
+        for x, y in ((0, 1), (1, 3), (2, 7)):
+            interpolator.add(x, y)
+        # x^2 + x + 1
+        self.assertEqual(interpolator.to_polynomial(), [1, 1, 1])
+
+        # the new term x(x - 1)(x - 2) is added to the cached coefficients
+        interpolator.add(3, 19)
+        self.assertEqual(interpolator.to_polynomial(), [1, 3, -2, 1])
+
+        # and they are built again when c_data changes
+        interpolator.update(3, 13)
+        self.assertEqual(interpolator.to_polynomial(), [1, 1, 1, 0])
+        interpolator.remove(2)
+        self.assertEqual(interpolator.to_polynomial(), [1, 1, 1])
+
+    def test_compute_with_coefficients(self):
+        xs = [Fraction(x, 7) for x in range(-5, 6)]
+        ys = [Fraction((x * 37) % 11 - 5, 3) for x in range(-5, 6)]
+        interpolator = Interpolator()
+        for x, y in zip(xs, ys):
+            interpolator.add(x, y)
+        newton_values = [interpolator.compute(Fraction(k, 5)) for k in range(-4, 5)]
+
+        interpolator.to_polynomial()
+        self.assertEqual([interpolator.compute(Fraction(k, 5)) for k in range(-4, 5)], newton_values)
+        self.assertEqual([interpolator.compute(x) for x in xs], ys)
+
+    def test_float64(self):
+        interpolator = Interpolator(Interpolator.MODES[0], Interpolator.BACKENDS[1])
+        for x, y in ((0, 1), (1, 3), (2, 7), (3, 13)):
+            interpolator.add(x, y)
+
+        np.testing.assert_allclose(interpolator.to_polynomial(), [1, 1, 1, 0], atol=1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from fractions import Fraction
+
+from lib.interpolate import Interpolator
+from lib.snapshot import FORMAT_VERSION, MAGIC, _U16, load_state, save_state
+from support import temporary_path
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.filename = temporary_path(self, 'state.bin')
+
+    def test_save_and_load(self):
+        for backend in Interpolator.BACKENDS:
+            with self.subTest(backend=backend):
+                interpolator = Interpolator(Interpolator.MODES[1], backend)
+                interpolator.add_many([Fraction(1), Fraction(2), Fraction(3)], [Fraction(1), Fraction(4), Fraction(9)])
+                save_state(interpolator, self.filename)
+
+                loaded = load_state(self.filename)
+                self.assertEqual(loaded.backend, backend)
+                self.assertEqual(list(loaded.c_data), list(interpolator.c_data))
+                self.assertEqual(loaded.compute(Fraction(5, 2)), interpolator.compute(Fraction(5, 2)))
+
+    def test_all_algorithms(self):
+        xs = [Fraction(1), Fraction(-2), Fraction(5, 2), Fraction(4)]
+        ys = [Fraction(1), Fraction(3), Fraction(0), Fraction(2)]
+        for algorithm in Interpolator.MODES:
+            for backend in Interpolator.BACKENDS:
+                with self.subTest(algorithm=algorithm, backend=backend):
+                    interpolator = Interpolator(algorithm, backend)
+                    interpolator.add_many(xs, ys)
+                    save_state(interpolator, self.filename)
+
+                    loaded = load_state(self.filename)
+                    self.assertEqual(loaded.compute(Fraction(1, 3)), interpolator.compute(Fraction(1, 3)))
+                    loaded.add(Fraction(7), Fraction(-1))
+                    interpolator.add(Fraction(7), Fraction(-1))
+                    self.assertEqual(loaded.compute(Fraction(6)), interpolator.compute(Fraction(6)))
+                    self.assertEqual(list(loaded.y_data), list(interpolator.y_data))
+
+    def test_decoded_when_used(self):
+        interpolator = Interpolator(Interpolator.MODES[1])
+        interpolator.add_many([Fraction(1), Fraction(2), Fraction(3)], [Fraction(1), Fraction(4), Fraction(9)])
+        save_state(interpolator, self.filename)
+
+        loaded = load_state(self.filename)
+        self.assertEqual(loaded.compute(Fraction(5, 2)), Fraction(25, 4))
+        # compute does not need y_data and in_c_data
+        self.assertNotIn('y_data', vars(loaded))
+        self.assertNotIn('in_c_data', vars(loaded))
+        self.assertIn('in_c_data', dir(loaded))
+
+        self.assertEqual(loaded.y_data, [Fraction(1), Fraction(4), Fraction(9)])
+        self.assertIn('y_data', vars(loaded))
+
+    def test_other_versions(self):
+        save_state(Interpolator(), self.filename)
+        with open(self.filename, 'rb') as f:
+            data = f.read()
+
+        for version in (FORMAT_VERSION - 1, FORMAT_VERSION + 1):
+            with self.subTest(version=version):
+                with open(self.filename, 'wb') as f:
+                    f.write(MAGIC + _U16.pack(version) + data[len(MAGIC) + _U16.size:])
+
+                with self.assertRaisesRegex(ValueError, f'version {version} is not supported'):
+                    load_state(self.filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from fractions import Fraction
+
+import numpy as np
+
+from lib.spline import CubicSpline
+
+XS = [Fraction(0), Fraction(1), Fraction(3), Fraction(4), Fraction(7)]
+YS = [Fraction(2), Fraction(-1), Fraction(5), Fraction(1, 2), Fraction(3)]
+
+
+def end_derivatives(spline):
+    """the first and second derivatives of the spline at its first and last knots"""
+    _, _, (_, first_b, first_c, _) = spline.pieces()[0]
+    start, end, (_, b, c, d) = spline.pieces()[-1]
+    h = end - start
+    return (first_b, 2 * first_c), (b + h * (2 * c + 3 * h * d), 2 * c + 6 * h * d)
+
+
+class TestCubicSpline(unittest.TestCase):
+    def test_passes_through_knots(self):
+        for slopes in (None, (Fraction(1), Fraction(-2))):
+            with self.subTest(slopes=slopes):
+                spline = CubicSpline(slopes)
+                spline.insert_many(XS, YS)
+                self.assertEqual([spline.compute(x) for x in XS], YS)
+
+    def test_natural_boundary(self):
+        spline = CubicSpline()
+        # the order of insertion does not matter
+        for x, y in reversed(list(zip(XS, YS))):
+            spline.insert(x, y)
+
+        (_, first_second), (_, last_second) = end_derivatives(spline)
+        self.assertEqual((first_second, last_second), (0, 0))
+
+    def test_clamped_boundary(self):
+        spline = CubicSpline((Fraction(1), Fraction(-2)))
+        spline.insert_many(XS, YS)
+
+        (first_slope, _), (last_slope, _) = end_derivatives(spline)
+        self.assertEqual((first_slope, last_slope), (1, -2))
+
+    def test_continuous_second_derivative(self):
+        spline = CubicSpline()
+        spline.insert_many(XS, YS)
+
+        pieces = spline.pieces()
+        for (start, end, (_, _, c, d)), (_, _, (_, _, next_c, _)) in zip(pieces, pieces[1:]):
+            self.assertEqual(2 * c + 6 * (end - start) * d, 2 * next_c)
+
+    def test_changes(self):
+        spline = CubicSpline()
+        spline.insert_many(XS, YS)
+        spline.update(Fraction(3), Fraction(0))
+        spline.remove(Fraction(4))
+        self.assertEqual(spline.compute(Fraction(3)), 0)
+        self.assertEqual(spline.size(), 4)
+
+        with self.assertRaises(ZeroDivisionError):
+            spline.insert(Fraction(1), Fraction(0))
+        with self.assertRaises(ValueError):
+            spline.remove(Fraction(4))
+
+    def test_compute_many_float(self):
+        spline = CubicSpline()
+        spline.insert_many(XS, YS)
+        inputs = np.array([-1, 0.5, 2, 3.5, 8])
+        expected = [float(spline.compute(Fraction(x))) for x in inputs]
+        self.assertTrue(np.allclose(spline.compute_many(inputs), expected))
+
+
+if __name__ == '__main__':
+    unittest.main()